@@ -1,18 +1,17 @@
 """The Home Energy integration."""
 from __future__ import annotations
 
-import json
 import logging
 import os
-import time
+from contextlib import suppress
 
 from datetime import datetime, timedelta
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.components import frontend, panel_custom
-from homeassistant.components.http import StaticPathConfig
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.loader import async_get_integration
 
 from .const import (
     DOMAIN,
@@ -23,18 +22,30 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Path to our panel JS files
+_FRONTEND_PATH = os.path.join(os.path.dirname(__file__), "frontend")
+_PANEL_STATIC_URL = f"/{DOMAIN}_panel"
+_STATIC_REGISTERED_KEY = f"{DOMAIN}_static_registered"
+# [StaticPathConfig] for the panel files; built on first registration (lazy http import)
+_STATIC_PATHS: list | None = None
+
+# (option key, frontend url path, web component / JS module name, sidebar title, sidebar icon)
+_PANELS = (
+    ("enable_energy", ENERGY_PANEL_URL, "energy-panel", ENERGY_PANEL_TITLE, ENERGY_PANEL_ICON),
+)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Smart Dashboards from a config entry."""
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN]["entry_id"] = entry.entry_id
-    hass.data[DOMAIN]["options"] = dict(entry.options or {})
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    domain_data["entry_id"] = entry.entry_id
+    domain_data["options"] = entry.options or {}
 
     # Initialize config manager
     from .config_manager import ConfigManager
     config_manager = ConfigManager(hass)
     await config_manager.async_load()
-    hass.data[DOMAIN]["config_manager"] = config_manager
+    domain_data["config_manager"] = config_manager
 
     # Register WebSocket API
     from .websocket import async_setup as async_setup_websocket
@@ -50,22 +61,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Start background statistics cache primer for instant page loads
     from .websocket import async_register_statistics_cache_primer
-    hass.data[DOMAIN]["statistics_primer_unsub"] = await async_register_statistics_cache_primer(hass)
+    domain_data["statistics_primer_unsub"] = await async_register_statistics_cache_primer(hass)
 
     # Room efficiency ratings: hourly recompute + JSON under config/data
     from .room_ratings import ratings_payload_for_ws, recompute_room_ratings
 
-    cm_ratings = hass.data[DOMAIN]["config_manager"]
-
     def _room_ratings_run_sync() -> None:
-        full = recompute_room_ratings(hass, cm_ratings, persist=True)
-        hass.data[DOMAIN]["room_ratings_cache"] = ratings_payload_for_ws(full)
+        full = recompute_room_ratings(hass, config_manager, persist=True)
+        domain_data["room_ratings_cache"] = ratings_payload_for_ws(full)
 
     async def _room_ratings_tick(_now: datetime) -> None:
         await hass.async_add_executor_job(_room_ratings_run_sync)
 
     await hass.async_add_executor_job(_room_ratings_run_sync)
-    hass.data[DOMAIN]["room_ratings_unsub"] = async_track_time_interval(
+    domain_data["room_ratings_unsub"] = async_track_time_interval(
         hass, _room_ratings_tick, timedelta(hours=1)
     )
 
@@ -73,6 +82,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     await async_setup_efficiency_digest(hass)
 
+    # HA does not unload entries on shutdown; flush debounced/periodic state ourselves
+    async def _async_final_write(_event: Event) -> None:
+        await config_manager.async_save_persistent_data()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_FINAL_WRITE, _async_final_write)
+    )
+
     # Listen for options updates
     entry.async_on_unload(entry.add_update_listener(async_options_update_listener))
 
@@ -81,29 +98,42 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_options_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update - re-register panels."""
-    # Update stored options
-    if DOMAIN in hass.data:
-        hass.data[DOMAIN]["options"] = dict(entry.options or {})
+    new_options = entry.options or {}
+    domain_data = hass.data.get(DOMAIN)
+    if domain_data is not None:
+        old_options = domain_data.get("options") or {}
+        # Saving the form without changes must not tear down the whole integration
+        if old_options == new_options:
+            return
+        # Only enable_energy gates the energy monitor; the passcode is read live
+        # from hass.data, so other edits just need the stored options and panels refreshed
+        if old_options.get("enable_energy", True) == new_options.get("enable_energy", True):
+            domain_data["options"] = new_options
+            await async_register_panels(hass, entry)
+            return
+    # async_setup_entry stores the new options on reload
     await hass.config_entries.async_reload(entry.entry_id)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    domain_data = hass.data.get(DOMAIN) or {}
+
     # Unsubscribe statistics cache primer (prevents stacking timers on reload)
-    stats_primer_unsub = hass.data.get(DOMAIN, {}).get("statistics_primer_unsub")
+    stats_primer_unsub = domain_data.get("statistics_primer_unsub")
     if callable(stats_primer_unsub):
         stats_primer_unsub()
 
-    ratings_unsub = hass.data.get(DOMAIN, {}).get("room_ratings_unsub")
+    ratings_unsub = domain_data.get("room_ratings_unsub")
     if ratings_unsub:
         ratings_unsub()
 
-    digest_unsub = hass.data.get(DOMAIN, {}).get("efficiency_digest_unsub")
+    digest_unsub = domain_data.get("efficiency_digest_unsub")
     if callable(digest_unsub):
         digest_unsub()
 
     # Stop energy monitor (unregister listeners, cancel task)
-    energy_monitor = hass.data.get(DOMAIN, {}).get("energy_monitor")
+    energy_monitor = domain_data.get("energy_monitor")
     if energy_monitor:
         await energy_monitor.async_stop()
 
@@ -112,15 +142,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await async_reset_tts_queue()
 
     # Persist energy and tracking data before cleanup (survives reload/restart)
-    config_manager = hass.data.get(DOMAIN, {}).get("config_manager")
+    config_manager = domain_data.get("config_manager")
     if config_manager:
         await config_manager.async_save_persistent_data()
 
-    # Remove panel (only if it was registered)
-    try:
-        frontend.async_remove_panel(hass, ENERGY_PANEL_URL)
-    except KeyError:
-        pass
+    # Remove panels (only if they were registered)
+    for _option, url_path, *_ in _PANELS:
+        _async_remove_panel(hass, url_path)
 
     # Clean up data
     hass.data.pop(DOMAIN, None)
@@ -130,49 +158,53 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_register_panels(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Register the sidebar panels based on user options."""
-    enable_energy = entry.options.get("enable_energy", True)
-
-    # Get the path to our panel JS files
-    frontend_path = os.path.join(os.path.dirname(__file__), "frontend")
-    panel_url = f"/{DOMAIN}_panel"
-
-    # Read version from manifest for cache-busting (run in executor to avoid blocking event loop)
-    def _read_manifest_version() -> str:
-        manifest_path = os.path.join(os.path.dirname(__file__), "manifest.json")
-        try:
-            with open(manifest_path, encoding="utf-8") as f:
-                return json.load(f).get("version", "1.0.0")
-        except Exception:
-            return "1.0.0"
-
-    version = await hass.async_add_executor_job(_read_manifest_version)
-
-    # Unique cache-bust per load so browser never serves cached dashboard JS
-    load_id = str(int(time.time() * 1000))
-
-    # Register static path for the panel files
-    await hass.http.async_register_static_paths([
-        StaticPathConfig(panel_url, frontend_path, cache_headers=False)
-    ])
-
-    # Register Energy Panel (if enabled)
-    if enable_energy:
-        if ENERGY_PANEL_URL not in hass.data.get("frontend_panels", {}):
-            await panel_custom.async_register_panel(
-                hass,
-                webcomponent_name="energy-panel",
-                frontend_url_path=ENERGY_PANEL_URL,
-                sidebar_title=ENERGY_PANEL_TITLE,
-                sidebar_icon=ENERGY_PANEL_ICON,
-                module_url=f"{panel_url}/energy-panel.js?v={version}&_={load_id}",
-                embed_iframe=False,
-                require_admin=False,
-            )
-            _LOGGER.info("Registered Energy panel")
-    else:
-        # Remove panel if it was previously registered
-        try:
-            frontend.async_remove_panel(hass, ENERGY_PANEL_URL)
-            _LOGGER.info("Removed Energy panel (disabled)")
-        except KeyError:
-            pass
+    global _STATIC_PATHS
+
+    from homeassistant.components import panel_custom
+
+    # Version for cache-busting (URL changes only when the integration is upgraded);
+    # HA has already parsed and cached our manifest.json
+    integration = await async_get_integration(hass, DOMAIN)
+    version = str(integration.version or "1.0.0")
+
+    # Register static path for the panel files once per HA run; the route outlives
+    # entry reloads, so the flag lives outside hass.data[DOMAIN] (popped on unload)
+    if not hass.data.get(_STATIC_REGISTERED_KEY):
+        if _STATIC_PATHS is None:
+            from homeassistant.components.http import StaticPathConfig
+
+            _STATIC_PATHS = [
+                StaticPathConfig(_PANEL_STATIC_URL, _FRONTEND_PATH, cache_headers=False)
+            ]
+        await hass.http.async_register_static_paths(_STATIC_PATHS)
+        hass.data[_STATIC_REGISTERED_KEY] = True
+
+    registered = hass.data.get("frontend_panels") or {}
+    for option, url_path, component, title, icon in _PANELS:
+        if entry.options.get(option, True):
+            if url_path not in registered:
+                await panel_custom.async_register_panel(
+                    hass,
+                    webcomponent_name=component,
+                    frontend_url_path=url_path,
+                    sidebar_title=title,
+                    sidebar_icon=icon,
+                    module_url=f"{_PANEL_STATIC_URL}/{component}.js?v={version}",
+                    embed_iframe=False,
+                    require_admin=False,
+                )
+                _LOGGER.info("Registered %s panel", title)
+        else:
+            # Remove panel if it was previously registered
+            if _async_remove_panel(hass, url_path):
+                _LOGGER.info("Removed %s panel (disabled)", title)
+
+
+def _async_remove_panel(hass: HomeAssistant, url_path: str) -> bool:
+    """Remove a sidebar panel; return False if it was not registered."""
+    from homeassistant.components import frontend
+
+    with suppress(KeyError):
+        frontend.async_remove_panel(hass, url_path)
+        return True
+    return False
@@ -1,6 +1,7 @@
 """Config flow for Home Energy integration."""
 from __future__ import annotations
 
+import re
 from typing import Any
 
 import voluptuous as vol
@@ -12,6 +13,19 @@ from .const import DOMAIN, NAME
 
 _LOGGER = logging.getLogger(__name__)
 
+# Built once; reconfigure pre-fills the current passcode via suggested values
+_PASSCODE_SCHEMA = vol.Schema({
+    vol.Required("settings_passcode"): str,
+})
+
+# ASCII digits only; str.isdigit() would also accept other Unicode digits
+_PASSCODE_RE = re.compile(r"[0-9]{4}")
+
+
+def _valid_passcode(passcode: str) -> bool:
+    """Return True if passcode is exactly four ASCII digits."""
+    return len(passcode) == 4 and _PASSCODE_RE.fullmatch(passcode) is not None
+
 
 class SmartDashboardsConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Home Energy."""
@@ -29,7 +43,7 @@ class SmartDashboardsConfigFlow(ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             passcode = str(user_input.get("settings_passcode", ""))
-            if not passcode.isdigit() or len(passcode) != 4:
+            if not _valid_passcode(passcode):
                 errors["settings_passcode"] = "invalid_passcode"
             else:
                 return self.async_create_entry(
@@ -43,9 +57,7 @@ class SmartDashboardsConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema({
-                vol.Required("settings_passcode"): str,
-            }),
+            data_schema=_PASSCODE_SCHEMA,
             errors=errors,
         )
 
@@ -58,7 +70,7 @@ class SmartDashboardsConfigFlow(ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             passcode = str(user_input.get("settings_passcode", ""))
-            if not passcode.isdigit() or len(passcode) != 4:
+            if not _valid_passcode(passcode):
                 errors["settings_passcode"] = "invalid_passcode"
             else:
                 return self.async_update_reload_and_abort(
@@ -69,8 +81,8 @@ class SmartDashboardsConfigFlow(ConfigFlow, domain=DOMAIN):
         current = entry.options.get("settings_passcode", "") if entry else ""
         return self.async_show_form(
             step_id="reconfigure",
-            data_schema=vol.Schema({
-                vol.Required("settings_passcode", default=current): str,
-            }),
+            data_schema=self.add_suggested_values_to_schema(
+                _PASSCODE_SCHEMA, {"settings_passcode": current}
+            ),
             errors=errors,
         )
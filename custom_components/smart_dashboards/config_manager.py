@@ -1,22 +1,107 @@
 """Configuration manager for Smart Dashboards."""
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import heapq
 import json
 import logging
 import math
 import os
 import re
-from copy import deepcopy
-from datetime import datetime, timedelta, time as dt_time
-from typing import Any
-
-from homeassistant.core import HomeAssistant
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import suppress
+from datetime import date, datetime, timedelta, time as dt_time
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
+
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.util import dt as dt_util
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .const import CONFIG_FILE, DEFAULT_CONFIG, DOMAIN, DEFAULT_TTS_VOLUME
 
 _LOGGER = logging.getLogger(__name__)
 
+# Watt-seconds -> watt-hours
+_WS_TO_WH = 1.0 / 3600.0
+
+# Seconds to coalesce event-count increments (warning/shutoff storms) into one write
+_EVENT_COUNTS_SAVE_DELAY = 5.0
+
+# Seconds to coalesce back-to-back config edits from the panel into one write
+_CONFIG_SAVE_DELAY = 0.25
+
+# Seconds to coalesce enforcement state changes (warnings, phases, alerts) into one write
+_ENFORCEMENT_SAVE_DELAY = 0.5
+
+# Seconds to coalesce event log entries (and their archive day) into one write
+_EVENT_LOG_SAVE_DELAY = 0.5
+
+# Keys persisted in event_counts.json besides last_reset_date
+_EVENT_COUNT_KEYS = (
+    "total_warnings",
+    "total_shutoffs",
+    "total_power_cycles",
+    "room_warnings",
+    "room_shutoffs",
+    "room_power_cycles",
+)
+
+# Minute buckets kept per entity for the 24-hour charts
+_INTRADAY_MAX_POINTS = 1440
+
+# End-of-day snapshots kept in daily_totals.json
+_DAILY_TOTALS_MAX_DAYS = 45
+
+# Machine-only data files written without indentation (indenting a list of
+# [minute, watts] pairs more than doubles the intraday file; the event log and
+# its up-to-120-day archive are rewritten on every event burst)
+_COMPACT_JSON_FILES = frozenset(
+    {"intraday_history.json", "event_log.json", "event_archive.json"}
+)
+
+# Data files that change on nearly every save; comparing them with the last
+# write rarely skips anything, so they are always written
+_ALWAYS_WRITE_JSON_FILES = frozenset({"intraday_history.json"})
+
+# Sort key of an enforcement warning entry: (epoch seconds, watts)
+_warning_ts = itemgetter(0)
+
+
+def _epoch_warnings(warnings: list) -> list[tuple[float, Any]]:
+    """Loaded enforcement warnings as (epoch seconds, watts); older files stored ISO strings."""
+    result = []
+    for entry in warnings:
+        try:
+            ts, watts = entry
+            if isinstance(ts, str):
+                ts = datetime.fromisoformat(ts).timestamp()
+            result.append((float(ts), watts))
+        except (ValueError, TypeError):
+            continue
+    return result
+
+
+def _event_ts(e: dict[str, Any]) -> str:
+    """Sort key of an event log / archive entry (archive day buckets are kept in this order)."""
+    return str(e.get("ts") or "")
+
+
+@lru_cache(maxsize=512)
+def _slugify(name: str) -> str:
+    """Room/outlet/breaker id slug from a display name (names repeat every tick, so cached)."""
+    return name.lower().replace(" ", "_")
+
 
 def outdoor_temperature_from_entity(hass: HomeAssistant, entity_id: str | None) -> float | None:
     """Current outdoor temperature from weather.* (attribute) or sensor.* (state)."""
@@ -137,7 +222,7 @@ def _normalize_room_kwh_intervals(raw: Any) -> list[int | float]:
     if isinstance(raw, list):
         items: list[Any] = list(raw)
     elif isinstance(raw, str):
-        items = [p.strip() for p in raw.split(",") if p.strip()]
+        items = [p for p in map(str.strip, raw.split(",")) if p]
     else:
         return list(_ROOM_KWH_INTERVALS_DEFAULT)
 
@@ -170,6 +255,17 @@ def _room_kwh_alert_threshold_key(x: Any) -> float:
     return round(float(x), 4)
 
 
+def _kwh_alert_keys(values: Any) -> set[float]:
+    """Loaded kwh_alerts_sent as a set of threshold keys (unparseable entries dropped)."""
+    keys: set[float] = set()
+    for x in values or ():
+        try:
+            keys.add(_room_kwh_alert_threshold_key(x))
+        except (TypeError, ValueError):
+            continue
+    return keys
+
+
 def _normalize_budget_boost_weekdays(raw: Any) -> list[int]:
     """Unique weekdays Monday=0..Sunday=6."""
     if not isinstance(raw, list):
@@ -229,7 +325,7 @@ def _normalize_room_budget_boost_changed_at(raw: Any) -> str | None:
 
 def _validate_budget_boost_announce_time(raw: Any, default: str) -> str:
     s = (str(raw).strip() if raw is not None else "") or default
-    m = re.match(r"^(\d{1,2}):(\d{2})$", s)
+    m = _HHMM_PATTERN.match(s)
     if not m:
         return default
     h, mi = int(m.group(1)), int(m.group(2))
@@ -260,12 +356,13 @@ def _load_json_file(path: str) -> dict | None:
     if not os.path.exists(path):
         return None
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson else json.loads(raw)
     except (json.JSONDecodeError, ValueError) as e:
         _LOGGER.error("Corrupt JSON at %s (%s); backing up and ignoring.", path, e)
         try:
-            backup = f"{path}.corrupt.{int(__import__('time').time())}"
+            backup = f"{path}.corrupt.{int(time.time())}"
             os.replace(path, backup)
             _LOGGER.warning("Moved corrupt file to %s", backup)
         except OSError:
@@ -276,6 +373,81 @@ def _load_json_file(path: str) -> dict | None:
         return None
 
 
+def _load_json_files(paths: list[str]) -> list[dict | None]:
+    """Load several JSON files in one executor job (same semantics as _load_json_file)."""
+    return [_load_json_file(path) for path in paths]
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize containers neither JSON encoder handles natively (intraday deques, alert sets)."""
+    if isinstance(obj, deque):
+        return list(obj)
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps_json(data: Any, indent: bool = True) -> bytes:
+    """Serialize data to JSON bytes, indented unless asked not to (orjson when available)."""
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, default=_json_default, option=option)
+        except TypeError:
+            # e.g. ints beyond 64 bits; stdlib json handles these
+            pass
+    if indent:
+        return json.dumps(data, indent=2, default=_json_default).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), default=_json_default).encode("utf-8")
+
+
+def _dumps_data_file(path: str, data: Any) -> bytes:
+    """Serialize a data file payload in the layout its file name calls for."""
+    return _dumps_json(data, indent=os.path.basename(path) not in _COMPACT_JSON_FILES)
+
+
+def _json_digest(payload: bytes) -> bytes:
+    """Short digest of a serialized payload, kept to detect unchanged saves."""
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def _skips_unchanged(path: str) -> bool:
+    """Whether a save of path may be skipped when its payload is unchanged."""
+    return os.path.basename(path) not in _ALWAYS_WRITE_JSON_FILES
+
+
+# DEFAULT_CONFIG serialized once; parsing it back is a much cheaper fresh copy than deepcopy
+_DEFAULT_CONFIG_JSON = _dumps_json(DEFAULT_CONFIG)
+
+
+def _default_config() -> dict[str, Any]:
+    """Return a fresh, independently mutable copy of DEFAULT_CONFIG."""
+    return orjson.loads(_DEFAULT_CONFIG_JSON) if orjson else json.loads(_DEFAULT_CONFIG_JSON)
+
+
+def _efficiency_merge_kind(default: Any) -> str | None:
+    """How a loaded efficiency setting is coerced, decided by its default's type."""
+    if isinstance(default, bool):
+        return "bool"
+    if isinstance(default, int):
+        return "int"
+    if isinstance(default, float):
+        return "float"
+    if isinstance(default, str):
+        return "str"
+    return None
+
+
+# (key, kind) for efficiency_settings, resolved once from the fixed default schema
+_EFFICIENCY_MERGE_FIELDS: tuple[tuple[str, str], ...] = tuple(
+    (k, kind)
+    for k, v in DEFAULT_CONFIG["energy"]["efficiency_settings"].items()
+    if (kind := _efficiency_merge_kind(v)) is not None
+)
+
+
 def _write_json_file(path: str, data: Any) -> None:
     """Write JSON file atomically (run in executor to avoid blocking event loop).
 
@@ -285,10 +457,66 @@ def _write_json_file(path: str, data: Any) -> None:
     implementation did a direct ``open(path, "w")`` which left a truncated
     file on crash.
     """
+    _write_json_bytes(path, _dumps_data_file(path, data))
+
+
+def _write_json_bytes(path: str, payload: bytes) -> None:
+    """Atomically write already-serialized JSON (run in executor)."""
     partial = f"{path}.partial"
-    with open(partial, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
-    os.replace(partial, path)
+    fd = os.open(partial, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(partial, path)
+    except OSError:
+        # A failed write, close or replace must not leave the partial behind
+        with suppress(OSError):
+            os.remove(partial)
+        raise
+
+
+def _write_json_file_if_changed(
+    path: str, data: Any, last_digest: bytes | None
+) -> tuple[bool, bytes | None]:
+    """Serialize data and atomically write it unless its digest equals last_digest.
+
+    Runs in the executor so serialization stays off the event loop. Returns
+    (written, digest); digest is None for files that are always written.
+    """
+    payload = _dumps_data_file(path, data)
+    digest = _json_digest(payload) if _skips_unchanged(path) else None
+    if digest is not None and digest == last_digest:
+        return False, digest
+    _write_json_bytes(path, payload)
+    return True, digest
+
+
+def _write_json_files(
+    items: list[tuple[str, Any]], last_digests: Mapping[str, bytes]
+) -> dict[str, bytes]:
+    """Serialize several (path, data) items and atomically write the changed ones.
+
+    Runs as one executor job so serialization stays off the event loop. Files
+    whose payload digest matches ``last_digests`` are skipped; a failing file
+    is logged and does not stop the rest. Returns path -> digest for the
+    written files that take part in the skip check.
+    """
+    written: dict[str, bytes] = {}
+    for path, data in items:
+        try:
+            was_written, digest = _write_json_file_if_changed(
+                path, data, last_digests.get(path)
+            )
+        except OSError as err:
+            _LOGGER.error("Error saving %s: %s", path, err)
+            continue
+        if was_written and digest is not None:
+            written[path] = digest
+    return written
 
 
 def _power_source_for_light_vent(outlet: dict[str, Any]) -> tuple[str, str | None]:
@@ -329,6 +557,11 @@ def _normalize_presence_zone_entities(raw: Any) -> list[str]:
 
 
 _ROOM_ICON_PATTERN = re.compile(r"^mdi:[a-z0-9-]+$")
+_HHMM_PATTERN = re.compile(r"^(\d{1,2}):(\d{2})$")
+# Billing date sensor states: YYYY-MM-DD prefix, or MM/DD/YYYY / MM-DD-YYYY (maybe DD/MM)
+_DATE_YMD_PATTERN = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+_DATE_MDY_PATTERN = re.compile(r"(\d{1,2})[/-](\d{1,2})[/-](\d{4})")
+_DATE_ISO_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
 
 def _normalize_room_icon(val: Any) -> str | None:
@@ -359,25 +592,88 @@ def _validate_entity_list(val: Any, prefixes: tuple[str, ...]) -> list[str]:
     if not val:
         return []
     if isinstance(val, str):
-        val = [v.strip() for v in val.split(",") if v.strip()]
+        val = [v for v in map(str.strip, val.split(",")) if v]
     if not isinstance(val, list):
         return []
     result = []
     for entity in val:
         s = str(entity or "").strip()
-        if any(s.startswith(p) for p in prefixes):
+        if s.startswith(prefixes):
             result.append(s)
     return result
 
 
 def vent_like_energy_tracking_key(room_id: str, outlet: dict) -> str:
     """Synthetic key for vent / wall heater static-watts energy when switch is on."""
-    name = (outlet.get("name") or "device").lower().replace(" ", "_")
+    name = _slugify(outlet.get("name") or "device")
     if outlet.get("type") == "wall_heater":
         return f"wall_heater_{room_id}_{name}"
     return f"ceiling_vent_{room_id}_{name}"
 
 
+def _outlet_day_energy_keys(room_id: str, outlet: dict[str, Any]) -> list[str]:
+    """Day-ledger keys an outlet's energy is tracked under (deduplicated per outlet)."""
+    otype = outlet.get("type")
+    if otype in ("light", "vent", "wall_heater"):
+        if outlet.get("power_source") == "sensor":
+            pe = outlet.get("power_sensor_entity")
+            return [pe] if pe else []
+        if otype == "light":
+            return [f"light_{room_id}_{_slugify(outlet.get('name') or 'light')}"]
+        return [vent_like_energy_tracking_key(room_id, outlet)]
+    keys: list[str] = []
+    for e in (
+        outlet.get("power_sensor_entity"),
+        outlet.get("plug1_entity"),
+        outlet.get("plug2_entity"),
+    ):
+        if e and isinstance(e, str):
+            e = e.strip()
+            if e and e not in keys:
+                keys.append(e)
+    return keys
+
+
+@lru_cache(maxsize=256)
+def _hourly_cumulative(n: int) -> tuple[float, ...]:
+    """Linear 24-point ramp up to n for the event charts (counts repeat across rooms and polls)."""
+    if n <= 0:
+        return (0.0,) * 24
+    return tuple(round((i + 1) * n / 24, 2) for i in range(24))
+
+
+def _minute_series(minute_sums: dict[str, float]) -> dict[str, Any]:
+    """Chart series (timestamps ascending, watts) from a minute_key -> watts map."""
+    sorted_minutes = sorted(minute_sums)
+    return {
+        "timestamps": sorted_minutes,
+        "watts": [minute_sums[m] for m in sorted_minutes],
+    }
+
+
+# Per-room columns of a daily history chart, in payload order
+_DAILY_ROOM_FIELDS = ("wh", "warnings", "shutoffs", "power_cycles")
+
+
+def _daily_history_columns(
+    dates: list[str], rows: list[dict[str, Any]], room_ids: set[str]
+) -> dict[str, Any]:
+    """Chart payload: one list per total / per room field, aligned with dates."""
+    room_rows = [row.get("rooms") or {} for row in rows]
+    rooms: dict[str, dict[str, list[Any]]] = {}
+    for rid in room_ids:
+        cells = [rr.get(rid) or {} for rr in room_rows]
+        rooms[rid] = {f: [c.get(f, 0) for c in cells] for f in _DAILY_ROOM_FIELDS}
+    return {
+        "dates": dates,
+        "total_wh": [row.get("total_wh", 0) for row in rows],
+        "total_warnings": [row.get("total_warnings", 0) for row in rows],
+        "total_shutoffs": [row.get("total_shutoffs", 0) for row in rows],
+        "total_power_cycles": [row.get("total_power_cycles", 0) for row in rows],
+        "rooms": rooms,
+    }
+
+
 def _event_log_dedupe_key(e: dict[str, Any]) -> tuple[Any, ...]:
     """Stable key to dedupe same logical event across rolling log and archive."""
     return (
@@ -388,19 +684,918 @@ def _event_log_dedupe_key(e: dict[str, Any]) -> tuple[Any, ...]:
     )
 
 
+def _outlet_fields_plug(item: dict[str, Any], outlet: dict[str, Any]) -> None:
+    """Dual-plug outlet: both plugs with their switches and shutoffs."""
+    outlet_get = outlet.get
+    item["plug2_entity"] = outlet_get("plug2_entity")
+    item["plug1_switch"] = outlet_get("plug1_switch")
+    item["plug2_switch"] = outlet_get("plug2_switch")
+    item["plug1_shutoff"] = int(outlet_get("plug1_shutoff", 0))
+    item["plug2_shutoff"] = int(outlet_get("plug2_shutoff", 0))
+
+
+def _outlet_fields_stove(item: dict[str, Any], outlet: dict[str, Any]) -> None:
+    """Stove: plug 1 only, plus the stove safety timer settings."""
+    outlet_get = outlet.get
+    item["plug2_entity"] = None
+    item["plug1_switch"] = outlet_get("plug1_switch")
+    item["plug2_switch"] = None
+    item["plug1_shutoff"] = 0
+    item["plug2_shutoff"] = 0
+    item["stove_safety_enabled"] = outlet_get("stove_safety_enabled", True)
+    item["stove_power_threshold"] = int(outlet_get("stove_power_threshold", 100))
+    item["stove_off_debounce_seconds"] = max(0, min(60, int(outlet_get("stove_off_debounce_seconds", 10))))
+    item["stove_on_debounce_seconds"] = max(0, min(60, int(outlet_get("stove_on_debounce_seconds", 0))))
+    item["cooking_time_minutes"] = int(outlet_get("cooking_time_minutes", 15))
+    item["final_warning_seconds"] = int(outlet_get("final_warning_seconds", 30))
+    item["timer_start_window_seconds"] = max(1, min(120, int(outlet_get("timer_start_window_seconds", 10))))
+    item["stove_timer_tts_interval_seconds"] = max(
+        0,
+        min(3600, int(outlet_get("stove_timer_tts_interval_seconds", 0))),
+    )
+    item["presence_sensor"] = outlet_get("presence_sensor")
+
+
+def _outlet_fields_microwave(item: dict[str, Any], outlet: dict[str, Any]) -> None:
+    """Microwave: monitored plug only, plus the microwave safety settings."""
+    outlet_get = outlet.get
+    item["plug2_entity"] = None
+    item["plug1_switch"] = None
+    item["plug2_switch"] = None
+    item["plug1_shutoff"] = 0
+    item["plug2_shutoff"] = 0
+    item["microwave_safety_enabled"] = outlet_get("microwave_safety_enabled", False)
+    item["microwave_power_threshold"] = int(outlet_get("microwave_power_threshold", 50))
+
+
+def _light_entity_entry(e: Any) -> dict[str, Any] | None:
+    """Normalize one light_entities entry ({entity_id, watts, ...} or entity_id string)."""
+    if isinstance(e, dict):
+        eid = e.get("entity_id", "")
+        if not eid.startswith("light."):
+            return None
+        wrgb = bool(e.get("wrgb", False))
+        return {
+            "entity_id": eid,
+            "watts": max(0, int(e.get("watts", 0))),
+            "wrgb": wrgb,
+            "tuya": bool(e.get("tuya", False)) and wrgb,
+        }
+    if isinstance(e, str):
+        eid = e.strip()
+        if eid.startswith("light."):
+            return {"entity_id": eid, "watts": 0, "wrgb": False, "tuya": False}
+    return None
+
+
+def _outlet_fields_light(item: dict[str, Any], outlet: dict[str, Any]) -> None:
+    """Light group: switch, light entities with watts, and power source."""
+    outlet_get = outlet.get
+    item["plug1_entity"] = None
+    item["plug2_entity"] = None
+    item["plug1_switch"] = None
+    item["plug2_switch"] = None
+    item["plug1_shutoff"] = 0
+    item["plug2_shutoff"] = 0
+    item["switch_entity"] = outlet_get("switch_entity")
+    light_ents = outlet_get("light_entities")
+    # Support list of {entity_id, watts, wrgb, tuya} or legacy list of entity_id strings
+    if isinstance(light_ents, list):
+        # Last entry per entity_id wins, at the position it was first seen
+        parsed = (_light_entity_entry(e) for e in light_ents)
+        item["light_entities"] = list(
+            {entry["entity_id"]: entry for entry in parsed if entry is not None}.values()
+        )
+    elif isinstance(light_ents, str):
+        item["light_entities"] = [
+            {"entity_id": eid, "watts": 0, "wrgb": False, "tuya": False}
+            for eid in map(str.strip, light_ents.split(","))
+            if eid.startswith("light.")
+        ]
+    else:
+        item["light_entities"] = []
+    ps, pse = _power_source_for_light_vent(outlet)
+    item["power_source"] = ps
+    item["power_sensor_entity"] = pse
+
+
+def _outlet_fields_minisplit(item: dict[str, Any], outlet: dict[str, Any]) -> None:
+    """Minisplit: plug 1 with enforcement off time / minimum watts."""
+    outlet_get = outlet.get
+    item["plug2_entity"] = None
+    item["plug1_switch"] = outlet_get("plug1_switch")
+    item["plug2_switch"] = None
+    item["plug1_shutoff"] = int(outlet_get("plug1_shutoff", 0))
+    item["plug2_shutoff"] = 0
+    item["minisplit_enforcement_off_seconds"] = max(
+        30,
+        min(600, int(outlet_get("minisplit_enforcement_off_seconds", 60))),
+    )
+    item["minisplit_enforcement_min_watts"] = max(
+        0,
+        min(2000, int(outlet_get("minisplit_enforcement_min_watts", 0))),
+    )
+
+
+def _outlet_fields_single(item: dict[str, Any], outlet: dict[str, Any]) -> None:
+    """Single-plug outlet or fridge: plug 1 with switch and shutoff."""
+    outlet_get = outlet.get
+    item["plug2_entity"] = None
+    item["plug1_switch"] = outlet_get("plug1_switch")
+    item["plug2_switch"] = None
+    item["plug1_shutoff"] = int(outlet_get("plug1_shutoff", 0))
+    item["plug2_shutoff"] = 0
+
+
+def _outlet_fields_vent_heater(item: dict[str, Any], outlet: dict[str, Any]) -> None:
+    """Vent or wall heater: switch with fixed watts, plus vent or heater automation."""
+    outlet_get = outlet.get
+    item["plug1_entity"] = None
+    item["plug2_entity"] = None
+    item["plug1_switch"] = None
+    item["plug2_switch"] = None
+    item["plug1_shutoff"] = 0
+    item["plug2_shutoff"] = 0
+    item["switch_entity"] = outlet_get("switch_entity")
+    item["watts_when_on"] = max(0, int(outlet_get("watts_when_on", 0)))
+    ps, pse = _power_source_for_light_vent(outlet)
+    item["power_source"] = ps
+    item["power_sensor_entity"] = pse
+    if item["type"] == "vent":
+        item["vent_automation_enabled"] = bool(
+            outlet_get("vent_automation_enabled")
+        )
+        item["vent_presence_entity"] = _normalize_binary_sensor_entity(
+            outlet_get("vent_presence_entity")
+        )
+        item["vent_on_debounce_seconds"] = max(
+            0, min(600, int(outlet_get("vent_on_debounce_seconds", 30)))
+        )
+        item["vent_off_after_no_presence_seconds"] = max(
+            10,
+            min(
+                86400,
+                int(outlet_get("vent_off_after_no_presence_seconds", 300)),
+            ),
+        )
+    else:
+        item["heater_automation_enabled"] = bool(
+            outlet_get("heater_automation_enabled")
+        )
+        te = str(outlet_get("heater_temperature_entity") or "").strip()
+        item["heater_temperature_entity"] = (
+            te if te.startswith("sensor.") else None
+        )
+        item["heater_on_below_temperature"] = max(
+            -60.0,
+            min(160.0, float(outlet_get("heater_on_below_temperature", 65))),
+        )
+        hct = outlet_get("heater_comfort_temperature")
+        if hct is None or hct == "":
+            item["heater_comfort_temperature"] = None
+        else:
+            try:
+                item["heater_comfort_temperature"] = max(
+                    -60.0,
+                    min(160.0, float(hct)),
+                )
+            except (TypeError, ValueError):
+                item["heater_comfort_temperature"] = None
+        item["heater_stay_on_minutes"] = max(
+            1, min(240, int(outlet_get("heater_stay_on_minutes", 5)))
+        )
+        item["heater_presence_optional_enabled"] = bool(
+            outlet_get("heater_presence_optional_enabled")
+        )
+        item["heater_presence_turn_on_enabled"] = bool(
+            outlet_get("heater_presence_turn_on_enabled")
+        )
+        item["heater_presence_entity"] = _normalize_binary_sensor_entity(
+            outlet_get("heater_presence_entity")
+        )
+        item["heater_presence_cooldown_seconds"] = max(
+            0,
+            min(7200, int(outlet_get("heater_presence_cooldown_seconds", 60))),
+        )
+        item["heater_cold_boost_enabled"] = bool(
+            outlet_get("heater_cold_boost_enabled")
+        )
+        item["heater_cold_boost_outdoor_at_or_below"] = max(
+            -60.0,
+            min(
+                160.0,
+                float(outlet_get("heater_cold_boost_outdoor_at_or_below", 32)),
+            ),
+        )
+        item["heater_cold_boost_on_below_temperature"] = max(
+            -60.0,
+            min(
+                160.0,
+                float(
+                    outlet_get(
+                        "heater_cold_boost_on_below_temperature",
+                        outlet_get("heater_on_below_temperature", 65),
+                    )
+                ),
+            ),
+        )
+        cbct = outlet_get("heater_cold_boost_comfort_temperature")
+        if cbct is None or cbct == "":
+            item["heater_cold_boost_comfort_temperature"] = None
+        else:
+            try:
+                item["heater_cold_boost_comfort_temperature"] = max(
+                    -60.0,
+                    min(160.0, float(cbct)),
+                )
+            except (TypeError, ValueError):
+                item["heater_cold_boost_comfort_temperature"] = None
+        # Smart heater optimization settings
+        item["heater_weather_entity"] = str(
+            outlet_get("heater_weather_entity") or ""
+        ).strip()
+        item["heater_optimization_enabled"] = bool(
+            outlet_get("heater_optimization_enabled", True)
+        )
+        item["heater_hysteresis_band"] = max(
+            0.0,
+            min(10.0, float(outlet_get("heater_hysteresis_band", 2.0) or 2.0)),
+        )
+        item["heater_duty_cycle_enabled"] = bool(
+            outlet_get("heater_duty_cycle_enabled")
+        )
+        item["heater_duty_on_minutes"] = max(
+            1,
+            min(30, int(outlet_get("heater_duty_on_minutes", 5) or 5)),
+        )
+        item["heater_duty_off_minutes"] = max(
+            1,
+            min(15, int(outlet_get("heater_duty_off_minutes", 2) or 2)),
+        )
+        item["heater_duty_comfort_margin"] = max(
+            0.0,
+            min(10.0, float(outlet_get("heater_duty_comfort_margin", 1.0) or 1.0)),
+        )
+        item["heater_power_aware_enabled"] = bool(
+            outlet_get("heater_power_aware_enabled")
+        )
+        item["heater_power_threshold_watts"] = max(
+            100,
+            min(5000, int(outlet_get("heater_power_threshold_watts", 500) or 500)),
+        )
+        item["heater_learning_enabled"] = bool(
+            outlet_get("heater_learning_enabled", True)
+        )
+        item["heater_preheat_minutes"] = max(
+            0,
+            min(120, int(outlet_get("heater_preheat_minutes", 30) or 30)),
+        )
+        door_ent = str(outlet_get("heater_door_sensor_entity") or "").strip()
+        item["heater_door_sensor_entity"] = door_ent if door_ent.startswith("binary_sensor.") else None
+        window_ent = str(outlet_get("heater_window_sensor_entity") or "").strip()
+        item["heater_window_sensor_entity"] = window_ent if window_ent.startswith("binary_sensor.") else None
+
+
+def _outlet_fields_door(item: dict[str, Any], outlet: dict[str, Any]) -> None:
+    """Door: contact/lock/presence sensors, announcements, reminders and linked entities."""
+    outlet_get = outlet.get
+    item["plug1_entity"] = None
+    item["plug2_entity"] = None
+    item["plug1_switch"] = None
+    item["plug2_switch"] = None
+    item["plug1_shutoff"] = 0
+    item["plug2_shutoff"] = 0
+    contact_ent = str(outlet_get("contact_sensor") or "").strip()
+    item["contact_sensor"] = contact_ent if contact_ent.startswith("binary_sensor.") else None
+    contact_batt = str(outlet_get("contact_sensor_battery") or "").strip()
+    item["contact_sensor_battery"] = contact_batt if contact_batt.startswith("sensor.") else None
+    lock_ent = str(outlet_get("lock_entity") or "").strip()
+    item["lock_entity"] = lock_ent if lock_ent.startswith("lock.") else None
+    lock_batt = str(outlet_get("lock_battery") or "").strip()
+    item["lock_battery"] = lock_batt if lock_batt.startswith("sensor.") else None
+    presence_ent = str(outlet_get("presence_sensor") or "").strip()
+    item["presence_sensor"] = presence_ent if presence_ent.startswith("binary_sensor.") else None
+    presence_batt = str(outlet_get("presence_sensor_battery") or "").strip()
+    item["presence_sensor_battery"] = presence_batt if presence_batt.startswith("sensor.") else None
+    door_subtype = str(outlet_get("door_subtype") or "standard").strip().lower()
+    item["door_subtype"] = door_subtype if door_subtype in ("standard", "closet", "entrance") else "standard"
+    item["announce_open_close"] = bool(outlet_get("announce_open_close", True))
+    item["announce_lock"] = bool(outlet_get("announce_lock", True))
+    item["announce_presence"] = bool(outlet_get("announce_presence", False))
+    reminder_mode = str(outlet_get("reminder_mode") or "none").strip().lower()
+    item["reminder_mode"] = reminder_mode if reminder_mode in ("none", "open", "unlocked") else "none"
+    item["reminder_interval"] = max(15, min(120, int(outlet_get("reminder_interval", 30))))
+    item["auto_lock_enabled"] = bool(outlet_get("auto_lock_enabled", False))
+    item["auto_lock_delay"] = max(1, min(600, int(outlet_get("auto_lock_delay", 10))))
+    item["open_turn_on_entities"] = _validate_entity_list(outlet_get("open_turn_on_entities"), ("light.", "switch."))
+    item["close_turn_off_entities"] = _validate_entity_list(outlet_get("close_turn_off_entities"), ("light.", "switch."))
+    item["unlock_turn_on_entities"] = _validate_entity_list(outlet_get("unlock_turn_on_entities"), ("light.", "switch."))
+    item["lock_turn_off_entities"] = _validate_entity_list(outlet_get("lock_turn_off_entities"), ("light.", "switch."))
+    item["presence_on_entities"] = _validate_entity_list(outlet_get("presence_on_entities"), ("light.", "switch."))
+    item["presence_off_entities"] = _validate_entity_list(outlet_get("presence_off_entities"), ("light.", "switch."))
+    item["presence_on_hold_secs"] = max(0, min(10, int(outlet_get("presence_on_hold_secs", 0))))
+    item["presence_off_hold_secs"] = max(0, min(10, int(outlet_get("presence_off_hold_secs", 0))))
+
+
+def _outlet_fields_window(item: dict[str, Any], outlet: dict[str, Any]) -> None:
+    """Window: contact/presence sensors, announcements, reminders and linked entities."""
+    outlet_get = outlet.get
+    item["plug1_entity"] = None
+    item["plug2_entity"] = None
+    item["plug1_switch"] = None
+    item["plug2_switch"] = None
+    item["plug1_shutoff"] = 0
+    item["plug2_shutoff"] = 0
+    contact_ent = str(outlet_get("contact_sensor") or "").strip()
+    item["contact_sensor"] = contact_ent if contact_ent.startswith("binary_sensor.") else None
+    contact_batt = str(outlet_get("contact_sensor_battery") or "").strip()
+    item["contact_sensor_battery"] = contact_batt if contact_batt.startswith("sensor.") else None
+    presence_ent = str(outlet_get("presence_sensor") or "").strip()
+    item["presence_sensor"] = presence_ent if presence_ent.startswith("binary_sensor.") else None
+    presence_batt = str(outlet_get("presence_sensor_battery") or "").strip()
+    item["presence_sensor_battery"] = presence_batt if presence_batt.startswith("sensor.") else None
+    item["announce_open_close"] = bool(outlet_get("announce_open_close", True))
+    item["announce_presence"] = bool(outlet_get("announce_presence", False))
+    item["reminder_enabled"] = bool(outlet_get("reminder_enabled", False))
+    item["reminder_interval"] = max(15, min(120, int(outlet_get("reminder_interval", 30))))
+    item["open_turn_on_entities"] = _validate_entity_list(outlet_get("open_turn_on_entities"), ("light.", "switch."))
+    item["close_turn_off_entities"] = _validate_entity_list(outlet_get("close_turn_off_entities"), ("light.", "switch."))
+    item["presence_on_entities"] = _validate_entity_list(outlet_get("presence_on_entities"), ("light.", "switch."))
+    item["presence_off_entities"] = _validate_entity_list(outlet_get("presence_off_entities"), ("light.", "switch."))
+    item["presence_on_hold_secs"] = max(0, min(10, int(outlet_get("presence_on_hold_secs", 0))))
+    item["presence_off_hold_secs"] = max(0, min(10, int(outlet_get("presence_off_hold_secs", 0))))
+
+
+def _outlet_fields_other(item: dict[str, Any], outlet: dict[str, Any]) -> None:
+    """Any other type: no plugs or switches."""
+    item["plug2_entity"] = None
+    item["plug1_switch"] = None
+    item["plug2_switch"] = None
+    item["plug1_shutoff"] = 0
+    item["plug2_shutoff"] = 0
+
+
+# Type-specific outlet fields; the validator dispatches on the normalized type
+_OUTLET_FIELD_BUILDERS: dict[str, Callable[[dict[str, Any], dict[str, Any]], None]] = {
+    "outlet": _outlet_fields_plug,
+    "stove": _outlet_fields_stove,
+    "microwave": _outlet_fields_microwave,
+    "light": _outlet_fields_light,
+    "minisplit": _outlet_fields_minisplit,
+    "single_outlet": _outlet_fields_single,
+    "fridge": _outlet_fields_single,
+    "vent": _outlet_fields_vent_heater,
+    "wall_heater": _outlet_fields_vent_heater,
+    "door": _outlet_fields_door,
+    "window": _outlet_fields_window,
+}
+# Outlet types the validator accepts, each mapped to its (interned) literal so every
+# validated outlet shares one string object; anything else is stored as a plain "outlet"
+_OUTLET_TYPES: dict[str, str] = {t: t for t in _OUTLET_FIELD_BUILDERS}
+
+
+# tts_settings fields in persisted order: (key, kind, fallback when DEFAULT_CONFIG lacks the key).
+# "computed" fields need bespoke coercion and are filled in by _validate_tts_settings.
+_TTS_FIELD_SPECS: tuple[tuple[str, str, Any], ...] = (
+    ("language", "plain", None),
+    ("speed", "computed", None),
+    ("volume", "computed", None),
+    ("prefix", "plain", None),
+    ("room_warn_msg", "plain", None),
+    ("outlet_warn_msg", "plain", None),
+    ("shutoff_msg", "plain", None),
+    ("breaker_warn_msg", "plain", None),
+    ("breaker_shutoff_msg", "plain", None),
+    ("stove_on_msg", "plain", None),
+    ("stove_off_msg", "plain", None),
+    ("stove_timer_started_msg", "plain", None),
+    ("stove_15min_warn_msg", "plain", None),
+    ("stove_30sec_warn_msg", "plain", None),
+    ("stove_auto_off_msg", "plain", None),
+    ("microwave_cut_power_msg", "plain", None),
+    ("microwave_restore_power_msg", "plain", None),
+    ("phase1_warn_msg", "plain", ""),
+    ("phase2_warn_msg", "plain", ""),
+    ("phase2_after_msg", "plain", ""),
+    ("minisplit_phase2_warn_msg", "plain", ""),
+    ("minisplit_phase2_after_msg", "plain", ""),
+    ("minisplit_phase2_restore_msg", "plain", ""),
+    ("phase_reset_msg", "plain", ""),
+    ("room_kwh_warn_msg", "plain", ""),
+    ("home_kwh_warn_msg", "plain", ""),
+    ("budget_exceeded_msg", "plain", ""),
+    ("min_interval_seconds", "computed", None),
+    ("budget_boost_enabled", "bool", False),
+    ("budget_boost_multiplier", "computed", None),
+    ("budget_boost_weekdays", "computed", None),
+    ("budget_boost_window_start", "computed", None),
+    ("budget_boost_window_end", "computed", None),
+    ("budget_boost_repeat_minutes", "computed", None),
+    ("budget_boost_minute_offset", "computed", None),
+    ("budget_boost_announce_time", "computed", None),
+    ("budget_boost_announce_media_player", "computed", None),
+    ("tts_default_media_player", "computed", None),
+    ("budget_boost_scheduled_msg", "plain", ""),
+    ("phase1_warn_msg_boost_day", "plain", ""),
+    ("stove_timer_progress_msg", "plain", ""),
+    ("heater_automation_tts_enabled", "bool", False),
+    ("vent_automation_tts_enabled", "bool", False),
+    ("heater_automation_on_msg", "plain", ""),
+    ("vent_automation_on_msg", "plain", ""),
+    ("room_warn_tts_enabled", "bool", True),
+    ("outlet_warn_tts_enabled", "bool", True),
+    ("budget_exceeded_tts_enabled", "bool", True),
+    ("budget_boost_scheduled_tts_enabled", "bool", True),
+    ("phase1_warn_boost_day_tts_enabled", "bool", True),
+    ("shutoff_tts_enabled", "bool", True),
+    ("stove_on_tts_enabled", "bool", True),
+    ("stove_off_tts_enabled", "bool", True),
+    ("stove_timer_started_tts_enabled", "bool", True),
+    ("stove_timer_progress_tts_enabled", "bool", True),
+    ("stove_15min_warn_tts_enabled", "bool", True),
+    ("stove_30sec_warn_tts_enabled", "bool", True),
+    ("stove_auto_off_tts_enabled", "bool", True),
+    ("phase1_warn_tts_enabled", "bool", True),
+    ("phase2_warn_tts_enabled", "bool", True),
+    ("phase2_after_tts_enabled", "bool", True),
+    ("minisplit_phase2_warn_tts_enabled", "bool", True),
+    ("minisplit_phase2_after_tts_enabled", "bool", True),
+    ("minisplit_phase2_restore_tts_enabled", "bool", True),
+    ("phase_reset_tts_enabled", "bool", True),
+    ("room_kwh_warn_tts_enabled", "bool", True),
+    ("home_kwh_warn_tts_enabled", "bool", True),
+    ("notifications_enabled", "bool", False),
+    ("notify_room_budget_hit", "bool", True),
+    ("notify_room_boost_days", "bool", True),
+    ("notify_enforcement_phase_change", "bool", True),
+    ("notify_ac_auto_off", "bool", True),
+    ("notify_ac_auto_on", "bool", True),
+    ("notify_person_toggle", "computed", None),
+    ("notify_integration_auto", "bool", True),
+    ("notify_heater_auto", "computed", None),
+    ("notify_vent_auto", "computed", None),
+    ("notify_external_auto", "computed", None),
+    ("notification_title", "computed", None),
+    ("notify_budget_hit_title", "str", ""),
+    ("notify_budget_hit_msg", "str", ""),
+    ("notify_room_boost_days_title", "str", ""),
+    ("notify_room_boost_days_msg", "str", ""),
+    ("notify_enforcement_phase1_title", "str", ""),
+    ("notify_enforcement_phase1_msg", "str", ""),
+    ("notify_enforcement_phase2_title", "str", ""),
+    ("notify_enforcement_phase2_msg", "str", ""),
+    ("notify_ac_auto_off_title", "str", ""),
+    ("notify_ac_auto_off_msg", "str", ""),
+    ("notify_ac_auto_on_title", "str", ""),
+    ("notify_ac_auto_on_msg", "str", ""),
+    ("notify_toggle_title", "computed", None),
+    ("notify_toggle_msg", "computed", None),
+    ("notify_heater_auto_on_title", "str", ""),
+    ("notify_heater_auto_on_msg", "str", ""),
+    ("notify_heater_auto_off_title", "str", ""),
+    ("notify_heater_auto_off_msg", "str", ""),
+    ("notify_vent_auto_on_title", "str", ""),
+    ("notify_vent_auto_on_msg", "str", ""),
+    ("notify_vent_auto_off_title", "str", ""),
+    ("notify_vent_auto_off_msg", "str", ""),
+    ("zone_health_check_enabled", "computed", None),
+    ("zone_health_history_days", "computed", None),
+    ("zone_health_reminder_hours", "computed", None),
+    (
+        "zone_health_notification_msg",
+        "str",
+        "Hi {name}, your Home Assistant Companion app location doesn't appear to be set up correctly. Zone-based presence isn't working.",
+    ),
+    (
+        "zone_health_reminder_tts_msg",
+        "str",
+        "{name}, your zone-based location setup needs attention. Please check your Companion app settings.",
+    ),
+    ("door_tts_enabled", "bool", True),
+    ("window_tts_enabled", "bool", True),
+    ("presence_tts_enabled", "bool", True),
+    ("battery_tts_enabled", "bool", True),
+    ("door_opened_msg", "stripped", None),
+    ("door_closed_msg", "stripped", None),
+    ("door_locked_msg", "stripped", None),
+    ("door_unlocked_msg", "stripped", None),
+    ("door_still_open_msg", "stripped", None),
+    ("door_still_unlocked_msg", "stripped", None),
+    ("window_opened_msg", "stripped", None),
+    ("window_closed_msg", "stripped", None),
+    ("window_still_open_msg", "stripped", None),
+    ("presence_detected_msg", "stripped", None),
+    ("presence_cleared_msg", "stripped", None),
+    ("battery_low_msg", "stripped", None),
+    ("battery_replaced_msg", "stripped", None),
+)
+_DEFAULT_TTS: dict[str, Any] = DEFAULT_CONFIG["energy"]["tts_settings"]
+# Defaults resolved once against the fixed DEFAULT_CONFIG schema
+_TTS_FIELDS: tuple[tuple[str, str, Any], ...] = tuple(
+    (key, kind, _DEFAULT_TTS.get(key, fallback)) for key, kind, fallback in _TTS_FIELD_SPECS
+)
+
+
+def _validate_outlet(outlet: Any) -> dict[str, Any] | None:
+    """Validated outlet/device record, or None if the entry is not a named dict."""
+    if not (isinstance(outlet, dict) and outlet.get("name")):
+        return None
+    outlet_get = outlet.get
+    outlet_type = _OUTLET_TYPES.get(_normalize_outlet_type(outlet_get("type", "outlet")), "outlet")
+    item = {
+        "name": outlet["name"],
+        "type": outlet_type,
+        "plug1_entity": outlet_get("plug1_entity"),
+        "threshold": int(outlet_get("threshold", 0)),
+    }
+    _OUTLET_FIELD_BUILDERS.get(outlet_type, _outlet_fields_other)(item, outlet)
+    if outlet_type == "outlet":
+        item["presence_auto_off_plug1"] = bool(outlet_get("presence_auto_off_plug1"))
+        item["presence_auto_off_plug2"] = bool(outlet_get("presence_auto_off_plug2"))
+        item["keep_on_plug1"] = bool(outlet_get("keep_on_plug1"))
+        item["keep_on_plug2"] = bool(outlet_get("keep_on_plug2"))
+    else:
+        item["presence_auto_off"] = bool(outlet_get("presence_auto_off"))
+        item["keep_on"] = bool(outlet_get("keep_on"))
+    return item
+
+
+def _validate_room(room: Any) -> dict[str, Any] | None:
+    """Validated room with its outlets, or None if the entry is not a named dict."""
+    if not (isinstance(room, dict) and room.get("name")):
+        return None
+    room_get = room.get
+    validated_room = {
+        "id": room_get("id", _slugify(room["name"])),
+        "name": room["name"],
+        "area_id": room_get("area_id"),
+        "media_player": room_get("media_player"),
+        "threshold": int(room_get("threshold", 0)),
+        "kwh_budget": max(0, float(room_get("kwh_budget", 5))),
+        "kwh_budget_use_boost": (
+            room_get("kwh_budget_use_boost", True) is not False
+        ),
+        "volume": float(room_get("volume", 0.7)),
+        "responsive_light_warnings": bool(room_get("responsive_light_warnings", False)),
+        "responsive_light_color": _validate_rgb(room_get("responsive_light_color")),
+        "responsive_light_temp": max(2000, min(6500, _safe_int(room_get("responsive_light_temp"), 6500))),
+        "responsive_light_interval": max(0.1, min(10.0, _safe_float(room_get("responsive_light_interval"), 1.5))),
+        "presence_person_entity": _normalize_presence_person_entity(
+            room_get("presence_person_entity")
+        ),
+        "presence_zone_entities": _normalize_presence_zone_entities(
+            room_get("presence_zone_entities")
+        ),
+        "room_icon": _normalize_room_icon(room_get("room_icon")),
+        "room_budget_boost_weekdays": _normalize_room_budget_boost_weekdays(
+            room_get("room_budget_boost_weekdays")
+        ),
+        "outlets": [],
+    }
+    ch_at = _normalize_room_budget_boost_changed_at(
+        room_get("room_budget_boost_weekdays_changed_at")
+    )
+    if ch_at is not None:
+        validated_room["room_budget_boost_weekdays_changed_at"] = ch_at
+    raw_mult = room_get("room_budget_boost_multiplier")
+    if raw_mult is not None:
+        try:
+            mult_val = float(raw_mult)
+            if 1.0 <= mult_val <= 5.0:
+                validated_room["room_budget_boost_multiplier"] = round(mult_val, 1)
+        except (TypeError, ValueError):
+            pass
+    outlets = validated_room["outlets"]
+    for outlet in room_get("outlets", []):
+        item = _validate_outlet(outlet)
+        if item is not None:
+            outlets.append(item)
+    return validated_room
+
+
+def _validate_breaker(breaker: dict[str, Any], panel_size: int) -> dict[str, Any]:
+    """Validated breaker line (caller skips entries that are not named dicts)."""
+    breaker_get = breaker.get
+    return {
+        "id": breaker_get("id", _slugify(breaker["name"])),
+        "name": breaker["name"],
+        "number": max(1, min(panel_size, int(breaker_get("number", 1)))),
+        "color": breaker_get("color", "#03a9f4"),
+        "max_load": int(breaker_get("max_load", 2400)),
+        "threshold": int(breaker_get("threshold", 0)),
+        "outlet_ids": breaker_get("outlet_ids", []),  # List of outlet identifiers
+    }
+
+
+def _validate_tts_settings(tts: dict[str, Any]) -> dict[str, Any]:
+    """Validated tts_settings (TTS messages, budget boost and notification options)."""
+    tts_get = tts.get
+    default_tts = _DEFAULT_TTS
+    _notification_title = str(
+        tts_get("notification_title")
+        or default_tts.get("notification_title")
+        or "Home Energy"
+    ).strip()
+    if not _notification_title:
+        _notification_title = "Home Energy"
+    tts_settings: dict[str, Any] = {}
+    for key, kind, default in _TTS_FIELDS:
+        if kind == "plain":
+            tts_settings[key] = tts_get(key, default)
+        elif kind == "bool":
+            tts_settings[key] = bool(tts_get(key, default))
+        elif kind == "str":
+            tts_settings[key] = str(tts_get(key, default) or "")
+        elif kind == "stripped":
+            tts_settings[key] = str(tts_get(key) or default or "").strip()
+        else:
+            # Placeholder keeps the key order; the value is computed below
+            tts_settings[key] = None
+    tts_settings["speed"] = _safe_float(tts_get("speed"), default_tts["speed"])
+    tts_settings["volume"] = _safe_float(tts_get("volume"), default_tts["volume"])
+    tts_settings["min_interval_seconds"] = max(1.0, min(60.0, _safe_float(tts_get("min_interval_seconds"), default_tts.get("min_interval_seconds", 3))))
+    tts_settings["budget_boost_multiplier"] = max(
+        1.0,
+        min(5.0, _safe_float(tts_get("budget_boost_multiplier"), default_tts.get("budget_boost_multiplier", 2.0))),
+    )
+    tts_settings["budget_boost_weekdays"] = _normalize_budget_boost_weekdays(
+        tts_get("budget_boost_weekdays", default_tts.get("budget_boost_weekdays", []))
+    )
+    tts_settings["budget_boost_window_start"] = _validate_budget_boost_announce_time(
+        tts_get("budget_boost_window_start")
+        or tts_get("budget_boost_announce_time"),
+        default_tts.get("budget_boost_window_start", "09:00"),
+    )
+    tts_settings["budget_boost_window_end"] = _validate_budget_boost_announce_time(
+        tts_get("budget_boost_window_end"),
+        default_tts.get("budget_boost_window_end", "21:00"),
+    )
+    tts_settings["budget_boost_repeat_minutes"] = max(
+        15,
+        min(720, _safe_int(tts_get("budget_boost_repeat_minutes"), default_tts.get("budget_boost_repeat_minutes", 120))),
+    )
+    tts_settings["budget_boost_minute_offset"] = max(
+        0,
+        min(59, _safe_int(tts_get("budget_boost_minute_offset"), default_tts.get("budget_boost_minute_offset", 0))),
+    )
+    tts_settings["budget_boost_announce_time"] = _validate_budget_boost_announce_time(
+        tts_get("budget_boost_announce_time"),
+        default_tts.get("budget_boost_announce_time", "09:00"),
+    )
+    tts_settings["budget_boost_announce_media_player"] = str(
+        tts_get("budget_boost_announce_media_player", default_tts.get("budget_boost_announce_media_player", "")) or ""
+    ).strip()
+    tts_settings["tts_default_media_player"] = (
+        str(tts_get("tts_default_media_player") or "").strip()
+        or str(tts_get("budget_boost_announce_media_player") or "").strip()
+        or str(default_tts.get("tts_default_media_player") or "").strip()
+    )
+    tts_settings["notify_person_toggle"] = bool(
+        tts_get(
+            "notify_person_toggle",
+            tts_get("notify_manual_toggle", default_tts.get("notify_person_toggle", True)),
+        )
+    )
+    tts_settings["notify_heater_auto"] = (
+        _coerce_bool(tts_get("notify_heater_auto"), default=True)
+        if "notify_heater_auto" in tts
+        else _coerce_bool(tts_get("notify_integration_auto", True), default=True)
+    )
+    tts_settings["notify_vent_auto"] = (
+        _coerce_bool(tts_get("notify_vent_auto"), default=True)
+        if "notify_vent_auto" in tts
+        else _coerce_bool(tts_get("notify_integration_auto", True), default=True)
+    )
+    tts_settings["notify_external_auto"] = bool(
+        tts_get(
+            "notify_external_auto",
+            tts_get("notify_manual_toggle", default_tts.get("notify_external_auto", True)),
+        )
+    )
+    tts_settings["notification_title"] = _notification_title
+    tts_settings["notify_toggle_title"] = str(
+        tts_get(
+            "notify_toggle_title",
+            tts_get("notify_manual_toggle_title", default_tts.get("notify_toggle_title", "")),
+        )
+        or ""
+    )
+    tts_settings["notify_toggle_msg"] = str(
+        tts_get(
+            "notify_toggle_msg",
+            tts_get("notify_manual_toggle_msg", default_tts.get("notify_toggle_msg", "")),
+        )
+        or ""
+    )
+    tts_settings["zone_health_check_enabled"] = _coerce_bool(
+        tts_get(
+            "zone_health_check_enabled",
+            default_tts.get("zone_health_check_enabled", True),
+        ),
+        default_tts.get("zone_health_check_enabled", True),
+    )
+    # Prefer days if present; migrate from hours if not
+    if tts_get("zone_health_history_days"):
+        tts_settings["zone_health_history_days"] = max(
+            1, min(3, int(tts_get("zone_health_history_days") or 0))
+        )
+    elif tts_get("zone_health_history_hours"):
+        # Migrate hours -> days: 24->1, 48->2, 72->3, else 3
+        tts_settings["zone_health_history_days"] = {24: 1, 48: 2, 72: 3, 96: 3}.get(
+            int(tts_get("zone_health_history_hours") or 0), 3
+        )
+    else:
+        tts_settings["zone_health_history_days"] = default_tts.get("zone_health_history_days", 3)
+    tts_settings["zone_health_reminder_hours"] = max(
+        1,
+        min(
+            24,
+            int(
+                tts_get(
+                    "zone_health_reminder_hours",
+                    default_tts.get("zone_health_reminder_hours", 1),
+                )
+                or 1
+            ),
+        ),
+    )
+    return tts_settings
+
+
+def _validate_power_enforcement(pe: dict[str, Any]) -> dict[str, Any]:
+    """Validated power_enforcement settings."""
+    pe_get = pe.get
+    default_pe = DEFAULT_CONFIG["energy"]["power_enforcement"]
+    return {
+        "enabled": bool(pe_get("enabled", default_pe["enabled"])),
+        "phase1_enabled": bool(pe_get("phase1_enabled", default_pe.get("phase1_enabled", True))),
+        "phase2_enabled": bool(pe_get("phase2_enabled", default_pe.get("phase2_enabled", True))),
+        "phase1_warning_count": max(1, int(pe_get("phase1_warning_count", default_pe["phase1_warning_count"]))),
+        "phase1_time_window_minutes": max(1, int(pe_get("phase1_time_window_minutes", default_pe["phase1_time_window_minutes"]))),
+        "phase1_volume_increment": max(1, min(20, int(pe_get("phase1_volume_increment", default_pe["phase1_volume_increment"])))),
+        "phase1_reset_minutes": max(1, int(pe_get("phase1_reset_minutes", default_pe["phase1_reset_minutes"]))),
+        "phase2_warning_count": max(1, int(pe_get("phase2_warning_count", default_pe["phase2_warning_count"]))),
+        "phase2_time_window_minutes": max(1, int(pe_get("phase2_time_window_minutes", default_pe["phase2_time_window_minutes"]))),
+        "phase2_reset_minutes": max(1, int(pe_get("phase2_reset_minutes", default_pe["phase2_reset_minutes"]))),
+        "phase2_cycle_delay_seconds": max(1, min(30, int(pe_get("phase2_cycle_delay_seconds", default_pe["phase2_cycle_delay_seconds"])))),
+        "phase2_max_volume": max(0, min(100, int(pe_get("phase2_max_volume", default_pe.get("phase2_max_volume", 100))))),
+        "room_kwh_intervals": _normalize_room_kwh_intervals(
+            pe_get("room_kwh_intervals", default_pe["room_kwh_intervals"])
+        ),
+        "home_kwh_limit": max(1, int(pe_get("home_kwh_limit", default_pe["home_kwh_limit"]))),
+        "rooms_enabled": pe_get("rooms_enabled", default_pe["rooms_enabled"]),
+    }
+
+
+def _validate_statistics_settings(stats: dict[str, Any]) -> dict[str, Any]:
+    """Validated statistics_settings."""
+    default_stats = DEFAULT_CONFIG["energy"]["statistics_settings"]
+    default_refresh = int(default_stats.get("statistics_refresh_seconds", 60))
+    return {
+        "billing_start_sensor": (stats.get("billing_start_sensor") or "").strip(),
+        "billing_end_sensor": (stats.get("billing_end_sensor") or "").strip(),
+        "current_usage_sensor": (stats.get("current_usage_sensor") or "").strip(),
+        "projected_usage_sensor": (stats.get("projected_usage_sensor") or "").strip(),
+        "kwh_cost_sensor": (stats.get("kwh_cost_sensor") or "").strip(),
+        "statistics_refresh_seconds": max(
+            15,
+            min(600, _safe_int(stats.get("statistics_refresh_seconds"), default_refresh)),
+        ),
+    }
+
+
+def _validate_efficiency_settings(es: Any) -> dict[str, Any]:
+    """Validated efficiency_settings (room rating weights and digest options)."""
+    default_eff = DEFAULT_CONFIG["energy"]["efficiency_settings"]
+    if not isinstance(es, dict):
+        es = {}
+    return {
+        "history_window_days": max(
+            1,
+            min(90, _safe_int(es.get("history_window_days"), default_eff["history_window_days"])),
+        ),
+        "engagement_lookback_days": max(
+            1,
+            min(
+                30,
+                _safe_int(es.get("engagement_lookback_days"), default_eff["engagement_lookback_days"]),
+            ),
+        ),
+        "compliance_tolerance": max(
+            1.0,
+            min(1.5, _safe_float(es.get("compliance_tolerance"), default_eff["compliance_tolerance"])),
+        ),
+        "warning_points_per_event": max(
+            0.25,
+            min(
+                25.0,
+                _safe_float(es.get("warning_points_per_event"), default_eff["warning_points_per_event"]),
+            ),
+        ),
+        "consumption_peer_multiplier": max(
+            0.5,
+            min(
+                5.0,
+                _safe_float(
+                    es.get("consumption_peer_multiplier"),
+                    default_eff["consumption_peer_multiplier"],
+                ),
+            ),
+        ),
+        "load_high_watts": max(
+            1.0,
+            min(5000.0, _safe_float(es.get("load_high_watts"), default_eff["load_high_watts"])),
+        ),
+        "load_penalty_per_high_hour": max(
+            0.0,
+            min(
+                50.0,
+                _safe_float(
+                    es.get("load_penalty_per_high_hour"),
+                    default_eff["load_penalty_per_high_hour"],
+                ),
+            ),
+        ),
+        "engagement_distinct_hours_target": max(
+            1,
+            min(
+                24,
+                _safe_int(
+                    es.get("engagement_distinct_hours_target"),
+                    default_eff["engagement_distinct_hours_target"],
+                ),
+            ),
+        ),
+        "engagement_hours_weight": max(
+            0.0,
+            min(100.0, _safe_float(es.get("engagement_hours_weight"), default_eff["engagement_hours_weight"])),
+        ),
+        "engagement_visits_weight": max(
+            0.0,
+            min(
+                100.0,
+                _safe_float(es.get("engagement_visits_weight"), default_eff["engagement_visits_weight"]),
+            ),
+        ),
+        "engagement_visits_daily_norm": max(
+            1.0,
+            min(
+                48.0,
+                _safe_float(
+                    es.get("engagement_visits_daily_norm"),
+                    default_eff["engagement_visits_daily_norm"],
+                ),
+            ),
+        ),
+        "engagement_max_visits_per_hour": max(
+            1,
+            min(
+                10,
+                _safe_int(
+                    es.get("engagement_max_visits_per_hour"),
+                    default_eff["engagement_max_visits_per_hour"],
+                ),
+            ),
+        ),
+        "efficiency_digest_enabled": _coerce_bool(
+            es.get("efficiency_digest_enabled", default_eff["efficiency_digest_enabled"]),
+            default_eff["efficiency_digest_enabled"],
+        ),
+        "efficiency_digest_time": _validate_budget_boost_announce_time(
+            es.get("efficiency_digest_time"),
+            str(default_eff["efficiency_digest_time"]),
+        ),
+        "efficiency_digest_title": str(
+            es.get("efficiency_digest_title") or default_eff["efficiency_digest_title"]
+        ),
+        "efficiency_digest_message": str(
+            es.get("efficiency_digest_message") or default_eff["efficiency_digest_message"]
+        ),
+    }
+
+
 class ConfigManager:
     """Manage Smart Dashboards configuration stored in JSON file."""
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the config manager."""
         self.hass = hass
-        self._config: dict[str, Any] = deepcopy(DEFAULT_CONFIG)
+        self._config: dict[str, Any] = _default_config()
         # Store data in HA's config directory (survives integration updates)
         self._data_dir = hass.config.path("smart_dashboards_data")
         self._config_path = self._data_path("config.json")
-        self._day_energy_data: dict[str, dict[str, float]] = {}
+        self._day_energy_data: dict[str, float] = {}  # tracking key -> Wh today
         self._last_reset_date: str | None = None
+        # Local date string for the energy hot path, cached until the next local midnight
+        self._today_cache: str | None = None
+        # Wall-clock window [from, until) in which _today_cache is still today's date
+        self._today_cache_from: float = 0.0
+        self._today_cache_until: float = 0.0
         self._event_counts_reset_date: str | None = None
+        self._event_counts_save_handle: asyncio.TimerHandle | None = None
+        self._config_save_handle: asyncio.TimerHandle | None = None
+        self._enforcement_save_handle: asyncio.TimerHandle | None = None
+        self._event_log_save_handle: asyncio.TimerHandle | None = None
         self._event_counts: dict[str, Any] = {
             "total_warnings": 0,
             "total_shutoffs": 0,
@@ -415,20 +1610,24 @@ class ConfigManager:
             "last_billing_start": "",
             "last_billing_end": "",
         }
-        self._last_power_update: dict[str, dict] = {}  # entity_id -> {watts, time}
         # Intraday history: minute-by-minute power readings for 24-hour charts
         # Structure: {entity_id: [(timestamp_minute, watts), ...]} - keeps last 1440 entries (24h)
-        self._intraday_history: dict[str, list] = {}
+        self._intraday_history: dict[str, deque] = {}
+        # Epoch minute and its local "%Y-%m-%d %H:%M" key; every entity records into the
+        # same bucket each poll, so the datetime + strftime runs once per minute
+        self._minute_key_epoch_minute: int = -1
+        self._minute_key: str = ""
 
         # Power enforcement tracking
-        # Structure: {room_id: {"warnings": [(timestamp, watts), ...], "phase": 0|1|2, "volume_offset": 0, "last_phase_change": timestamp, "kwh_alerts_sent": [5, 10, ...]}}
+        # Structure: {room_id: {"warnings": [(epoch_seconds, watts), ...], "phase": 0|1|2, "volume_offset": 0, "last_phase_change": timestamp, "kwh_alerts_sent": {5.0, 10.0, ...}}}
         self._enforcement_state: dict[str, dict] = {}
         self._home_kwh_alert_sent: bool = False  # Whether we've sent the home kWh alert today
         self._enforcement_reset_date: str | None = None
 
         # Event log: 24h warnings/shutoffs with TTS success/fail (for dashboard log modal)
-        self._event_log: list[dict[str, Any]] = []
         self._event_log_max_entries = 500
+        # Bounded: appends past the cap drop the oldest entry with no re-slicing
+        self._event_log: deque[dict[str, Any]] = deque(maxlen=self._event_log_max_entries)
         # Per-calendar-day archive for billing/statistics (full detail, longer retention)
         self._event_archive_days: dict[str, list[dict[str, Any]]] = {}
         # Statistics cache: pre-computed statistics for instant page load
@@ -436,6 +1635,17 @@ class ConfigManager:
         # Light automations JSON — in-memory cache invalidated by file mtime
         self._light_automations_cache: dict[str, Any] | None = None
         self._light_automations_mtime: float | None = None
+        # Derived from energy_config; rebuilt lazily after _invalidate_outlet_index()
+        self._outlets_cache: list[dict[str, Any]] | None = None
+        self._breakers_by_id: dict[str, dict[str, Any]] | None = None
+        self._breaker_outlets: dict[str, list[dict[str, Any]]] = {}
+        self._rooms_by_id: dict[str, dict[str, Any]] | None = None
+        self._room_energy_keys_cache: list[tuple[str, tuple[str, ...]]] | None = None
+        self._room_intraday_keys_cache: dict[str, tuple[str, ...]] | None = None
+        # path -> digest of the bytes last written; lets no-op saves skip the disk write
+        self._last_written_digest: dict[str, bytes] = {}
+        # Serializes async_update_energy's merge -> validate -> swap across its await
+        self._energy_update_lock = asyncio.Lock()
 
     def _ensure_data_dir(self) -> str:
         """Ensure data directory exists and return its path."""
@@ -448,6 +1658,26 @@ class ConfigManager:
         self._ensure_data_dir()
         return os.path.join(self._data_dir, filename)
 
+    async def _async_write_json_if_changed(self, path: str, data: Any) -> bool:
+        """Write data to path unless it serializes identical to the last write.
+
+        Serialization and the comparison run in the executor. Returns True if
+        the file was written.
+        """
+        written, digest = await self.hass.async_add_executor_job(
+            _write_json_file_if_changed, path, data, self._last_written_digest.get(path)
+        )
+        if written and digest is not None:
+            self._last_written_digest[path] = digest
+        return written
+
+    async def _async_write_json_batch(self, items: list[tuple[str, Any]]) -> None:
+        """Serialize (path, data) items and write the changed ones in one executor job."""
+        written = await self.hass.async_add_executor_job(
+            _write_json_files, items, self._last_written_digest
+        )
+        self._last_written_digest.update(written)
+
     @property
     def config(self) -> dict[str, Any]:
         """Return the current configuration."""
@@ -579,14 +1809,10 @@ class ConfigManager:
         now = dt_util.now()
         base = 0.0
         use_boost = True
-        room_dict: dict[str, Any] | None = None
-        for r in self.energy_config.get("rooms", []):
-            rid = r.get("id", r["name"].lower().replace(" ", "_"))
-            if rid == room_id:
-                base = float(r.get("kwh_budget", 5) or 0)
-                use_boost = r.get("kwh_budget_use_boost", True) is not False
-                room_dict = r
-                break
+        room_dict = self._room_by_id(room_id)
+        if room_dict is not None:
+            base = float(room_dict.get("kwh_budget", 5) or 0)
+            use_boost = room_dict.get("kwh_budget_use_boost", True) is not False
         tts = self.energy_config.get("tts_settings") or {}
         eff = self.effective_kwh_budget_for_moment(
             base, now, tts, use_room_boost=use_boost, room=room_dict
@@ -644,54 +1870,115 @@ class ConfigManager:
 
     async def async_load(self) -> None:
         """Load configuration from file."""
+        # Re-derive the cached local date/minute (time zone may have changed since the last load)
+        self._today_cache_until = 0.0
+        self._minute_key_epoch_minute = -1
         # Migrate old data files from config root to integration data directory
         await self._migrate_data_files()
 
+        paths = [
+            self._config_path,
+            self._data_path("energy_tracking.json"),
+            self._data_path("event_counts.json"),
+            self._data_path(self.EVENT_LOG_FILE),
+            self._data_path(self.EVENT_ARCHIVE_FILE),
+            self._data_path("daily_totals.json"),
+            self._data_path("billing_history.json"),
+            self._data_path("enforcement_state.json"),
+            self._data_path("intraday_history.json"),
+            self._data_path("statistics_cache.json"),
+        ]
+
+        def _load_and_merge() -> list[Any]:
+            loaded, *stores = _load_json_files(paths)
+            # Merging walks every room/outlet; keep that CPU off the event loop too
+            merged = self._merge_with_defaults(loaded) if loaded is not None else None
+            energy = loaded.get("energy") if isinstance(loaded, dict) else None
+            has_legacy = isinstance(energy, dict) and "stove_safety" in energy
+            return [merged, has_legacy, *stores]
+
+        # Every data file is read in a single executor round-trip (missing, unreadable
+        # or corrupt files come back as None)
+        (
+            merged_config,
+            has_legacy_stove,
+            tracking_data,
+            counts_data,
+            event_log_data,
+            event_archive_data,
+            daily_totals_data,
+            billing_data,
+            enforcement_data,
+            intraday_data,
+            statistics_data,
+        ) = await self.hass.async_add_executor_job(_load_and_merge)
         try:
-            loaded_config = await self.hass.async_add_executor_job(
-                _load_json_file, self._config_path
-            )
-            if loaded_config is not None:
-                self._config = self._merge_with_defaults(loaded_config)
+            if merged_config is not None:
+                self._config = merged_config
+                self._invalidate_outlet_index()
                 _LOGGER.info("Loaded Smart Dashboards configuration")
+                if has_legacy_stove:
+                    # Persist the migrated rooms once; the merged config no longer carries
+                    # stove_safety, so later loads skip the migration entirely
+                    await self.async_save()
             else:
                 _LOGGER.info("No config file found, using defaults")
                 await self.async_save()
         except (json.JSONDecodeError, IOError) as err:
             _LOGGER.error("Error loading config: %s", err)
-            self._config = deepcopy(DEFAULT_CONFIG)
+            self._config = _default_config()
+            self._invalidate_outlet_index()
 
         # Load day energy tracking data
-        await self._async_load_energy_tracking()
+        await self._async_load_energy_tracking(tracking_data)
         # Load event counts
-        await self._async_load_event_counts()
+        await self._async_load_event_counts(counts_data)
         # Load event log
-        await self._async_load_event_log()
-        await self._async_load_event_archive()
+        self._load_event_log(event_log_data)
+        self._load_event_archive(event_archive_data)
         # Load daily totals history
-        await self._async_load_daily_totals()
+        self._load_daily_totals(daily_totals_data)
         # Load billing history
-        await self._async_load_billing_history()
+        self._load_billing_history(billing_data)
         # Load enforcement state
-        await self._async_load_enforcement_state()
+        self._load_enforcement_state(enforcement_data)
         # Load intraday history
-        await self._async_load_intraday_history()
+        self._load_intraday_history(intraday_data)
         # Load statistics cache for instant page load
-        await self._async_load_statistics_cache()
+        self._load_statistics_cache(statistics_data)
 
     async def async_save(self) -> None:
         """Save configuration to file."""
         try:
-            await self.hass.async_add_executor_job(
-                _write_json_file, self._config_path, self._config
-            )
-            _LOGGER.debug("Saved Smart Dashboards configuration")
+            if await self._async_write_json_if_changed(self._config_path, self._config):
+                _LOGGER.debug("Saved Smart Dashboards configuration")
         except IOError as err:
             _LOGGER.error("Error saving config: %s", err)
 
+    def _schedule_config_save(self) -> None:
+        """Save the config after a short delay, coalescing rapid successive edits."""
+        if self._config_save_handle is None:
+            self._config_save_handle = self.hass.loop.call_later(
+                _CONFIG_SAVE_DELAY, self._flush_config_save
+            )
+
+    @callback
+    def _flush_config_save(self) -> None:
+        """Timer callback: write the config as it stands now."""
+        self._config_save_handle = None
+        self.hass.async_create_task(self.async_save())
+
+    def _cancel_config_save(self) -> bool:
+        """Cancel a pending debounced config save; return True if one was pending."""
+        if self._config_save_handle is None:
+            return False
+        self._config_save_handle.cancel()
+        self._config_save_handle = None
+        return True
+
     def _merge_with_defaults(self, loaded: dict[str, Any]) -> dict[str, Any]:
         """Merge loaded config with defaults to ensure all keys exist."""
-        result = deepcopy(DEFAULT_CONFIG)
+        result = _default_config()
 
         # Merge energy config
         if "energy" in loaded:
@@ -702,8 +1989,12 @@ class ConfigManager:
             legacy_stove = energy.get("stove_safety", {})
             if legacy_stove and any(v for v in legacy_stove.values() if v):
                 for room in result["energy"]["rooms"]:
-                    outlets = room.get("outlets", [])
-                    stove_outlet = next((o for o in outlets if o.get("type") == "stove"), None)
+                    # First outlet of each type, in one pass (stove and microwave are both needed)
+                    first_by_type: dict[Any, dict[str, Any]] = {}
+                    for o in room.get("outlets", []):
+                        if isinstance(o, dict) and o.get("type") in ("stove", "microwave"):
+                            first_by_type.setdefault(o["type"], o)
+                    stove_outlet = first_by_type.get("stove")
                     if stove_outlet:
                         stove_outlet["plug1_entity"] = stove_outlet.get("plug1_entity") or legacy_stove.get("stove_plug_entity")
                         stove_outlet["plug1_switch"] = stove_outlet.get("plug1_switch") or legacy_stove.get("stove_plug_switch")
@@ -716,21 +2007,20 @@ class ConfigManager:
                             room["media_player"] = legacy_stove["media_player"]
                         if legacy_stove.get("volume") is not None:
                             room["volume"] = float(legacy_stove["volume"])
-                        if legacy_stove.get("microwave_plug_entity"):
-                            for mw in outlets:
-                                if mw.get("type") == "microwave":
-                                    mw["plug1_entity"] = mw.get("plug1_entity") or legacy_stove.get("microwave_plug_entity")
-                                    mw["microwave_power_threshold"] = mw.get("microwave_power_threshold", legacy_stove.get("microwave_power_threshold", 50))
-                                    break
+                        mw = first_by_type.get("microwave")
+                        if mw is not None and legacy_stove.get("microwave_plug_entity"):
+                            mw["plug1_entity"] = mw.get("plug1_entity") or legacy_stove.get("microwave_plug_entity")
+                            mw["microwave_power_threshold"] = mw.get("microwave_power_threshold", legacy_stove.get("microwave_power_threshold", 50))
                         break
             if "tts_settings" in energy:
                 result["energy"]["tts_settings"].update(energy["tts_settings"])
             if "power_enforcement" in energy:
                 pe_loaded = energy["power_enforcement"]
                 pe_result = result["energy"]["power_enforcement"]
-                for k in list(pe_result.keys()) + list(pe_loaded.keys()):
-                    if k in pe_loaded and pe_loaded[k] is not None:
-                        pe_result[k] = pe_loaded[k]
+                # Only loaded keys can change a value; new keys append in loaded order
+                for k, v in pe_loaded.items():
+                    if v is not None:
+                        pe_result[k] = v
             if "statistics_settings" in energy:
                 ss_result = result["energy"]["statistics_settings"]
                 for k, v in energy["statistics_settings"].items():
@@ -748,1237 +2038,151 @@ class ConfigManager:
                 es_result = result["energy"]["efficiency_settings"]
                 ev = energy["efficiency_settings"]
                 if isinstance(ev, dict):
-                    for k in list(es_result.keys()):
-                        if k not in ev:
-                            continue
-                        val = ev[k]
-                        if val is None:
-                            continue
-                        if isinstance(es_result[k], bool):
-                            es_result[k] = _coerce_bool(val, es_result[k])
-                        elif isinstance(es_result[k], (int, float)) and not isinstance(
-                            es_result[k], bool
-                        ):
-                            try:
-                                if isinstance(es_result[k], int):
-                                    es_result[k] = int(float(val))
-                                else:
-                                    es_result[k] = float(val)
-                            except (TypeError, ValueError):
-                                pass
-                        elif isinstance(es_result[k], str):
-                            es_result[k] = str(val).strip()
-
-        return result
-
-    async def async_update_energy(self, energy_config: dict[str, Any]) -> None:
-        """Update energy configuration."""
-        existing = self._config.get("energy", {})
-        default_energy = DEFAULT_CONFIG["energy"]
-        merged = dict(energy_config)
-        # Preserve existing values when incoming config omits or sends empty structured fields
-        for key in (
-            "power_enforcement",
-            "statistics_settings",
-            "efficiency_settings",
-            "breaker_lines",
-            "breaker_panel_size",
-        ):
-            val = merged.get(key)
-            if key not in merged:
-                merged[key] = existing.get(key, default_energy.get(key))
-            elif isinstance(val, (list, dict)) and len(val or []) == 0:
-                merged[key] = existing.get(key, default_energy.get(key))
-        self._config["energy"] = self._validate_energy_config(merged)
-        await self.async_prune_kwh_alerts_sent_for_current_config()
-        await self.async_save()
-        monitor = self.hass.data.get(DOMAIN, {}).get("energy_monitor")
-        if monitor is not None and hasattr(monitor, "refresh_presence_listeners"):
-            monitor.refresh_presence_listeners()
-        # Also refresh door/window/lock/contact listeners so newly added or
-        # removed sensors take effect immediately. Without this the listeners
-        # stayed bound to the pre-save entity set until integration reload
-        # (audit BUG 1).
-        if monitor is not None and hasattr(monitor, "refresh_door_window_listeners"):
-            monitor.refresh_door_window_listeners()
-        # Refresh zone health listeners so changes to presence_person_entity
-        # take effect immediately for zone health monitoring.
-        if monitor is not None and hasattr(monitor, "refresh_zone_health_listeners"):
-            monitor.refresh_zone_health_listeners()
-
-    async def async_prune_kwh_alerts_sent_for_current_config(self) -> None:
-        """Drop kwh_alerts_sent entries that are no longer eligible tiers after config change."""
-        self._ensure_enforcement_state_for_today()
-        now = dt_util.now()
-        tts = self.energy_config.get("tts_settings") or {}
-        pe = self.energy_config.get("power_enforcement") or {}
-        raw_iv = pe.get("room_kwh_intervals", [5, 10, 15, 20])
-        norm_iv = _normalize_room_kwh_intervals(raw_iv)
-        changed = False
-        for room in self.energy_config.get("rooms", []):
-            room_id = room.get("id", room["name"].lower().replace(" ", "_"))
-            base_b = float(room.get("kwh_budget", 5) or 0)
-            use_boost = room.get("kwh_budget_use_boost", True) is not False
-            allowed = {
-                _room_kwh_alert_threshold_key(x)
-                for x in self.filter_room_kwh_intervals_for_alerts(
-                    norm_iv,
-                    base_b,
-                    now,
-                    tts,
-                    use_room_budget_boost=use_boost,
-                    room=room,
-                )
-            }
-            state = self.get_enforcement_state(room_id)
-            sent = list(state.get("kwh_alerts_sent") or [])
-            new_sent = [
-                x for x in sent if _room_kwh_alert_threshold_key(x) in allowed
-            ]
-            if new_sent != sent:
-                state["kwh_alerts_sent"] = new_sent
-                changed = True
-        if changed:
-            await self._async_save_enforcement_state()
-
-    def _validate_energy_config(self, config: dict[str, Any]) -> dict[str, Any]:
-        """Validate and sanitize energy configuration."""
-        validated = deepcopy(DEFAULT_CONFIG["energy"])
-
-        # Validate rooms
-        rooms = config.get("rooms", [])
-        validated["rooms"] = []
-        for room in rooms:
-            if isinstance(room, dict) and room.get("name"):
-                validated_room = {
-                    "id": room.get("id", room["name"].lower().replace(" ", "_")),
-                    "name": room["name"],
-                    "area_id": room.get("area_id"),
-                    "media_player": room.get("media_player"),
-                    "threshold": int(room.get("threshold", 0)),
-                    "kwh_budget": max(0, float(room.get("kwh_budget", 5))),
-                    "kwh_budget_use_boost": (
-                        room.get("kwh_budget_use_boost", True) is not False
-                    ),
-                    "volume": float(room.get("volume", 0.7)),
-                    "responsive_light_warnings": bool(room.get("responsive_light_warnings", False)),
-                    "responsive_light_color": _validate_rgb(room.get("responsive_light_color")),
-                    "responsive_light_temp": max(2000, min(6500, _safe_int(room.get("responsive_light_temp"), 6500))),
-                    "responsive_light_interval": max(0.1, min(10.0, _safe_float(room.get("responsive_light_interval"), 1.5))),
-                    "presence_person_entity": _normalize_presence_person_entity(
-                        room.get("presence_person_entity")
-                    ),
-                    "presence_zone_entities": _normalize_presence_zone_entities(
-                        room.get("presence_zone_entities")
-                    ),
-                    "room_icon": _normalize_room_icon(room.get("room_icon")),
-                    "room_budget_boost_weekdays": _normalize_room_budget_boost_weekdays(
-                        room.get("room_budget_boost_weekdays")
-                    ),
-                    "outlets": [],
-                }
-                ch_at = _normalize_room_budget_boost_changed_at(
-                    room.get("room_budget_boost_weekdays_changed_at")
-                )
-                if ch_at is not None:
-                    validated_room["room_budget_boost_weekdays_changed_at"] = ch_at
-                raw_mult = room.get("room_budget_boost_multiplier")
-                if raw_mult is not None:
-                    try:
-                        mult_val = float(raw_mult)
-                        if 1.0 <= mult_val <= 5.0:
-                            validated_room["room_budget_boost_multiplier"] = round(mult_val, 1)
-                    except (TypeError, ValueError):
-                        pass
-                for outlet in room.get("outlets", []):
-                    if isinstance(outlet, dict) and outlet.get("name"):
-                        outlet_type = _normalize_outlet_type(outlet.get("type", "outlet"))
-                        if outlet_type not in (
-                            "outlet", "single_outlet", "stove", "microwave",
-                            "minisplit", "light", "fridge", "vent", "wall_heater",
-                            "door", "window",
-                        ):
-                            outlet_type = "outlet"
-                        item = {
-                            "name": outlet["name"],
-                            "type": outlet_type,
-                            "plug1_entity": outlet.get("plug1_entity"),
-                            "threshold": int(outlet.get("threshold", 0)),
-                        }
-                        if outlet_type == "outlet":
-                            item["plug2_entity"] = outlet.get("plug2_entity")
-                            item["plug1_switch"] = outlet.get("plug1_switch")
-                            item["plug2_switch"] = outlet.get("plug2_switch")
-                            item["plug1_shutoff"] = int(outlet.get("plug1_shutoff", 0))
-                            item["plug2_shutoff"] = int(outlet.get("plug2_shutoff", 0))
-                        elif outlet_type == "stove":
-                            item["plug2_entity"] = None
-                            item["plug1_switch"] = outlet.get("plug1_switch")
-                            item["plug2_switch"] = None
-                            item["plug1_shutoff"] = 0
-                            item["plug2_shutoff"] = 0
-                            item["stove_safety_enabled"] = outlet.get("stove_safety_enabled", True)
-                            item["stove_power_threshold"] = int(outlet.get("stove_power_threshold", 100))
-                            item["stove_off_debounce_seconds"] = max(0, min(60, int(outlet.get("stove_off_debounce_seconds", 10))))
-                            item["stove_on_debounce_seconds"] = max(0, min(60, int(outlet.get("stove_on_debounce_seconds", 0))))
-                            item["cooking_time_minutes"] = int(outlet.get("cooking_time_minutes", 15))
-                            item["final_warning_seconds"] = int(outlet.get("final_warning_seconds", 30))
-                            item["timer_start_window_seconds"] = max(1, min(120, int(outlet.get("timer_start_window_seconds", 10))))
-                            item["stove_timer_tts_interval_seconds"] = max(
-                                0,
-                                min(3600, int(outlet.get("stove_timer_tts_interval_seconds", 0))),
-                            )
-                            item["presence_sensor"] = outlet.get("presence_sensor")
-                        elif outlet_type == "microwave":
-                            item["plug2_entity"] = None
-                            item["plug1_switch"] = None
-                            item["plug2_switch"] = None
-                            item["plug1_shutoff"] = 0
-                            item["plug2_shutoff"] = 0
-                            item["microwave_safety_enabled"] = outlet.get("microwave_safety_enabled", False)
-                            item["microwave_power_threshold"] = int(outlet.get("microwave_power_threshold", 50))
-                        elif outlet_type == "light":
-                            item["plug1_entity"] = None
-                            item["plug2_entity"] = None
-                            item["plug1_switch"] = None
-                            item["plug2_switch"] = None
-                            item["plug1_shutoff"] = 0
-                            item["plug2_shutoff"] = 0
-                            item["switch_entity"] = outlet.get("switch_entity")
-                            light_ents = outlet.get("light_entities")
-                            # Support list of {entity_id, watts, wrgb, tuya} or legacy list of entity_id strings
-                            if isinstance(light_ents, list):
-                                by_entity = {}
-                                for e in light_ents:
-                                    eid = None
-                                    w = 0
-                                    if isinstance(e, dict) and e.get("entity_id", "").startswith("light."):
-                                        eid = e["entity_id"]
-                                        w = max(0, int(e.get("watts", 0)))
-                                        wrgb = bool(e.get("wrgb", False))
-                                        tuya = bool(e.get("tuya", False)) and wrgb
-                                        by_entity[eid] = {"entity_id": eid, "watts": w, "wrgb": wrgb, "tuya": tuya}
-                                    elif isinstance(e, str) and e.strip().startswith("light."):
-                                        eid, w = e.strip(), 0
-                                        if eid:
-                                            by_entity[eid] = {"entity_id": eid, "watts": w, "wrgb": False, "tuya": False}
-                                item["light_entities"] = list(by_entity.values())
-                            elif isinstance(light_ents, str):
-                                item["light_entities"] = [
-                                    {"entity_id": e.strip(), "watts": 0, "wrgb": False, "tuya": False}
-                                    for e in light_ents.split(",") if e.strip().startswith("light.")
-                                ]
-                            else:
-                                item["light_entities"] = []
-                            ps, pse = _power_source_for_light_vent(outlet)
-                            item["power_source"] = ps
-                            item["power_sensor_entity"] = pse
-                        elif outlet_type == "minisplit":
-                            item["plug2_entity"] = None
-                            item["plug1_switch"] = outlet.get("plug1_switch")
-                            item["plug2_switch"] = None
-                            item["plug1_shutoff"] = int(outlet.get("plug1_shutoff", 0))
-                            item["plug2_shutoff"] = 0
-                            item["minisplit_enforcement_off_seconds"] = max(
-                                30,
-                                min(600, int(outlet.get("minisplit_enforcement_off_seconds", 60))),
-                            )
-                            item["minisplit_enforcement_min_watts"] = max(
-                                0,
-                                min(2000, int(outlet.get("minisplit_enforcement_min_watts", 0))),
-                            )
-                        elif outlet_type in ("single_outlet", "fridge"):
-                            item["plug2_entity"] = None
-                            item["plug1_switch"] = outlet.get("plug1_switch")
-                            item["plug2_switch"] = None
-                            item["plug1_shutoff"] = int(outlet.get("plug1_shutoff", 0))
-                            item["plug2_shutoff"] = 0
-                        elif outlet_type in ("vent", "wall_heater"):
-                            item["plug1_entity"] = None
-                            item["plug2_entity"] = None
-                            item["plug1_switch"] = None
-                            item["plug2_switch"] = None
-                            item["plug1_shutoff"] = 0
-                            item["plug2_shutoff"] = 0
-                            item["switch_entity"] = outlet.get("switch_entity")
-                            item["watts_when_on"] = max(0, int(outlet.get("watts_when_on", 0)))
-                            ps, pse = _power_source_for_light_vent(outlet)
-                            item["power_source"] = ps
-                            item["power_sensor_entity"] = pse
-                            if outlet_type == "vent":
-                                item["vent_automation_enabled"] = bool(
-                                    outlet.get("vent_automation_enabled")
-                                )
-                                item["vent_presence_entity"] = _normalize_binary_sensor_entity(
-                                    outlet.get("vent_presence_entity")
-                                )
-                                item["vent_on_debounce_seconds"] = max(
-                                    0, min(600, int(outlet.get("vent_on_debounce_seconds", 30)))
-                                )
-                                item["vent_off_after_no_presence_seconds"] = max(
-                                    10,
-                                    min(
-                                        86400,
-                                        int(outlet.get("vent_off_after_no_presence_seconds", 300)),
-                                    ),
-                                )
-                            else:
-                                item["heater_automation_enabled"] = bool(
-                                    outlet.get("heater_automation_enabled")
-                                )
-                                te = str(outlet.get("heater_temperature_entity") or "").strip()
-                                item["heater_temperature_entity"] = (
-                                    te if te.startswith("sensor.") else None
-                                )
-                                item["heater_on_below_temperature"] = max(
-                                    -60.0,
-                                    min(160.0, float(outlet.get("heater_on_below_temperature", 65))),
-                                )
-                                hct = outlet.get("heater_comfort_temperature")
-                                if hct is None or hct == "":
-                                    item["heater_comfort_temperature"] = None
-                                else:
-                                    try:
-                                        item["heater_comfort_temperature"] = max(
-                                            -60.0,
-                                            min(160.0, float(hct)),
-                                        )
-                                    except (TypeError, ValueError):
-                                        item["heater_comfort_temperature"] = None
-                                item["heater_stay_on_minutes"] = max(
-                                    1, min(240, int(outlet.get("heater_stay_on_minutes", 5)))
-                                )
-                                item["heater_presence_optional_enabled"] = bool(
-                                    outlet.get("heater_presence_optional_enabled")
-                                )
-                                item["heater_presence_turn_on_enabled"] = bool(
-                                    outlet.get("heater_presence_turn_on_enabled")
-                                )
-                                item["heater_presence_entity"] = _normalize_binary_sensor_entity(
-                                    outlet.get("heater_presence_entity")
-                                )
-                                item["heater_presence_cooldown_seconds"] = max(
-                                    0,
-                                    min(7200, int(outlet.get("heater_presence_cooldown_seconds", 60))),
-                                )
-                                item["heater_cold_boost_enabled"] = bool(
-                                    outlet.get("heater_cold_boost_enabled")
-                                )
-                                item["heater_cold_boost_outdoor_at_or_below"] = max(
-                                    -60.0,
-                                    min(
-                                        160.0,
-                                        float(outlet.get("heater_cold_boost_outdoor_at_or_below", 32)),
-                                    ),
-                                )
-                                item["heater_cold_boost_on_below_temperature"] = max(
-                                    -60.0,
-                                    min(
-                                        160.0,
-                                        float(
-                                            outlet.get(
-                                                "heater_cold_boost_on_below_temperature",
-                                                outlet.get("heater_on_below_temperature", 65),
-                                            )
-                                        ),
-                                    ),
-                                )
-                                cbct = outlet.get("heater_cold_boost_comfort_temperature")
-                                if cbct is None or cbct == "":
-                                    item["heater_cold_boost_comfort_temperature"] = None
-                                else:
-                                    try:
-                                        item["heater_cold_boost_comfort_temperature"] = max(
-                                            -60.0,
-                                            min(160.0, float(cbct)),
-                                        )
-                                    except (TypeError, ValueError):
-                                        item["heater_cold_boost_comfort_temperature"] = None
-                                # Smart heater optimization settings
-                                item["heater_weather_entity"] = str(
-                                    outlet.get("heater_weather_entity") or ""
-                                ).strip()
-                                item["heater_optimization_enabled"] = bool(
-                                    outlet.get("heater_optimization_enabled", True)
-                                )
-                                item["heater_hysteresis_band"] = max(
-                                    0.0,
-                                    min(10.0, float(outlet.get("heater_hysteresis_band", 2.0) or 2.0)),
-                                )
-                                item["heater_duty_cycle_enabled"] = bool(
-                                    outlet.get("heater_duty_cycle_enabled")
-                                )
-                                item["heater_duty_on_minutes"] = max(
-                                    1,
-                                    min(30, int(outlet.get("heater_duty_on_minutes", 5) or 5)),
-                                )
-                                item["heater_duty_off_minutes"] = max(
-                                    1,
-                                    min(15, int(outlet.get("heater_duty_off_minutes", 2) or 2)),
-                                )
-                                item["heater_duty_comfort_margin"] = max(
-                                    0.0,
-                                    min(10.0, float(outlet.get("heater_duty_comfort_margin", 1.0) or 1.0)),
-                                )
-                                item["heater_power_aware_enabled"] = bool(
-                                    outlet.get("heater_power_aware_enabled")
-                                )
-                                item["heater_power_threshold_watts"] = max(
-                                    100,
-                                    min(5000, int(outlet.get("heater_power_threshold_watts", 500) or 500)),
-                                )
-                                item["heater_learning_enabled"] = bool(
-                                    outlet.get("heater_learning_enabled", True)
-                                )
-                                item["heater_preheat_minutes"] = max(
-                                    0,
-                                    min(120, int(outlet.get("heater_preheat_minutes", 30) or 30)),
-                                )
-                                door_ent = str(outlet.get("heater_door_sensor_entity") or "").strip()
-                                item["heater_door_sensor_entity"] = door_ent if door_ent.startswith("binary_sensor.") else None
-                                window_ent = str(outlet.get("heater_window_sensor_entity") or "").strip()
-                                item["heater_window_sensor_entity"] = window_ent if window_ent.startswith("binary_sensor.") else None
-                        elif outlet_type == "door":
-                            item["plug1_entity"] = None
-                            item["plug2_entity"] = None
-                            item["plug1_switch"] = None
-                            item["plug2_switch"] = None
-                            item["plug1_shutoff"] = 0
-                            item["plug2_shutoff"] = 0
-                            contact_ent = str(outlet.get("contact_sensor") or "").strip()
-                            item["contact_sensor"] = contact_ent if contact_ent.startswith("binary_sensor.") else None
-                            contact_batt = str(outlet.get("contact_sensor_battery") or "").strip()
-                            item["contact_sensor_battery"] = contact_batt if contact_batt.startswith("sensor.") else None
-                            lock_ent = str(outlet.get("lock_entity") or "").strip()
-                            item["lock_entity"] = lock_ent if lock_ent.startswith("lock.") else None
-                            lock_batt = str(outlet.get("lock_battery") or "").strip()
-                            item["lock_battery"] = lock_batt if lock_batt.startswith("sensor.") else None
-                            presence_ent = str(outlet.get("presence_sensor") or "").strip()
-                            item["presence_sensor"] = presence_ent if presence_ent.startswith("binary_sensor.") else None
-                            presence_batt = str(outlet.get("presence_sensor_battery") or "").strip()
-                            item["presence_sensor_battery"] = presence_batt if presence_batt.startswith("sensor.") else None
-                            door_subtype = str(outlet.get("door_subtype") or "standard").strip().lower()
-                            item["door_subtype"] = door_subtype if door_subtype in ("standard", "closet", "entrance") else "standard"
-                            item["announce_open_close"] = bool(outlet.get("announce_open_close", True))
-                            item["announce_lock"] = bool(outlet.get("announce_lock", True))
-                            item["announce_presence"] = bool(outlet.get("announce_presence", False))
-                            reminder_mode = str(outlet.get("reminder_mode") or "none").strip().lower()
-                            item["reminder_mode"] = reminder_mode if reminder_mode in ("none", "open", "unlocked") else "none"
-                            item["reminder_interval"] = max(15, min(120, int(outlet.get("reminder_interval", 30))))
-                            item["auto_lock_enabled"] = bool(outlet.get("auto_lock_enabled", False))
-                            item["auto_lock_delay"] = max(1, min(600, int(outlet.get("auto_lock_delay", 10))))
-                            item["open_turn_on_entities"] = _validate_entity_list(outlet.get("open_turn_on_entities"), ("light.", "switch."))
-                            item["close_turn_off_entities"] = _validate_entity_list(outlet.get("close_turn_off_entities"), ("light.", "switch."))
-                            item["unlock_turn_on_entities"] = _validate_entity_list(outlet.get("unlock_turn_on_entities"), ("light.", "switch."))
-                            item["lock_turn_off_entities"] = _validate_entity_list(outlet.get("lock_turn_off_entities"), ("light.", "switch."))
-                            item["presence_on_entities"] = _validate_entity_list(outlet.get("presence_on_entities"), ("light.", "switch."))
-                            item["presence_off_entities"] = _validate_entity_list(outlet.get("presence_off_entities"), ("light.", "switch."))
-                            item["presence_on_hold_secs"] = max(0, min(10, int(outlet.get("presence_on_hold_secs", 0))))
-                            item["presence_off_hold_secs"] = max(0, min(10, int(outlet.get("presence_off_hold_secs", 0))))
-                        elif outlet_type == "window":
-                            item["plug1_entity"] = None
-                            item["plug2_entity"] = None
-                            item["plug1_switch"] = None
-                            item["plug2_switch"] = None
-                            item["plug1_shutoff"] = 0
-                            item["plug2_shutoff"] = 0
-                            contact_ent = str(outlet.get("contact_sensor") or "").strip()
-                            item["contact_sensor"] = contact_ent if contact_ent.startswith("binary_sensor.") else None
-                            contact_batt = str(outlet.get("contact_sensor_battery") or "").strip()
-                            item["contact_sensor_battery"] = contact_batt if contact_batt.startswith("sensor.") else None
-                            presence_ent = str(outlet.get("presence_sensor") or "").strip()
-                            item["presence_sensor"] = presence_ent if presence_ent.startswith("binary_sensor.") else None
-                            presence_batt = str(outlet.get("presence_sensor_battery") or "").strip()
-                            item["presence_sensor_battery"] = presence_batt if presence_batt.startswith("sensor.") else None
-                            item["announce_open_close"] = bool(outlet.get("announce_open_close", True))
-                            item["announce_presence"] = bool(outlet.get("announce_presence", False))
-                            item["reminder_enabled"] = bool(outlet.get("reminder_enabled", False))
-                            item["reminder_interval"] = max(15, min(120, int(outlet.get("reminder_interval", 30))))
-                            item["open_turn_on_entities"] = _validate_entity_list(outlet.get("open_turn_on_entities"), ("light.", "switch."))
-                            item["close_turn_off_entities"] = _validate_entity_list(outlet.get("close_turn_off_entities"), ("light.", "switch."))
-                            item["presence_on_entities"] = _validate_entity_list(outlet.get("presence_on_entities"), ("light.", "switch."))
-                            item["presence_off_entities"] = _validate_entity_list(outlet.get("presence_off_entities"), ("light.", "switch."))
-                            item["presence_on_hold_secs"] = max(0, min(10, int(outlet.get("presence_on_hold_secs", 0))))
-                            item["presence_off_hold_secs"] = max(0, min(10, int(outlet.get("presence_off_hold_secs", 0))))
-                        else:
-                            item["plug2_entity"] = None
-                            item["plug1_switch"] = None
-                            item["plug2_switch"] = None
-                            item["plug1_shutoff"] = 0
-                            item["plug2_shutoff"] = 0
-                        if outlet_type == "outlet":
-                            item["presence_auto_off_plug1"] = bool(
-                                outlet.get("presence_auto_off_plug1")
-                            )
-                            item["presence_auto_off_plug2"] = bool(
-                                outlet.get("presence_auto_off_plug2")
-                            )
-                            item["keep_on_plug1"] = bool(outlet.get("keep_on_plug1"))
-                            item["keep_on_plug2"] = bool(outlet.get("keep_on_plug2"))
-                        else:
-                            item["presence_auto_off"] = bool(outlet.get("presence_auto_off"))
-                            item["keep_on"] = bool(outlet.get("keep_on"))
-                        validated_room["outlets"].append(item)
-                validated["rooms"].append(validated_room)
-
-        # Validate breaker panel size
-        panel_size = _safe_int(config.get("breaker_panel_size"), 20)
-        validated["breaker_panel_size"] = max(2, min(40, panel_size)) if panel_size and panel_size % 2 == 0 else 20
-
-        # Validate breaker lines
-        breaker_lines = config.get("breaker_lines", [])
-        validated["breaker_lines"] = []
-        for breaker in breaker_lines:
-            if isinstance(breaker, dict) and breaker.get("name"):
-                validated_breaker = {
-                    "id": breaker.get("id", breaker["name"].lower().replace(" ", "_")),
-                    "name": breaker["name"],
-                    "number": max(1, min(validated["breaker_panel_size"], int(breaker.get("number", 1)))),
-                    "color": breaker.get("color", "#03a9f4"),
-                    "max_load": int(breaker.get("max_load", 2400)),
-                    "threshold": int(breaker.get("threshold", 0)),
-                    "outlet_ids": breaker.get("outlet_ids", []),  # List of outlet identifiers
-                }
-                validated["breaker_lines"].append(validated_breaker)
-
-        # Validate TTS settings
-        tts = config.get("tts_settings", {})
-        default_tts = DEFAULT_CONFIG["energy"]["tts_settings"]
-        _notification_title = str(
-            tts.get("notification_title")
-            or default_tts.get("notification_title")
-            or "Home Energy"
-        ).strip()
-        if not _notification_title:
-            _notification_title = "Home Energy"
-        validated["tts_settings"] = {
-            "language": tts.get("language", default_tts["language"]),
-            "speed": _safe_float(tts.get("speed"), default_tts["speed"]),
-            "volume": _safe_float(tts.get("volume"), default_tts["volume"]),
-            "prefix": tts.get("prefix", default_tts["prefix"]),
-            "room_warn_msg": tts.get("room_warn_msg", default_tts["room_warn_msg"]),
-            "outlet_warn_msg": tts.get("outlet_warn_msg", default_tts["outlet_warn_msg"]),
-            "shutoff_msg": tts.get("shutoff_msg", default_tts["shutoff_msg"]),
-            "breaker_warn_msg": tts.get("breaker_warn_msg", default_tts["breaker_warn_msg"]),
-            "breaker_shutoff_msg": tts.get("breaker_shutoff_msg", default_tts["breaker_shutoff_msg"]),
-            "stove_on_msg": tts.get("stove_on_msg", default_tts["stove_on_msg"]),
-            "stove_off_msg": tts.get("stove_off_msg", default_tts["stove_off_msg"]),
-            "stove_timer_started_msg": tts.get("stove_timer_started_msg", default_tts["stove_timer_started_msg"]),
-            "stove_15min_warn_msg": tts.get("stove_15min_warn_msg", default_tts["stove_15min_warn_msg"]),
-            "stove_30sec_warn_msg": tts.get("stove_30sec_warn_msg", default_tts["stove_30sec_warn_msg"]),
-            "stove_auto_off_msg": tts.get("stove_auto_off_msg", default_tts["stove_auto_off_msg"]),
-            "microwave_cut_power_msg": tts.get("microwave_cut_power_msg", default_tts["microwave_cut_power_msg"]),
-            "microwave_restore_power_msg": tts.get("microwave_restore_power_msg", default_tts["microwave_restore_power_msg"]),
-            "phase1_warn_msg": tts.get("phase1_warn_msg", default_tts.get("phase1_warn_msg", "")),
-            "phase2_warn_msg": tts.get("phase2_warn_msg", default_tts.get("phase2_warn_msg", "")),
-            "phase2_after_msg": tts.get("phase2_after_msg", default_tts.get("phase2_after_msg", "")),
-            "minisplit_phase2_warn_msg": tts.get(
-                "minisplit_phase2_warn_msg",
-                default_tts.get("minisplit_phase2_warn_msg", ""),
-            ),
-            "minisplit_phase2_after_msg": tts.get(
-                "minisplit_phase2_after_msg",
-                default_tts.get("minisplit_phase2_after_msg", ""),
-            ),
-            "minisplit_phase2_restore_msg": tts.get(
-                "minisplit_phase2_restore_msg",
-                default_tts.get("minisplit_phase2_restore_msg", ""),
-            ),
-            "phase_reset_msg": tts.get("phase_reset_msg", default_tts.get("phase_reset_msg", "")),
-            "room_kwh_warn_msg": tts.get("room_kwh_warn_msg", default_tts.get("room_kwh_warn_msg", "")),
-            "home_kwh_warn_msg": tts.get("home_kwh_warn_msg", default_tts.get("home_kwh_warn_msg", "")),
-            "budget_exceeded_msg": tts.get("budget_exceeded_msg", default_tts.get("budget_exceeded_msg", "")),
-            "min_interval_seconds": max(1.0, min(60.0, _safe_float(tts.get("min_interval_seconds"), default_tts.get("min_interval_seconds", 3)))),
-            "budget_boost_enabled": bool(tts.get("budget_boost_enabled", default_tts.get("budget_boost_enabled", False))),
-            "budget_boost_multiplier": max(
-                1.0,
-                min(5.0, _safe_float(tts.get("budget_boost_multiplier"), default_tts.get("budget_boost_multiplier", 2.0))),
-            ),
-            "budget_boost_weekdays": _normalize_budget_boost_weekdays(
-                tts.get("budget_boost_weekdays", default_tts.get("budget_boost_weekdays", []))
-            ),
-            "budget_boost_window_start": _validate_budget_boost_announce_time(
-                tts.get("budget_boost_window_start")
-                or tts.get("budget_boost_announce_time"),
-                default_tts.get("budget_boost_window_start", "09:00"),
-            ),
-            "budget_boost_window_end": _validate_budget_boost_announce_time(
-                tts.get("budget_boost_window_end"),
-                default_tts.get("budget_boost_window_end", "21:00"),
-            ),
-            "budget_boost_repeat_minutes": max(
-                15,
-                min(720, _safe_int(tts.get("budget_boost_repeat_minutes"), default_tts.get("budget_boost_repeat_minutes", 120))),
-            ),
-            "budget_boost_minute_offset": max(
-                0,
-                min(59, _safe_int(tts.get("budget_boost_minute_offset"), default_tts.get("budget_boost_minute_offset", 0))),
-            ),
-            "budget_boost_announce_time": _validate_budget_boost_announce_time(
-                tts.get("budget_boost_announce_time"),
-                default_tts.get("budget_boost_announce_time", "09:00"),
-            ),
-            "budget_boost_announce_media_player": str(
-                tts.get("budget_boost_announce_media_player", default_tts.get("budget_boost_announce_media_player", "")) or ""
-            ).strip(),
-            "tts_default_media_player": (
-                str(tts.get("tts_default_media_player") or "").strip()
-                or str(tts.get("budget_boost_announce_media_player") or "").strip()
-                or str(default_tts.get("tts_default_media_player") or "").strip()
-            ),
-            "budget_boost_scheduled_msg": tts.get(
-                "budget_boost_scheduled_msg",
-                default_tts.get("budget_boost_scheduled_msg", ""),
-            ),
-            "phase1_warn_msg_boost_day": tts.get(
-                "phase1_warn_msg_boost_day",
-                default_tts.get("phase1_warn_msg_boost_day", ""),
-            ),
-            "stove_timer_progress_msg": tts.get(
-                "stove_timer_progress_msg",
-                default_tts.get("stove_timer_progress_msg", ""),
-            ),
-            "heater_automation_tts_enabled": bool(
-                tts.get(
-                    "heater_automation_tts_enabled",
-                    default_tts.get("heater_automation_tts_enabled", False),
-                )
-            ),
-            "vent_automation_tts_enabled": bool(
-                tts.get(
-                    "vent_automation_tts_enabled",
-                    default_tts.get("vent_automation_tts_enabled", False),
-                )
-            ),
-            "heater_automation_on_msg": tts.get(
-                "heater_automation_on_msg",
-                default_tts.get("heater_automation_on_msg", ""),
-            ),
-            "vent_automation_on_msg": tts.get(
-                "vent_automation_on_msg",
-                default_tts.get("vent_automation_on_msg", ""),
-            ),
-            "room_warn_tts_enabled": bool(
-                tts.get(
-                    "room_warn_tts_enabled",
-                    default_tts.get("room_warn_tts_enabled", True),
-                )
-            ),
-            "outlet_warn_tts_enabled": bool(
-                tts.get(
-                    "outlet_warn_tts_enabled",
-                    default_tts.get("outlet_warn_tts_enabled", True),
-                )
-            ),
-            "budget_exceeded_tts_enabled": bool(
-                tts.get(
-                    "budget_exceeded_tts_enabled",
-                    default_tts.get("budget_exceeded_tts_enabled", True),
-                )
-            ),
-            "budget_boost_scheduled_tts_enabled": bool(
-                tts.get(
-                    "budget_boost_scheduled_tts_enabled",
-                    default_tts.get("budget_boost_scheduled_tts_enabled", True),
-                )
-            ),
-            "phase1_warn_boost_day_tts_enabled": bool(
-                tts.get(
-                    "phase1_warn_boost_day_tts_enabled",
-                    default_tts.get("phase1_warn_boost_day_tts_enabled", True),
-                )
-            ),
-            "shutoff_tts_enabled": bool(
-                tts.get(
-                    "shutoff_tts_enabled",
-                    default_tts.get("shutoff_tts_enabled", True),
-                )
-            ),
-            "stove_on_tts_enabled": bool(
-                tts.get(
-                    "stove_on_tts_enabled",
-                    default_tts.get("stove_on_tts_enabled", True),
-                )
-            ),
-            "stove_off_tts_enabled": bool(
-                tts.get(
-                    "stove_off_tts_enabled",
-                    default_tts.get("stove_off_tts_enabled", True),
-                )
-            ),
-            "stove_timer_started_tts_enabled": bool(
-                tts.get(
-                    "stove_timer_started_tts_enabled",
-                    default_tts.get("stove_timer_started_tts_enabled", True),
-                )
-            ),
-            "stove_timer_progress_tts_enabled": bool(
-                tts.get(
-                    "stove_timer_progress_tts_enabled",
-                    default_tts.get("stove_timer_progress_tts_enabled", True),
-                )
-            ),
-            "stove_15min_warn_tts_enabled": bool(
-                tts.get(
-                    "stove_15min_warn_tts_enabled",
-                    default_tts.get("stove_15min_warn_tts_enabled", True),
-                )
-            ),
-            "stove_30sec_warn_tts_enabled": bool(
-                tts.get(
-                    "stove_30sec_warn_tts_enabled",
-                    default_tts.get("stove_30sec_warn_tts_enabled", True),
-                )
-            ),
-            "stove_auto_off_tts_enabled": bool(
-                tts.get(
-                    "stove_auto_off_tts_enabled",
-                    default_tts.get("stove_auto_off_tts_enabled", True),
-                )
-            ),
-            "phase1_warn_tts_enabled": bool(
-                tts.get(
-                    "phase1_warn_tts_enabled",
-                    default_tts.get("phase1_warn_tts_enabled", True),
-                )
-            ),
-            "phase2_warn_tts_enabled": bool(
-                tts.get(
-                    "phase2_warn_tts_enabled",
-                    default_tts.get("phase2_warn_tts_enabled", True),
-                )
-            ),
-            "phase2_after_tts_enabled": bool(
-                tts.get(
-                    "phase2_after_tts_enabled",
-                    default_tts.get("phase2_after_tts_enabled", True),
-                )
-            ),
-            "minisplit_phase2_warn_tts_enabled": bool(
-                tts.get(
-                    "minisplit_phase2_warn_tts_enabled",
-                    default_tts.get("minisplit_phase2_warn_tts_enabled", True),
-                )
-            ),
-            "minisplit_phase2_after_tts_enabled": bool(
-                tts.get(
-                    "minisplit_phase2_after_tts_enabled",
-                    default_tts.get("minisplit_phase2_after_tts_enabled", True),
-                )
-            ),
-            "minisplit_phase2_restore_tts_enabled": bool(
-                tts.get(
-                    "minisplit_phase2_restore_tts_enabled",
-                    default_tts.get("minisplit_phase2_restore_tts_enabled", True),
-                )
-            ),
-            "phase_reset_tts_enabled": bool(
-                tts.get(
-                    "phase_reset_tts_enabled",
-                    default_tts.get("phase_reset_tts_enabled", True),
-                )
-            ),
-            "room_kwh_warn_tts_enabled": bool(
-                tts.get(
-                    "room_kwh_warn_tts_enabled",
-                    default_tts.get("room_kwh_warn_tts_enabled", True),
-                )
-            ),
-            "home_kwh_warn_tts_enabled": bool(
-                tts.get(
-                    "home_kwh_warn_tts_enabled",
-                    default_tts.get("home_kwh_warn_tts_enabled", True),
-                )
-            ),
-            "notifications_enabled": bool(
-                tts.get(
-                    "notifications_enabled",
-                    default_tts.get("notifications_enabled", False),
-                )
-            ),
-            "notify_room_budget_hit": bool(
-                tts.get(
-                    "notify_room_budget_hit",
-                    default_tts.get("notify_room_budget_hit", True),
-                )
-            ),
-            "notify_room_boost_days": bool(
-                tts.get(
-                    "notify_room_boost_days",
-                    default_tts.get("notify_room_boost_days", True),
-                )
-            ),
-            "notify_enforcement_phase_change": bool(
-                tts.get(
-                    "notify_enforcement_phase_change",
-                    default_tts.get("notify_enforcement_phase_change", True),
-                )
-            ),
-            "notify_ac_auto_off": bool(
-                tts.get(
-                    "notify_ac_auto_off",
-                    default_tts.get("notify_ac_auto_off", True),
-                )
-            ),
-            "notify_ac_auto_on": bool(
-                tts.get(
-                    "notify_ac_auto_on",
-                    default_tts.get("notify_ac_auto_on", True),
-                )
-            ),
-            "notify_person_toggle": bool(
-                tts.get(
-                    "notify_person_toggle",
-                    tts.get("notify_manual_toggle", default_tts.get("notify_person_toggle", True)),
-                )
-            ),
-            "notify_integration_auto": bool(
-                tts.get(
-                    "notify_integration_auto",
-                    default_tts.get("notify_integration_auto", True),
-                )
-            ),
-            "notify_heater_auto": (
-                _coerce_bool(tts.get("notify_heater_auto"), default=True)
-                if "notify_heater_auto" in tts
-                else _coerce_bool(tts.get("notify_integration_auto", True), default=True)
-            ),
-            "notify_vent_auto": (
-                _coerce_bool(tts.get("notify_vent_auto"), default=True)
-                if "notify_vent_auto" in tts
-                else _coerce_bool(tts.get("notify_integration_auto", True), default=True)
-            ),
-            "notify_external_auto": bool(
-                tts.get(
-                    "notify_external_auto",
-                    tts.get("notify_manual_toggle", default_tts.get("notify_external_auto", True)),
-                )
-            ),
-            "notification_title": _notification_title,
-            "notify_budget_hit_title": str(
-                tts.get(
-                    "notify_budget_hit_title",
-                    default_tts.get("notify_budget_hit_title", ""),
-                )
-                or ""
-            ),
-            "notify_budget_hit_msg": str(
-                tts.get(
-                    "notify_budget_hit_msg",
-                    default_tts.get("notify_budget_hit_msg", ""),
-                )
-                or ""
-            ),
-            "notify_room_boost_days_title": str(
-                tts.get(
-                    "notify_room_boost_days_title",
-                    default_tts.get("notify_room_boost_days_title", ""),
-                )
-                or ""
-            ),
-            "notify_room_boost_days_msg": str(
-                tts.get(
-                    "notify_room_boost_days_msg",
-                    default_tts.get("notify_room_boost_days_msg", ""),
-                )
-                or ""
-            ),
-            "notify_enforcement_phase1_title": str(
-                tts.get(
-                    "notify_enforcement_phase1_title",
-                    default_tts.get("notify_enforcement_phase1_title", ""),
-                )
-                or ""
-            ),
-            "notify_enforcement_phase1_msg": str(
-                tts.get(
-                    "notify_enforcement_phase1_msg",
-                    default_tts.get("notify_enforcement_phase1_msg", ""),
-                )
-                or ""
-            ),
-            "notify_enforcement_phase2_title": str(
-                tts.get(
-                    "notify_enforcement_phase2_title",
-                    default_tts.get("notify_enforcement_phase2_title", ""),
-                )
-                or ""
-            ),
-            "notify_enforcement_phase2_msg": str(
-                tts.get(
-                    "notify_enforcement_phase2_msg",
-                    default_tts.get("notify_enforcement_phase2_msg", ""),
-                )
-                or ""
-            ),
-            "notify_ac_auto_off_title": str(
-                tts.get(
-                    "notify_ac_auto_off_title",
-                    default_tts.get("notify_ac_auto_off_title", ""),
-                )
-                or ""
-            ),
-            "notify_ac_auto_off_msg": str(
-                tts.get(
-                    "notify_ac_auto_off_msg",
-                    default_tts.get("notify_ac_auto_off_msg", ""),
-                )
-                or ""
-            ),
-            "notify_ac_auto_on_title": str(
-                tts.get(
-                    "notify_ac_auto_on_title",
-                    default_tts.get("notify_ac_auto_on_title", ""),
-                )
-                or ""
-            ),
-            "notify_ac_auto_on_msg": str(
-                tts.get(
-                    "notify_ac_auto_on_msg",
-                    default_tts.get("notify_ac_auto_on_msg", ""),
-                )
-                or ""
-            ),
-            "notify_toggle_title": str(
-                tts.get(
-                    "notify_toggle_title",
-                    tts.get("notify_manual_toggle_title", default_tts.get("notify_toggle_title", "")),
-                )
-                or ""
-            ),
-            "notify_toggle_msg": str(
-                tts.get(
-                    "notify_toggle_msg",
-                    tts.get("notify_manual_toggle_msg", default_tts.get("notify_toggle_msg", "")),
-                )
-                or ""
-            ),
-            "notify_heater_auto_on_title": str(
-                tts.get(
-                    "notify_heater_auto_on_title",
-                    default_tts.get("notify_heater_auto_on_title", ""),
-                )
-                or ""
-            ),
-            "notify_heater_auto_on_msg": str(
-                tts.get(
-                    "notify_heater_auto_on_msg",
-                    default_tts.get("notify_heater_auto_on_msg", ""),
-                )
-                or ""
-            ),
-            "notify_heater_auto_off_title": str(
-                tts.get(
-                    "notify_heater_auto_off_title",
-                    default_tts.get("notify_heater_auto_off_title", ""),
-                )
-                or ""
-            ),
-            "notify_heater_auto_off_msg": str(
-                tts.get(
-                    "notify_heater_auto_off_msg",
-                    default_tts.get("notify_heater_auto_off_msg", ""),
-                )
-                or ""
-            ),
-            "notify_vent_auto_on_title": str(
-                tts.get(
-                    "notify_vent_auto_on_title",
-                    default_tts.get("notify_vent_auto_on_title", ""),
-                )
-                or ""
-            ),
-            "notify_vent_auto_on_msg": str(
-                tts.get(
-                    "notify_vent_auto_on_msg",
-                    default_tts.get("notify_vent_auto_on_msg", ""),
-                )
-                or ""
-            ),
-            "notify_vent_auto_off_title": str(
-                tts.get(
-                    "notify_vent_auto_off_title",
-                    default_tts.get("notify_vent_auto_off_title", ""),
-                )
-                or ""
-            ),
-            "notify_vent_auto_off_msg": str(
-                tts.get(
-                    "notify_vent_auto_off_msg",
-                    default_tts.get("notify_vent_auto_off_msg", ""),
-                )
-                or ""
-            ),
-            "zone_health_check_enabled": _coerce_bool(
-                tts.get(
-                    "zone_health_check_enabled",
-                    default_tts.get("zone_health_check_enabled", True),
-                ),
-                default_tts.get("zone_health_check_enabled", True),
-            ),
-            "zone_health_history_days": (
-                lambda: (
-                    # Prefer days if present; migrate from hours if not
-                    max(1, min(3, int(tts.get("zone_health_history_days") or 0)))
-                    if tts.get("zone_health_history_days")
-                    else (
-                        # Migrate hours -> days: 24->1, 48->2, 72->3, else 3
-                        {24: 1, 48: 2, 72: 3, 96: 3}.get(
-                            int(tts.get("zone_health_history_hours") or 0), 3
-                        )
-                        if tts.get("zone_health_history_hours")
-                        else default_tts.get("zone_health_history_days", 3)
-                    )
-                )
-            )(),
-            "zone_health_reminder_hours": max(
-                1,
-                min(
-                    24,
-                    int(
-                        tts.get(
-                            "zone_health_reminder_hours",
-                            default_tts.get("zone_health_reminder_hours", 1),
-                        )
-                        or 1
-                    ),
-                ),
-            ),
-            "zone_health_notification_msg": str(
-                tts.get(
-                    "zone_health_notification_msg",
-                    default_tts.get(
-                        "zone_health_notification_msg",
-                        "Hi {name}, your Home Assistant Companion app location doesn't appear to be set up correctly. Zone-based presence isn't working.",
-                    ),
-                )
-                or ""
-            ),
-            "zone_health_reminder_tts_msg": str(
-                tts.get(
-                    "zone_health_reminder_tts_msg",
-                    default_tts.get(
-                        "zone_health_reminder_tts_msg",
-                        "{name}, your zone-based location setup needs attention. Please check your Companion app settings.",
-                    ),
+                    for k, kind in _EFFICIENCY_MERGE_FIELDS:
+                        val = ev.get(k)
+                        if val is None:
+                            continue
+                        if kind == "bool":
+                            es_result[k] = _coerce_bool(val, es_result[k])
+                        elif kind == "str":
+                            es_result[k] = str(val).strip()
+                        else:
+                            try:
+                                es_result[k] = int(float(val)) if kind == "int" else float(val)
+                            except (TypeError, ValueError):
+                                pass
+
+        return result
+
+    async def async_update_energy(self, energy_config: dict[str, Any]) -> None:
+        """Update energy configuration."""
+        # Validation awaits the executor; without the lock an overlapping update would
+        # merge against the config this one is about to replace, and the last job to
+        # finish would win
+        async with self._energy_update_lock:
+            existing = self._config.get("energy", {})
+            default_energy = DEFAULT_CONFIG["energy"]
+            merged = dict(energy_config)
+            # Preserve existing values when incoming config omits or sends empty structured fields
+            for key in (
+                "power_enforcement",
+                "statistics_settings",
+                "efficiency_settings",
+                "breaker_lines",
+                "breaker_panel_size",
+            ):
+                val = merged.get(key)
+                if key not in merged:
+                    merged[key] = existing.get(key, default_energy.get(key))
+                elif isinstance(val, (list, dict)) and len(val or []) == 0:
+                    merged[key] = existing.get(key, default_energy.get(key))
+            # Pure CPU over the whole room/outlet tree; large configs would stall the loop
+            validated = await self.hass.async_add_executor_job(
+                self._validate_energy_config, merged
+            )
+            # The panel re-posts the full config on every save; an identical result needs
+            # no write, index rebuild or listener re-registration
+            if validated == self._config.get("energy"):
+                return
+            self._config["energy"] = validated
+        self._invalidate_outlet_index()
+        await self.async_prune_kwh_alerts_sent_for_current_config()
+        self._schedule_config_save()
+        monitor = self.hass.data.get(DOMAIN, {}).get("energy_monitor")
+        if monitor is not None and hasattr(monitor, "refresh_presence_listeners"):
+            monitor.refresh_presence_listeners()
+        # Also refresh door/window/lock/contact listeners so newly added or
+        # removed sensors take effect immediately. Without this the listeners
+        # stayed bound to the pre-save entity set until integration reload
+        # (audit BUG 1).
+        if monitor is not None and hasattr(monitor, "refresh_door_window_listeners"):
+            monitor.refresh_door_window_listeners()
+        # Refresh zone health listeners so changes to presence_person_entity
+        # take effect immediately for zone health monitoring.
+        if monitor is not None and hasattr(monitor, "refresh_zone_health_listeners"):
+            monitor.refresh_zone_health_listeners()
+
+    async def async_prune_kwh_alerts_sent_for_current_config(self) -> None:
+        """Drop kwh_alerts_sent entries that are no longer eligible tiers after config change."""
+        self._ensure_enforcement_state_for_today()
+        now = dt_util.now()
+        tts = self.energy_config.get("tts_settings") or {}
+        pe = self.energy_config.get("power_enforcement") or {}
+        raw_iv = pe.get("room_kwh_intervals", [5, 10, 15, 20])
+        norm_iv = _normalize_room_kwh_intervals(raw_iv)
+        changed = False
+        for room in self.energy_config.get("rooms", []):
+            room_id = room.get("id", _slugify(room["name"]))
+            base_b = float(room.get("kwh_budget", 5) or 0)
+            use_boost = room.get("kwh_budget_use_boost", True) is not False
+            allowed = {
+                _room_kwh_alert_threshold_key(x)
+                for x in self.filter_room_kwh_intervals_for_alerts(
+                    norm_iv,
+                    base_b,
+                    now,
+                    tts,
+                    use_room_budget_boost=use_boost,
+                    room=room,
                 )
-                or ""
-            ),
-            # Door / window / presence / battery TTS (persisted; used by energy_monitor door-window automation)
-            "door_tts_enabled": bool(
-                tts.get("door_tts_enabled", default_tts.get("door_tts_enabled", True))
-            ),
-            "window_tts_enabled": bool(
-                tts.get("window_tts_enabled", default_tts.get("window_tts_enabled", True))
-            ),
-            "presence_tts_enabled": bool(
-                tts.get("presence_tts_enabled", default_tts.get("presence_tts_enabled", True))
-            ),
-            "battery_tts_enabled": bool(
-                tts.get("battery_tts_enabled", default_tts.get("battery_tts_enabled", True))
-            ),
-            "door_opened_msg": str(
-                tts.get("door_opened_msg") or default_tts.get("door_opened_msg") or ""
-            ).strip(),
-            "door_closed_msg": str(
-                tts.get("door_closed_msg") or default_tts.get("door_closed_msg") or ""
-            ).strip(),
-            "door_locked_msg": str(
-                tts.get("door_locked_msg") or default_tts.get("door_locked_msg") or ""
-            ).strip(),
-            "door_unlocked_msg": str(
-                tts.get("door_unlocked_msg") or default_tts.get("door_unlocked_msg") or ""
-            ).strip(),
-            "door_still_open_msg": str(
-                tts.get("door_still_open_msg") or default_tts.get("door_still_open_msg") or ""
-            ).strip(),
-            "door_still_unlocked_msg": str(
-                tts.get("door_still_unlocked_msg") or default_tts.get("door_still_unlocked_msg") or ""
-            ).strip(),
-            "window_opened_msg": str(
-                tts.get("window_opened_msg") or default_tts.get("window_opened_msg") or ""
-            ).strip(),
-            "window_closed_msg": str(
-                tts.get("window_closed_msg") or default_tts.get("window_closed_msg") or ""
-            ).strip(),
-            "window_still_open_msg": str(
-                tts.get("window_still_open_msg") or default_tts.get("window_still_open_msg") or ""
-            ).strip(),
-            "presence_detected_msg": str(
-                tts.get("presence_detected_msg") or default_tts.get("presence_detected_msg") or ""
-            ).strip(),
-            "presence_cleared_msg": str(
-                tts.get("presence_cleared_msg") or default_tts.get("presence_cleared_msg") or ""
-            ).strip(),
-            "battery_low_msg": str(
-                tts.get("battery_low_msg") or default_tts.get("battery_low_msg") or ""
-            ).strip(),
-            "battery_replaced_msg": str(
-                tts.get("battery_replaced_msg") or default_tts.get("battery_replaced_msg") or ""
-            ).strip(),
-        }
+            }
+            state = self.get_enforcement_state(room_id)
+            sent = state["kwh_alerts_sent"]
+            if not sent <= allowed:
+                state["kwh_alerts_sent"] = sent & allowed
+                changed = True
+        if changed:
+            self._schedule_enforcement_state_save()
 
-        # Validate power enforcement settings
-        pe = config.get("power_enforcement", {})
-        default_pe = DEFAULT_CONFIG["energy"]["power_enforcement"]
-        validated["power_enforcement"] = {
-            "enabled": bool(pe.get("enabled", default_pe["enabled"])),
-            "phase1_enabled": bool(pe.get("phase1_enabled", default_pe.get("phase1_enabled", True))),
-            "phase2_enabled": bool(pe.get("phase2_enabled", default_pe.get("phase2_enabled", True))),
-            "phase1_warning_count": max(1, int(pe.get("phase1_warning_count", default_pe["phase1_warning_count"]))),
-            "phase1_time_window_minutes": max(1, int(pe.get("phase1_time_window_minutes", default_pe["phase1_time_window_minutes"]))),
-            "phase1_volume_increment": max(1, min(20, int(pe.get("phase1_volume_increment", default_pe["phase1_volume_increment"])))),
-            "phase1_reset_minutes": max(1, int(pe.get("phase1_reset_minutes", default_pe["phase1_reset_minutes"]))),
-            "phase2_warning_count": max(1, int(pe.get("phase2_warning_count", default_pe["phase2_warning_count"]))),
-            "phase2_time_window_minutes": max(1, int(pe.get("phase2_time_window_minutes", default_pe["phase2_time_window_minutes"]))),
-            "phase2_reset_minutes": max(1, int(pe.get("phase2_reset_minutes", default_pe["phase2_reset_minutes"]))),
-            "phase2_cycle_delay_seconds": max(1, min(30, int(pe.get("phase2_cycle_delay_seconds", default_pe["phase2_cycle_delay_seconds"])))),
-            "phase2_max_volume": max(0, min(100, int(pe.get("phase2_max_volume", default_pe.get("phase2_max_volume", 100))))),
-            "room_kwh_intervals": _normalize_room_kwh_intervals(
-                pe.get("room_kwh_intervals", default_pe["room_kwh_intervals"])
-            ),
-            "home_kwh_limit": max(1, int(pe.get("home_kwh_limit", default_pe["home_kwh_limit"]))),
-            "rooms_enabled": pe.get("rooms_enabled", default_pe["rooms_enabled"]),
-        }
+    def _validate_energy_config(self, config: dict[str, Any]) -> dict[str, Any]:
+        """Validate and sanitize energy configuration."""
+        # Every section is rebuilt below; fromkeys only fixes the key order
+        validated: dict[str, Any] = dict.fromkeys(DEFAULT_CONFIG["energy"])
 
-        # Validate statistics settings
-        stats = config.get("statistics_settings", {})
-        default_stats = DEFAULT_CONFIG["energy"]["statistics_settings"]
-        default_refresh = int(default_stats.get("statistics_refresh_seconds", 60))
-        validated["statistics_settings"] = {
-            "billing_start_sensor": (stats.get("billing_start_sensor") or "").strip(),
-            "billing_end_sensor": (stats.get("billing_end_sensor") or "").strip(),
-            "current_usage_sensor": (stats.get("current_usage_sensor") or "").strip(),
-            "projected_usage_sensor": (stats.get("projected_usage_sensor") or "").strip(),
-            "kwh_cost_sensor": (stats.get("kwh_cost_sensor") or "").strip(),
-            "statistics_refresh_seconds": max(
-                15,
-                min(600, _safe_int(stats.get("statistics_refresh_seconds"), default_refresh)),
-            ),
-        }
+        # Validate rooms
+        validated["rooms"] = [
+            validated_room
+            for validated_room in map(_validate_room, config.get("rooms", []))
+            if validated_room is not None
+        ]
 
-        default_eff = DEFAULT_CONFIG["energy"]["efficiency_settings"]
-        es = config.get("efficiency_settings", {})
-        if not isinstance(es, dict):
-            es = {}
-        validated["efficiency_settings"] = {
-            "history_window_days": max(
-                1,
-                min(90, _safe_int(es.get("history_window_days"), default_eff["history_window_days"])),
-            ),
-            "engagement_lookback_days": max(
-                1,
-                min(
-                    30,
-                    _safe_int(es.get("engagement_lookback_days"), default_eff["engagement_lookback_days"]),
-                ),
-            ),
-            "compliance_tolerance": max(
-                1.0,
-                min(1.5, _safe_float(es.get("compliance_tolerance"), default_eff["compliance_tolerance"])),
-            ),
-            "warning_points_per_event": max(
-                0.25,
-                min(
-                    25.0,
-                    _safe_float(es.get("warning_points_per_event"), default_eff["warning_points_per_event"]),
-                ),
-            ),
-            "consumption_peer_multiplier": max(
-                0.5,
-                min(
-                    5.0,
-                    _safe_float(
-                        es.get("consumption_peer_multiplier"),
-                        default_eff["consumption_peer_multiplier"],
-                    ),
-                ),
-            ),
-            "load_high_watts": max(
-                1.0,
-                min(5000.0, _safe_float(es.get("load_high_watts"), default_eff["load_high_watts"])),
-            ),
-            "load_penalty_per_high_hour": max(
-                0.0,
-                min(
-                    50.0,
-                    _safe_float(
-                        es.get("load_penalty_per_high_hour"),
-                        default_eff["load_penalty_per_high_hour"],
-                    ),
-                ),
-            ),
-            "engagement_distinct_hours_target": max(
-                1,
-                min(
-                    24,
-                    _safe_int(
-                        es.get("engagement_distinct_hours_target"),
-                        default_eff["engagement_distinct_hours_target"],
-                    ),
-                ),
-            ),
-            "engagement_hours_weight": max(
-                0.0,
-                min(100.0, _safe_float(es.get("engagement_hours_weight"), default_eff["engagement_hours_weight"])),
-            ),
-            "engagement_visits_weight": max(
-                0.0,
-                min(
-                    100.0,
-                    _safe_float(es.get("engagement_visits_weight"), default_eff["engagement_visits_weight"]),
-                ),
-            ),
-            "engagement_visits_daily_norm": max(
-                1.0,
-                min(
-                    48.0,
-                    _safe_float(
-                        es.get("engagement_visits_daily_norm"),
-                        default_eff["engagement_visits_daily_norm"],
-                    ),
-                ),
-            ),
-            "engagement_max_visits_per_hour": max(
-                1,
-                min(
-                    10,
-                    _safe_int(
-                        es.get("engagement_max_visits_per_hour"),
-                        default_eff["engagement_max_visits_per_hour"],
-                    ),
-                ),
-            ),
-            "efficiency_digest_enabled": _coerce_bool(
-                es.get("efficiency_digest_enabled", default_eff["efficiency_digest_enabled"]),
-                default_eff["efficiency_digest_enabled"],
-            ),
-            "efficiency_digest_time": _validate_budget_boost_announce_time(
-                es.get("efficiency_digest_time"),
-                str(default_eff["efficiency_digest_time"]),
-            ),
-            "efficiency_digest_title": str(
-                es.get("efficiency_digest_title") or default_eff["efficiency_digest_title"]
-            ),
-            "efficiency_digest_message": str(
-                es.get("efficiency_digest_message") or default_eff["efficiency_digest_message"]
-            ),
-        }
+        # Validate breaker panel size
+        panel_size = _safe_int(config.get("breaker_panel_size"), 20)
+        panel_size = max(2, min(40, panel_size)) if panel_size and panel_size % 2 == 0 else 20
+        validated["breaker_panel_size"] = panel_size
 
+        # Validate breaker lines
+        validated["breaker_lines"] = [
+            _validate_breaker(breaker, panel_size)
+            for breaker in config.get("breaker_lines", [])
+            if isinstance(breaker, dict) and breaker.get("name")
+        ]
+
+        validated["tts_settings"] = _validate_tts_settings(config.get("tts_settings", {}))
+        validated["power_enforcement"] = _validate_power_enforcement(
+            config.get("power_enforcement", {})
+        )
+        validated["statistics_settings"] = _validate_statistics_settings(
+            config.get("statistics_settings", {})
+        )
+        validated["efficiency_settings"] = _validate_efficiency_settings(
+            config.get("efficiency_settings", {})
+        )
         return validated
 
     # Day energy tracking
-    async def _async_load_energy_tracking(self) -> None:
-        """Load day energy tracking data."""
-        tracking_path = self._data_path("energy_tracking.json")
+    async def _async_load_energy_tracking(self, data: dict | None) -> None:
+        """Apply day energy tracking data read by async_load."""
         try:
-            data = await self.hass.async_add_executor_job(
-                _load_json_file, tracking_path
-            )
             if data is not None:
-                self._day_energy_data = data.get("outlets", {})
+                outlets = data.get("outlets") or {}
+                # Flatten legacy {"energy": wh} buckets to plain floats
+                self._day_energy_data = {
+                    k: _safe_float(v.get("energy") if isinstance(v, dict) else v, 0.0)
+                    for k, v in outlets.items()
+                }
                 self._last_reset_date = data.get("last_reset_date")
-        except (json.JSONDecodeError, IOError):
+        except AttributeError:
             pass
 
         # Check if we need to reset for a new day
@@ -1989,65 +2193,104 @@ class ConfigManager:
             await self._async_save_energy_tracking()
 
     async def async_save_persistent_data(self) -> None:
-        """Save all persistent data (energy, intraday, enforcement, event counts). Call on unload/restart."""
-        await self._async_save_energy_tracking()
-        await self._async_save_intraday_history()
-        await self._async_save_enforcement_state()
-        await self._async_save_event_counts()
+        """Save all persistent data (energy, intraday, enforcement, event counts). Call on unload/restart.
 
-    async def _async_save_energy_tracking(self) -> None:
-        """Save day energy tracking data."""
-        tracking_path = self._data_path("energy_tracking.json")
-        payload = {
+        Runs every 15 seconds from the energy monitor, so the changed files are
+        written together in a single executor job.
+        """
+        # Event counts and enforcement state are part of this batch; pending
+        # debounced saves of them are redundant
+        self._cancel_event_counts_save()
+        self._cancel_enforcement_state_save()
+        if self._cancel_event_log_save():
+            await self._async_save_event_log_and_archive()
+        payloads = [
+            self._energy_tracking_payload(),
+            self._intraday_history_payload(),
+            self._enforcement_state_payload(),
+            self._event_counts_payload(),
+        ]
+        # Flush a config edit still inside its debounce window (unload / final write)
+        if self._cancel_config_save():
+            payloads.append((self._config_path, self._config))
+        await self._async_write_json_batch(payloads)
+
+    def _energy_tracking_payload(self) -> tuple[str, dict[str, Any]]:
+        """Return (path, data) for the day energy tracking file."""
+        return self._data_path("energy_tracking.json"), {
             "last_reset_date": self._last_reset_date,
             "outlets": self._day_energy_data,
         }
+
+    async def _async_save_energy_tracking(self) -> None:
+        """Save day energy tracking data."""
         try:
-            await self.hass.async_add_executor_job(
-                _write_json_file, tracking_path, payload
-            )
+            await self._async_write_json_if_changed(*self._energy_tracking_payload())
         except IOError as err:
             _LOGGER.error("Error saving energy tracking: %s", err)
 
     def get_day_energy(self, entity_id: str) -> float:
         """Get accumulated day energy for an entity."""
-        return self._day_energy_data.get(entity_id, {}).get("energy", 0.0)
+        return self._day_energy_data.get(entity_id, 0.0)
+
+    def _today_str(self) -> str:
+        """Local date (YYYY-MM-DD); recomputed only when the clock leaves the cached local day."""
+        ts = time.time()
+        if not self._today_cache_from <= ts < self._today_cache_until:
+            now = dt_util.now()
+            next_midnight = datetime.combine(
+                now.date() + timedelta(days=1), dt_time.min, tzinfo=now.tzinfo
+            )
+            self._today_cache = now.strftime("%Y-%m-%d")
+            self._today_cache_from = ts
+            self._today_cache_until = next_midnight.timestamp()
+        return self._today_cache
 
-    async def async_add_energy_reading(
+    def add_energy_reading(
         self, entity_id: str, watts: float, elapsed_seconds: float = 1.0
     ) -> None:
         """Add energy from a reading. Energy = watts * elapsed_seconds / 3600 (Wh).
         Called every second from poll (elapsed=1) or from state-change (elapsed=actual)."""
-        today = dt_util.now().strftime("%Y-%m-%d")
+        today = self._today_str()
         if self._last_reset_date != today:
             self._day_energy_data = {}
             self._last_reset_date = today
-            self._last_power_update = {}
-
-        if entity_id not in self._day_energy_data:
-            self._day_energy_data[entity_id] = {"energy": 0.0}
 
-        self._day_energy_data[entity_id]["energy"] += (watts * elapsed_seconds) / 3600.0
+        day_energy = self._day_energy_data
+        day_energy[entity_id] = day_energy.get(entity_id, 0.0) + watts * elapsed_seconds * _WS_TO_WH
 
     def record_intraday_power(self, entity_id: str, watts: float) -> None:
         """Record minute-by-minute power for 24-hour charts. Called from poll loop.
         Per-entity minute bucket: update in place for same minute, append when minute advances."""
-        now = dt_util.now()
-        minute_key = now.strftime("%Y-%m-%d %H:%M")
-        if entity_id not in self._intraday_history:
-            self._intraday_history[entity_id] = []
-        hist = self._intraday_history[entity_id]
+        minute_key = self._current_minute_key()
+        hist = self._intraday_history.get(entity_id)
+        if hist is None:
+            hist = self._intraday_history[entity_id] = deque(maxlen=_INTRADAY_MAX_POINTS)
         if hist and hist[-1][0] == minute_key:
             hist[-1] = (minute_key, watts)
         else:
+            # Bounded deque drops the oldest minute itself; no re-slicing copy
             hist.append((minute_key, watts))
-        if len(hist) > 1440:
-            self._intraday_history[entity_id] = hist[-1440:]
+
+    def _current_minute_key(self) -> str:
+        """Local "%Y-%m-%d %H:%M" for now, formatted once per wall-clock minute.
+
+        Time zone offsets are whole minutes, so epoch minute boundaries are local ones too.
+        """
+        epoch_minute = int(time.time() // 60)
+        if epoch_minute != self._minute_key_epoch_minute:
+            self._minute_key = dt_util.now().strftime("%Y-%m-%d %H:%M")
+            self._minute_key_epoch_minute = epoch_minute
+        return self._minute_key
 
     def get_intraday_history(self, entity_id: str, minutes: int = 1440) -> list:
         """Get last N minutes of power history for an entity. Returns [(minute_key, watts), ...]"""
-        history = self._intraday_history.get(entity_id, [])
-        return history[-minutes:] if history else []
+        history = self._intraday_history.get(entity_id)
+        if not history:
+            return []
+        # One C-level copy: room ratings read this from an executor thread while the
+        # poll loop appends, and iterating the live deque there could raise
+        return list(islice(history, max(0, len(history) - minutes), None))
 
     def resolve_outlet_energy_tracking_key(
         self,
@@ -2056,12 +2299,7 @@ class ConfigManager:
         plug_slot: int | None,
     ) -> str | None:
         """Tracking key for ``_intraday_history`` / day ledger for one outlet or one plug."""
-        room = None
-        for r in self.energy_config.get("rooms", []):
-            rid = r.get("id", r["name"].lower().replace(" ", "_"))
-            if rid == room_id:
-                room = r
-                break
+        room = self._room_by_id(room_id)
         if not room:
             return None
         outlets = room.get("outlets") or []
@@ -2082,7 +2320,7 @@ class ConfigManager:
             if outlet.get("power_source") == "sensor":
                 pe = outlet.get("power_sensor_entity")
                 return str(pe).strip() if pe else None
-            name = (outlet.get("name") or "light").lower().replace(" ", "_")
+            name = _slugify(outlet.get("name") or "light")
             return f"light_{room_id}_{name}"
 
         if otype in ("vent", "wall_heater"):
@@ -2099,51 +2337,21 @@ class ConfigManager:
 
     def get_room_intraday_history(self, room_id: str, minutes: int = 1440) -> dict[str, Any]:
         """Get intraday power history for a room (sum of all outlets)."""
-        room = None
-        for r in self.energy_config.get("rooms", []):
-            rid = r.get("id", r["name"].lower().replace(" ", "_"))
-            if rid == room_id:
-                room = r
-                break
-        if not room:
+        keys = self._room_intraday_keys(room_id)
+        if keys is None:
             return {"timestamps": [], "watts": []}
-        
-        # Collect all entity IDs / tracking keys for this room
-        entity_ids = []
-        for outlet in room.get("outlets", []):
-            if outlet.get("type") == "light":
-                if outlet.get("power_source") == "sensor":
-                    pe = outlet.get("power_sensor_entity")
-                    if pe:
-                        entity_ids.append(pe)
-                else:
-                    key = f"light_{room_id}_{(outlet.get('name') or 'light').lower().replace(' ', '_')}"
-                    entity_ids.append(key)
-            elif outlet.get("type") in ("vent", "wall_heater"):
-                if outlet.get("power_source") == "sensor":
-                    pe = outlet.get("power_sensor_entity")
-                    if pe:
-                        entity_ids.append(pe)
-                else:
-                    key = vent_like_energy_tracking_key(room_id, outlet)
-                    entity_ids.append(key)
-            else:
-                for e in (outlet.get("plug1_entity"), outlet.get("plug2_entity")):
-                    if e:
-                        entity_ids.append(e)
-        
-        # Merge histories - sum watts for each minute
         minute_sums: dict[str, float] = {}
-        for eid in entity_ids:
+        self._add_room_intraday(minute_sums, keys, minutes)
+        return _minute_series(minute_sums)
+
+    def _add_room_intraday(
+        self, minute_sums: dict[str, float], keys: tuple[str, ...], minutes: int
+    ) -> None:
+        """Add the per-minute watts of a room's power-history keys into minute_sums."""
+        sums_get = minute_sums.get
+        for eid in keys:
             for minute_key, watts in self.get_intraday_history(eid, minutes):
-                minute_sums[minute_key] = minute_sums.get(minute_key, 0) + watts
-        
-        # Sort by timestamp and return
-        sorted_minutes = sorted(minute_sums.keys())
-        return {
-            "timestamps": sorted_minutes,
-            "watts": [minute_sums[m] for m in sorted_minutes],
-        }
+                minute_sums[minute_key] = sums_get(minute_key, 0) + watts
 
     def get_room_day_wh_from_intraday(self, room_id: str) -> float | None:
         """Today's Wh from merged room intraday watts (trapezoids, local calendar day).
@@ -2215,24 +2423,19 @@ class ConfigManager:
 
     def get_total_intraday_history(self, minutes: int = 1440) -> dict[str, Any]:
         """Get intraday power history for all rooms combined."""
+        # Every room adds straight into one map, so the minutes are sorted once
         minute_sums: dict[str, float] = {}
-        for room in self.energy_config.get("rooms", []):
-            rid = room.get("id", room["name"].lower().replace(" ", "_"))
-            room_data = self.get_room_intraday_history(rid, minutes)
-            for ts, w in zip(room_data["timestamps"], room_data["watts"]):
-                minute_sums[ts] = minute_sums.get(ts, 0) + w
-        sorted_minutes = sorted(minute_sums.keys())
-        return {
-            "timestamps": sorted_minutes,
-            "watts": [minute_sums[m] for m in sorted_minutes],
-        }
+        for rid, _keys in self._room_energy_keys():
+            # Resolve like get_room_intraday_history: the first room with this id wins
+            self._add_room_intraday(minute_sums, self._room_intraday_keys(rid), minutes)
+        return _minute_series(minute_sums)
 
     def get_intraday_events(self, room_id: str | None = None) -> dict[str, Any]:
         """Get 24-hour intraday event counts (warnings/shutoffs) for charts.
         Returns hourly timestamps with cumulative values (0 to today's total over 24h)
         so charts match Current Power / Today's Usage format."""
         self._ensure_event_counts_for_today()
-        today = dt_util.now().strftime("%Y-%m-%d")
+        today = self._today_str()
         timestamps = [f"{today} {h:02d}:00" for h in range(24)]
         if room_id:
             warnings = self._event_counts.get("room_warnings", {}).get(room_id, 0)
@@ -2246,17 +2449,19 @@ class ConfigManager:
             total_shutoffs = self._event_counts.get("total_shutoffs", 0)
             total_power_cycles = self._event_counts.get("total_power_cycles", 0)
             rooms_data = {}
-            for rid in (r.get("id", r["name"].lower().replace(" ", "_")) for r in self.energy_config.get("rooms", [])):
+            room_warnings = self._event_counts.get("room_warnings", {})
+            room_shutoffs = self._event_counts.get("room_shutoffs", {})
+            room_power_cycles = self._event_counts.get("room_power_cycles", {})
+            for rid in (r.get("id", _slugify(r["name"])) for r in self.energy_config.get("rooms", [])):
                 rooms_data[rid] = {
-                    "warnings": self._event_counts.get("room_warnings", {}).get(rid, 0),
-                    "shutoffs": self._event_counts.get("room_shutoffs", {}).get(rid, 0),
-                    "power_cycles": self._event_counts.get("room_power_cycles", {}).get(rid, 0),
+                    "warnings": room_warnings.get(rid, 0),
+                    "shutoffs": room_shutoffs.get(rid, 0),
+                    "power_cycles": room_power_cycles.get(rid, 0),
                 }
-        # Cumulative 0..total over 24 hours (linear distribution for chart continuity)
+        # Cumulative 0..total over 24 hours (linear distribution for chart continuity);
+        # each payload gets its own list, the ramps themselves are cached per count
         def _cumul(n: int) -> list[float]:
-            if n <= 0:
-                return [0.0] * 24
-            return [round((i + 1) * n / 24, 2) for i in range(24)]
+            return list(_hourly_cumulative(n))
         if room_id:
             return {
                 "timestamps": timestamps,
@@ -2282,7 +2487,7 @@ class ConfigManager:
     # Event count tracking (warnings and shutoffs) - per current date only
     def _ensure_event_counts_for_today(self) -> None:
         """Reset event counts if date has changed (new day)."""
-        today = dt_util.now().strftime("%Y-%m-%d")
+        today = self._today_str()
         if self._event_counts_reset_date != today:
             self._event_counts = {
                 "total_warnings": 0,
@@ -2294,34 +2499,24 @@ class ConfigManager:
             }
             self._event_counts_reset_date = today
 
-    async def _async_load_event_counts(self) -> None:
-        """Load event counts (warnings and shutoffs). Reset if new day."""
-        counts_path = self._data_path("event_counts.json")
+    async def _async_load_event_counts(self, data: dict | None) -> None:
+        """Apply event counts (warnings and shutoffs) read by async_load. Reset if new day."""
         try:
-            data = await self.hass.async_add_executor_job(
-                _load_json_file, counts_path
-            )
             if data is not None:
                 self._event_counts_reset_date = data.get("last_reset_date")
-                self._event_counts = {
-                    "total_warnings": data.get("total_warnings", 0),
-                    "total_shutoffs": data.get("total_shutoffs", 0),
-                    "total_power_cycles": data.get("total_power_cycles", 0),
-                    "room_warnings": data.get("room_warnings", {}),
-                    "room_shutoffs": data.get("room_shutoffs", {}),
-                    "room_power_cycles": data.get("room_power_cycles", {}),
-                }
-        except (json.JSONDecodeError, IOError):
+                # Fill the already-shaped dict in place; missing keys keep their zero defaults
+                counts = self._event_counts
+                for key in _EVENT_COUNT_KEYS:
+                    if key in data:
+                        counts[key] = data[key]
+        except (AttributeError, TypeError):
             pass
-        self._event_counts.setdefault("total_power_cycles", 0)
-        self._event_counts.setdefault("room_power_cycles", {})
         self._ensure_event_counts_for_today()
 
-    async def _async_save_event_counts(self) -> None:
-        """Save event counts with current date."""
-        counts_path = self._data_path("event_counts.json")
-        payload = {
-            "last_reset_date": self._event_counts_reset_date or dt_util.now().strftime("%Y-%m-%d"),
+    def _event_counts_payload(self) -> tuple[str, dict[str, Any]]:
+        """Return (path, data) for the event counts file."""
+        return self._data_path("event_counts.json"), {
+            "last_reset_date": self._event_counts_reset_date or self._today_str(),
             "total_warnings": self._event_counts.get("total_warnings", 0),
             "total_shutoffs": self._event_counts.get("total_shutoffs", 0),
             "total_power_cycles": self._event_counts.get("total_power_cycles", 0),
@@ -2329,13 +2524,33 @@ class ConfigManager:
             "room_shutoffs": self._event_counts.get("room_shutoffs", {}),
             "room_power_cycles": self._event_counts.get("room_power_cycles", {}),
         }
+
+    async def _async_save_event_counts(self) -> None:
+        """Save event counts with current date."""
         try:
-            await self.hass.async_add_executor_job(
-                _write_json_file, counts_path, payload
-            )
+            await self._async_write_json_if_changed(*self._event_counts_payload())
         except IOError as err:
             _LOGGER.error("Error saving event counts: %s", err)
 
+    def _schedule_event_counts_save(self) -> None:
+        """Save event counts after a short delay, coalescing bursts of increments."""
+        if self._event_counts_save_handle is None:
+            self._event_counts_save_handle = self.hass.loop.call_later(
+                _EVENT_COUNTS_SAVE_DELAY, self._flush_event_counts
+            )
+
+    @callback
+    def _flush_event_counts(self) -> None:
+        """Timer callback: write the event counts accumulated since scheduling."""
+        self._event_counts_save_handle = None
+        self.hass.async_create_task(self._async_save_event_counts())
+
+    def _cancel_event_counts_save(self) -> None:
+        """Cancel a pending debounced event counts save."""
+        if self._event_counts_save_handle is not None:
+            self._event_counts_save_handle.cancel()
+            self._event_counts_save_handle = None
+
     async def async_increment_warning(self, room_id: str) -> None:
         """Increment warning count for a room and total (today only)."""
         self._ensure_event_counts_for_today()
@@ -2343,7 +2558,7 @@ class ConfigManager:
         if room_id not in self._event_counts["room_warnings"]:
             self._event_counts["room_warnings"][room_id] = 0
         self._event_counts["room_warnings"][room_id] += 1
-        await self._async_save_event_counts()
+        self._schedule_event_counts_save()
 
     async def async_increment_shutoff(self, room_id: str) -> None:
         """Increment shutoff count for a room and total (today only)."""
@@ -2352,7 +2567,7 @@ class ConfigManager:
         if room_id not in self._event_counts["room_shutoffs"]:
             self._event_counts["room_shutoffs"][room_id] = 0
         self._event_counts["room_shutoffs"][room_id] += 1
-        await self._async_save_event_counts()
+        self._schedule_event_counts_save()
 
     async def async_increment_power_cycle(self, room_id: str) -> None:
         """Count one enforcement power-cycle run (phase 2, all outlets cycled together)."""
@@ -2361,7 +2576,7 @@ class ConfigManager:
         if room_id not in self._event_counts["room_power_cycles"]:
             self._event_counts["room_power_cycles"][room_id] = 0
         self._event_counts["room_power_cycles"][room_id] += 1
-        await self._async_save_event_counts()
+        self._schedule_event_counts_save()
 
     async def async_record_power_cycle_initiated(
         self,
@@ -2376,10 +2591,10 @@ class ConfigManager:
             room_id, room_name, "power_cycle", None, True, extra=extra
         )
 
-    def get_event_counts(self) -> dict[str, Any]:
-        """Get event counts for current date only."""
+    def get_event_counts(self) -> Mapping[str, Any]:
+        """Get event counts for current date only (read-only view, no copy)."""
         self._ensure_event_counts_for_today()
-        return self._event_counts.copy()
+        return MappingProxyType(self._event_counts)
 
     # Event log (24h warnings/shutoffs with TTS success/fail)
     EVENT_LOG_FILE = "event_log.json"
@@ -2388,19 +2603,17 @@ class ConfigManager:
     EVENT_ARCHIVE_MAX_PER_DAY = 2000
     EVENT_LOG_API_MAX_ENTRIES = 5000
 
-    async def _async_load_event_log(self) -> None:
-        """Load event log from file."""
-        path = self._data_path(self.EVENT_LOG_FILE)
-        try:
-            data = await self.hass.async_add_executor_job(_load_json_file, path)
-            self._event_log = data.get("events", []) if data else []
-        except (json.JSONDecodeError, IOError):
-            self._event_log = []
+    def _load_event_log(self, data: dict | None) -> None:
+        """Apply the event log read by async_load."""
+        self._event_log = deque(
+            data.get("events", []) if data else (), maxlen=self._event_log_max_entries
+        )
 
     async def _async_save_event_log(self) -> None:
-        """Save event log to file (keep last N entries)."""
+        """Save event log to file (the deque already holds at most the last N entries)."""
         path = self._data_path(self.EVENT_LOG_FILE)
-        payload = {"events": self._event_log[-self._event_log_max_entries :]}
+        # Snapshot on the loop; the executor serializes while new events may append
+        payload = {"events": list(self._event_log)}
         try:
             await self.hass.async_add_executor_job(_write_json_file, path, payload)
         except IOError as err:
@@ -2419,22 +2632,20 @@ class ConfigManager:
                 continue
             bucket.append(dict(e))
         for d, bucket in list(self._event_archive_days.items()):
-            bucket.sort(key=lambda x: str(x.get("ts") or ""))
+            bucket.sort(key=_event_ts)
             if len(bucket) > self.EVENT_ARCHIVE_MAX_PER_DAY:
                 self._event_archive_days[d] = bucket[-self.EVENT_ARCHIVE_MAX_PER_DAY :]
 
-    async def _async_load_event_archive(self) -> None:
-        """Load per-day event archive; merge rolling log for same-day recovery."""
-        path = self._data_path(self.EVENT_ARCHIVE_FILE)
+    def _load_event_archive(self, data: dict | None) -> None:
+        """Apply the per-day event archive read by async_load; merge rolling log for same-day recovery."""
         try:
-            data = await self.hass.async_add_executor_job(_load_json_file, path)
             raw = (data or {}).get("days") or {}
             self._event_archive_days = {
                 str(k): list(v) if isinstance(v, list) else []
                 for k, v in raw.items()
                 if isinstance(k, str) and len(str(k)) == 10
             }
-        except (json.JSONDecodeError, IOError, TypeError):
+        except TypeError:
             self._event_archive_days = {}
         self._merge_event_log_into_archive()
 
@@ -2458,6 +2669,32 @@ class ConfigManager:
         except IOError as err:
             _LOGGER.error("Error saving event archive: %s", err)
 
+    async def _async_save_event_log_and_archive(self) -> None:
+        """Write the rolling event log and the per-day archive."""
+        await self._async_save_event_log()
+        await self._async_save_event_archive()
+
+    def _schedule_event_log_save(self) -> None:
+        """Save the event log and archive after a short delay, coalescing event bursts."""
+        if self._event_log_save_handle is None:
+            self._event_log_save_handle = self.hass.loop.call_later(
+                _EVENT_LOG_SAVE_DELAY, self._flush_event_log
+            )
+
+    @callback
+    def _flush_event_log(self) -> None:
+        """Timer callback: write the event log and archive accumulated since scheduling."""
+        self._event_log_save_handle = None
+        self.hass.async_create_task(self._async_save_event_log_and_archive())
+
+    def _cancel_event_log_save(self) -> bool:
+        """Cancel a pending debounced event log save; return True if one was pending."""
+        if self._event_log_save_handle is None:
+            return False
+        self._event_log_save_handle.cancel()
+        self._event_log_save_handle = None
+        return True
+
     @staticmethod
     def _iter_archive_dates_inclusive(start: str, end: str) -> list[str]:
         """List YYYY-MM-DD from start through end inclusive."""
@@ -2496,9 +2733,6 @@ class ConfigManager:
         if extra:
             entry.update({k: v for k, v in extra.items() if v is not None})
         self._event_log.append(entry)
-        if len(self._event_log) > self._event_log_max_entries:
-            self._event_log = self._event_log[-self._event_log_max_entries :]
-        await self._async_save_event_log()
 
         day_key = (entry.get("ts") or "")[:10]
         if len(day_key) == 10:
@@ -2506,12 +2740,12 @@ class ConfigManager:
             k = _event_log_dedupe_key(entry)
             if not any(_event_log_dedupe_key(x) == k for x in bucket):
                 bucket.append(entry)
-            bucket.sort(key=lambda x: str(x.get("ts") or ""))
+            bucket.sort(key=_event_ts)
             if len(bucket) > self.EVENT_ARCHIVE_MAX_PER_DAY:
                 self._event_archive_days[day_key] = bucket[
                     -self.EVENT_ARCHIVE_MAX_PER_DAY :
                 ]
-        await self._async_save_event_archive()
+        self._schedule_event_log_save()
 
     def get_event_log(
         self,
@@ -2547,7 +2781,7 @@ class ConfigManager:
                         continue
                     seen.add(k)
                     collected.append(e)
-            collected.sort(key=lambda x: str(x.get("ts") or ""), reverse=True)
+            collected.sort(key=_event_ts, reverse=True)
             if len(collected) > max_n:
                 return collected[:max_n], True
             return collected, False
@@ -2556,15 +2790,15 @@ class ConfigManager:
         sh = max(1, min(24 * 90, sh))
         cutoff = dt_util.now() - timedelta(hours=sh)
         cutoff_ts = cutoff.strftime("%Y-%m-%dT%H:%M:%S")
-        cutoff_day = cutoff.strftime("%Y-%m-%d")
-        today = dt_util.now().strftime("%Y-%m-%d")
+        cutoff_day = cutoff_ts[:10]
+        today = self._today_str()
         days = self._iter_archive_dates_inclusive(cutoff_day, today)
         seen: set[tuple[Any, ...]] = set()
         collected: list[dict[str, Any]] = []
         for day in days:
-            for e in self._event_archive_days.get(day, []):
-                if e.get("ts", "") < cutoff_ts:
-                    continue
+            bucket = self._event_archive_days.get(day, [])
+            # Buckets are sorted by ts: skip straight past entries older than the window
+            for e in islice(bucket, bisect_left(bucket, cutoff_ts, key=_event_ts), None):
                 if room_id and e.get("room_id") != room_id:
                     continue
                 k = _event_log_dedupe_key(e)
@@ -2582,26 +2816,22 @@ class ConfigManager:
                 continue
             seen.add(k)
             collected.append(e)
-        collected.sort(key=lambda x: str(x.get("ts") or ""), reverse=True)
+        collected.sort(key=_event_ts, reverse=True)
         if len(collected) > max_n:
             return collected[:max_n], True
         return collected, False
 
     # Daily totals history (end-of-day snapshots for 30-day graphs)
-    async def _async_load_daily_totals(self) -> None:
-        """Load daily totals history from file."""
-        path = self._data_path("daily_totals.json")
-        try:
-            data = await self.hass.async_add_executor_job(_load_json_file, path)
-            self._daily_totals = data.get("days", {}) if data else {}
-        except (json.JSONDecodeError, IOError):
-            self._daily_totals = {}
+    def _load_daily_totals(self, data: dict | None) -> None:
+        """Apply the daily totals history read by async_load."""
+        self._daily_totals = data.get("days", {}) if data else {}
 
     async def _async_save_daily_totals(self) -> None:
         """Save daily totals history (keep last 45 days)."""
-        dates_sorted = sorted(self._daily_totals.keys(), reverse=True)
-        if len(dates_sorted) > 45:
-            for d in dates_sorted[45:]:
+        # Usually one day over the cap: pick only the oldest dates, no full sort
+        excess = len(self._daily_totals) - _DAILY_TOTALS_MAX_DAYS
+        if excess > 0:
+            for d in heapq.nsmallest(excess, self._daily_totals):
                 del self._daily_totals[d]
         path = self._data_path("daily_totals.json")
         try:
@@ -2611,75 +2841,28 @@ class ConfigManager:
         except IOError as err:
             _LOGGER.error("Error saving daily totals: %s", err)
 
-    async def _async_load_statistics_cache(self) -> None:
-        """Load pre-computed statistics cache from file for instant page load."""
-        path = self._data_path("statistics_cache.json")
-        try:
-            data = await self.hass.async_add_executor_job(_load_json_file, path)
-            self._statistics_cache_data = data if data else {}
-        except (json.JSONDecodeError, IOError):
-            self._statistics_cache_data = {}
+    def _load_statistics_cache(self, data: dict | None) -> None:
+        """Apply the pre-computed statistics cache read by async_load (instant page load)."""
+        self._statistics_cache_data = data if data else {}
 
     async def async_save_statistics_cache(self, data: dict[str, Any]) -> None:
         """Save pre-computed statistics to file for instant page load."""
         self._statistics_cache_data = data
         path = self._data_path("statistics_cache.json")
         try:
-            await self.hass.async_add_executor_job(_write_json_file, path, data)
+            # Re-primed every refresh interval; unchanged statistics skip the disk write
+            await self._async_write_json_if_changed(path, data)
         except IOError as err:
             _LOGGER.error("Error saving statistics cache: %s", err)
 
     async def async_snapshot_day_and_reset_if_rolled_over(self) -> None:
         """If date rolled over, snapshot previous day's totals to history, then reset."""
-        today = dt_util.now().strftime("%Y-%m-%d")
+        today = self._today_str()
         old_date = self._last_reset_date or self._event_counts_reset_date
         if not old_date or old_date == today:
             return
 
-        rooms_data = {}
-        energy_config = self.energy_config
-        for room in energy_config.get("rooms", []):
-            room_id = room.get("id", room["name"].lower().replace(" ", "_"))
-            room_wh = 0.0
-            for outlet in room.get("outlets", []):
-                if outlet.get("type") == "light":
-                    if outlet.get("power_source") == "sensor":
-                        pe = outlet.get("power_sensor_entity")
-                        if pe:
-                            room_wh += self._day_energy_data.get(pe, {}).get("energy", 0.0)
-                    else:
-                        key = f"light_{room_id}_{(outlet.get('name') or 'light').lower().replace(' ', '_')}"
-                        room_wh += self._day_energy_data.get(key, {}).get("energy", 0.0)
-                elif outlet.get("type") in ("vent", "wall_heater"):
-                    if outlet.get("power_source") == "sensor":
-                        pe = outlet.get("power_sensor_entity")
-                        if pe:
-                            room_wh += self._day_energy_data.get(pe, {}).get("energy", 0.0)
-                    else:
-                        key = vent_like_energy_tracking_key(room_id, outlet)
-                        room_wh += self._day_energy_data.get(key, {}).get("energy", 0.0)
-                else:
-                    seen_e: set[str] = set()
-                    pe = outlet.get("power_sensor_entity")
-                    if pe and isinstance(pe, str) and pe.strip():
-                        e = pe.strip()
-                        seen_e.add(e)
-                        room_wh += self._day_energy_data.get(e, {}).get("energy", 0.0)
-                    for e in (outlet.get("plug1_entity"), outlet.get("plug2_entity")):
-                        if e and isinstance(e, str) and e.strip():
-                            e2 = e.strip()
-                            if e2 in seen_e:
-                                continue
-                            seen_e.add(e2)
-                            room_wh += self._day_energy_data.get(e2, {}).get("energy", 0.0)
-
-            rooms_data[room_id] = {
-                "wh": round(room_wh, 2),
-                "warnings": self._event_counts.get("room_warnings", {}).get(room_id, 0),
-                "shutoffs": self._event_counts.get("room_shutoffs", {}).get(room_id, 0),
-                "power_cycles": self._event_counts.get("room_power_cycles", {}).get(room_id, 0),
-            }
-
+        rooms_data = self._rooms_day_totals()
         total_wh = sum(r["wh"] for r in rooms_data.values())
         self._daily_totals[old_date] = {
             "total_wh": round(total_wh, 2),
@@ -2692,7 +2875,6 @@ class ConfigManager:
 
         self._day_energy_data = {}
         self._last_reset_date = today
-        self._last_power_update = {}
         self._event_counts = {
             "total_warnings": 0,
             "total_shutoffs": 0,
@@ -2705,50 +2887,34 @@ class ConfigManager:
         await self._async_save_energy_tracking()
         await self._async_save_event_counts()
 
+    def _room_day_wh(self, keys: tuple[str, ...]) -> float:
+        """Today's Wh summed over a room's day-ledger keys."""
+        day_get = self._day_energy_data.get
+        room_wh = 0.0
+        for key in keys:
+            room_wh += day_get(key, 0.0)
+        return room_wh
+
+    def _rooms_day_totals(self) -> dict[str, dict[str, Any]]:
+        """Per-room rows of a daily totals entry, from the current day ledger and counts."""
+        counts = self._event_counts
+        room_warnings = counts.get("room_warnings", {})
+        room_shutoffs = counts.get("room_shutoffs", {})
+        room_power_cycles = counts.get("room_power_cycles", {})
+        return {
+            rid: {
+                "wh": round(self._room_day_wh(keys), 2),
+                "warnings": room_warnings.get(rid, 0),
+                "shutoffs": room_shutoffs.get(rid, 0),
+                "power_cycles": room_power_cycles.get(rid, 0),
+            }
+            for rid, keys in self._room_energy_keys()
+        }
+
     def _build_today_totals(self) -> dict[str, Any]:
         """Build today's running totals from current data."""
         self._ensure_event_counts_for_today()
-        rooms_data = {}
-        for room in self.energy_config.get("rooms", []):
-            rid = room.get("id", room["name"].lower().replace(" ", "_"))
-            room_wh = 0.0
-            for outlet in room.get("outlets", []):
-                if outlet.get("type") == "light":
-                    if outlet.get("power_source") == "sensor":
-                        pe = outlet.get("power_sensor_entity")
-                        if pe:
-                            room_wh += self._day_energy_data.get(pe, {}).get("energy", 0.0)
-                    else:
-                        key = f"light_{rid}_{(outlet.get('name') or 'light').lower().replace(' ', '_')}"
-                        room_wh += self._day_energy_data.get(key, {}).get("energy", 0.0)
-                elif outlet.get("type") in ("vent", "wall_heater"):
-                    if outlet.get("power_source") == "sensor":
-                        pe = outlet.get("power_sensor_entity")
-                        if pe:
-                            room_wh += self._day_energy_data.get(pe, {}).get("energy", 0.0)
-                    else:
-                        key = vent_like_energy_tracking_key(rid, outlet)
-                        room_wh += self._day_energy_data.get(key, {}).get("energy", 0.0)
-                else:
-                    seen_e: set[str] = set()
-                    pe = outlet.get("power_sensor_entity")
-                    if pe and isinstance(pe, str) and pe.strip():
-                        e = pe.strip()
-                        seen_e.add(e)
-                        room_wh += self._day_energy_data.get(e, {}).get("energy", 0.0)
-                    for e in (outlet.get("plug1_entity"), outlet.get("plug2_entity")):
-                        if e and isinstance(e, str) and e.strip():
-                            e2 = e.strip()
-                            if e2 in seen_e:
-                                continue
-                            seen_e.add(e2)
-                            room_wh += self._day_energy_data.get(e2, {}).get("energy", 0.0)
-            rooms_data[rid] = {
-                "wh": round(room_wh, 2),
-                "warnings": self._event_counts.get("room_warnings", {}).get(rid, 0),
-                "shutoffs": self._event_counts.get("room_shutoffs", {}).get(rid, 0),
-                "power_cycles": self._event_counts.get("room_power_cycles", {}).get(rid, 0),
-            }
+        rooms_data = self._rooms_day_totals()
         total_wh = sum(r["wh"] for r in rooms_data.values())
         return {
             "total_wh": round(total_wh, 2),
@@ -2761,27 +2927,17 @@ class ConfigManager:
     def get_daily_history(self, days: int = 30, include_today: bool = True) -> dict[str, Any]:
         """Get daily totals for graphs. Only returns dates that have data, from earliest to latest.
         Chart grows over time until full range is available (no leading blank sections)."""
-        from datetime import timedelta
-        today = dt_util.now().strftime("%Y-%m-%d")
+        today = self._today_str()
+        today_date = date.fromisoformat(today)
         all_room_ids = {
-            r.get("id", r["name"].lower().replace(" ", "_"))
+            r.get("id", _slugify(r["name"]))
             for r in self.energy_config.get("rooms", [])
         }
-        result = {
-            "dates": [],
-            "total_wh": [],
-            "total_warnings": [],
-            "total_shutoffs": [],
-            "total_power_cycles": [],
-            "rooms": {},
-        }
-        for rid in all_room_ids:
-            result["rooms"][rid] = {"wh": [], "warnings": [], "shutoffs": [], "power_cycles": []}
 
         # Collect only dates that have data (in _daily_totals or today)
         candidates = []
         for i in range(days):
-            d = (dt_util.now() - timedelta(days=i)).strftime("%Y-%m-%d")
+            d = (today_date - timedelta(days=i)).isoformat()
             if d == today and include_today:
                 candidates.append((d, self._build_today_totals()))
             elif d in self._daily_totals:
@@ -2789,50 +2945,27 @@ class ConfigManager:
 
         # Sort chronologically (oldest first) and limit to days
         candidates.sort(key=lambda x: x[0])
-        for d, row in candidates:
-            result["dates"].append(d)
-            result["total_wh"].append(row.get("total_wh", 0))
-            result["total_warnings"].append(row.get("total_warnings", 0))
-            result["total_shutoffs"].append(row.get("total_shutoffs", 0))
-            result["total_power_cycles"].append(row.get("total_power_cycles", 0))
-            row_rooms = row.get("rooms") or {}
-            for rid in all_room_ids:
-                rdata = row_rooms.get(rid, {})
-                result["rooms"][rid]["wh"].append(rdata.get("wh", 0))
-                result["rooms"][rid]["warnings"].append(rdata.get("warnings", 0))
-                result["rooms"][rid]["shutoffs"].append(rdata.get("shutoffs", 0))
-                result["rooms"][rid]["power_cycles"].append(rdata.get("power_cycles", 0))
-
-        return result
+        return _daily_history_columns(
+            [d for d, _ in candidates], [row for _, row in candidates], all_room_ids
+        )
 
     def get_daily_history_for_range(self, date_start: str, date_end: str) -> dict[str, Any]:
         """Daily totals for each calendar day in [date_start, date_end] inclusive (YYYY-MM-DD).
         Missing past days use zeros so charts span the full billing window."""
-        from datetime import datetime, timedelta
-
-        today = dt_util.now().strftime("%Y-%m-%d")
+        today = self._today_str()
         all_room_ids = {
-            r.get("id", r["name"].lower().replace(" ", "_"))
+            r.get("id", _slugify(r["name"]))
             for r in self.energy_config.get("rooms", [])
         }
-        result: dict[str, Any] = {
-            "dates": [],
-            "total_wh": [],
-            "total_warnings": [],
-            "total_shutoffs": [],
-            "total_power_cycles": [],
-            "rooms": {
-                rid: {"wh": [], "warnings": [], "shutoffs": [], "power_cycles": []}
-                for rid in all_room_ids
-            },
-        }
+        dates: list[str] = []
+        rows: list[dict[str, Any]] = []
         try:
             cur = datetime.strptime(date_start, "%Y-%m-%d")
             end_dt = datetime.strptime(date_end, "%Y-%m-%d")
         except ValueError:
-            return result
+            return _daily_history_columns(dates, rows, all_room_ids)
         if end_dt < cur:
-            return result
+            return _daily_history_columns(dates, rows, all_room_ids)
 
         while cur <= end_dt:
             d = cur.strftime("%Y-%m-%d")
@@ -2850,36 +2983,21 @@ class ConfigManager:
                         "total_power_cycles": 0,
                         "rooms": {},
                     }
-            result["dates"].append(d)
-            result["total_wh"].append(row.get("total_wh", 0))
-            result["total_warnings"].append(row.get("total_warnings", 0))
-            result["total_shutoffs"].append(row.get("total_shutoffs", 0))
-            result["total_power_cycles"].append(row.get("total_power_cycles", 0))
-            row_rooms = row.get("rooms") or {}
-            for rid in all_room_ids:
-                rdata = row_rooms.get(rid) or {}
-                result["rooms"][rid]["wh"].append(rdata.get("wh", 0))
-                result["rooms"][rid]["warnings"].append(rdata.get("warnings", 0))
-                result["rooms"][rid]["shutoffs"].append(rdata.get("shutoffs", 0))
-                result["rooms"][rid]["power_cycles"].append(rdata.get("power_cycles", 0))
+            dates.append(d)
+            rows.append(row)
             cur += timedelta(days=1)
 
-        return result
+        return _daily_history_columns(dates, rows, all_room_ids)
 
     # Billing history (for new-cycle alerts)
-    async def _async_load_billing_history(self) -> None:
-        """Load billing history from file."""
-        path = self._data_path("billing_history.json")
-        try:
-            data = await self.hass.async_add_executor_job(_load_json_file, path)
-            if data:
-                self._billing_history = {
-                    "cycles": data.get("cycles", []),
-                    "last_billing_start": data.get("last_billing_start", ""),
-                    "last_billing_end": data.get("last_billing_end", ""),
-                }
-        except (json.JSONDecodeError, IOError):
-            pass
+    def _load_billing_history(self, data: dict | None) -> None:
+        """Apply the billing history read by async_load."""
+        if data:
+            self._billing_history = {
+                "cycles": data.get("cycles", []),
+                "last_billing_start": data.get("last_billing_start", ""),
+                "last_billing_end": data.get("last_billing_end", ""),
+            }
 
     async def _async_save_billing_history(self) -> None:
         """Save billing history to file."""
@@ -2901,11 +3019,11 @@ class ConfigManager:
             return None
         val = str(state.state).strip()
         # YYYY-MM-DD
-        m = re.match(r"(\d{4})-(\d{2})-(\d{2})", val)
+        m = _DATE_YMD_PATTERN.match(val)
         if m:
             return f"{m.group(1)}-{m.group(2)}-{m.group(3)}"
         # MM/DD/YYYY or MM-DD-YYYY (first<=12=month, second=day) or DD/MM when first>12
-        m = re.match(r"(\d{1,2})[/-](\d{1,2})[/-](\d{4})", val)
+        m = _DATE_MDY_PATTERN.match(val)
         if m:
             a, b, y = int(m.group(1)), int(m.group(2)), m.group(3)
             if a > 12 and b <= 12:
@@ -2930,7 +3048,7 @@ class ConfigManager:
         """Check if string is a valid YYYY-MM-DD date."""
         if not date_str:
             return False
-        return bool(re.match(r"^\d{4}-\d{2}-\d{2}$", date_str))
+        return bool(_DATE_ISO_PATTERN.match(date_str))
 
     def get_statistics_date_range(
         self, date_start: str | None = None, date_end: str | None = None
@@ -2938,7 +3056,7 @@ class ConfigManager:
         """Resolve final date range. Returns (start, end, is_narrowed).
         Uses billing cycle dates; includes today if billing end is in the past.
         Optional date_start/date_end (YYYY-MM-DD) narrow the range, clamped to billing/base."""
-        today = dt_util.now().strftime("%Y-%m-%d")
+        today = self._today_str()
         billing_start, billing_end = self.get_billing_date_range()
 
         if billing_start and billing_end:
@@ -2994,20 +3112,66 @@ class ConfigManager:
             "end": end,
             "detected_at": now_str,
         })
-        if len(self._billing_history["cycles"]) > 60:
-            self._billing_history["cycles"] = self._billing_history["cycles"][-60:]
+        # Keep the last 60 cycles (trimmed in place)
+        del self._billing_history["cycles"][:-60]
         self._billing_history["last_billing_start"] = start
         self._billing_history["last_billing_end"] = end
         await self._async_save_billing_history()
         return True
 
+    def _invalidate_outlet_index(self) -> None:
+        """Drop cached outlet/breaker lookups; call whenever the energy config is replaced."""
+        self._outlets_cache = None
+        self._breakers_by_id = None
+        self._breaker_outlets = {}
+        self._rooms_by_id = None
+        self._room_energy_keys_cache = None
+        self._room_intraday_keys_cache = None
+
+    def _room_energy_keys(self) -> list[tuple[str, tuple[str, ...]]]:
+        """(room id, day-ledger keys) for each configured room in config order, cached."""
+        if self._room_energy_keys_cache is None:
+            result = []
+            for room in self.energy_config.get("rooms", []):
+                rid = room.get("id", _slugify(room["name"]))
+                keys: list[str] = []
+                for outlet in room.get("outlets", []):
+                    keys.extend(_outlet_day_energy_keys(rid, outlet))
+                result.append((rid, tuple(keys)))
+            self._room_energy_keys_cache = result
+        return self._room_energy_keys_cache
+
+    def _room_intraday_keys(self, room_id: str) -> tuple[str, ...] | None:
+        """A room's power-history keys, each entity once (first room with the id wins)."""
+        if self._room_intraday_keys_cache is None:
+            index: dict[str, tuple[str, ...]] = {}
+            for rid, keys in self._room_energy_keys():
+                # An entity shared by several outlets is one power reading, not several
+                index.setdefault(rid, tuple(dict.fromkeys(keys)))
+            self._room_intraday_keys_cache = index
+        return self._room_intraday_keys_cache.get(room_id)
+
+    def _room_by_id(self, room_id: str) -> dict[str, Any] | None:
+        """Room config dict for an id (first match wins), via a lazily built index."""
+        if self._rooms_by_id is None:
+            index: dict[str, dict[str, Any]] = {}
+            for r in self.energy_config.get("rooms", []):
+                index.setdefault(r.get("id", _slugify(r["name"])), r)
+            self._rooms_by_id = index
+        return self._rooms_by_id.get(room_id)
+
     def get_all_outlets(self) -> list[dict[str, Any]]:
-        """Get all outlets from all rooms with their identifiers."""
+        """Get all outlets from all rooms with their identifiers.
+
+        The list is cached until the energy config changes; callers must not mutate it.
+        """
+        if self._outlets_cache is not None:
+            return self._outlets_cache
         outlets = []
         for room in self.energy_config.get("rooms", []):
-            room_id = room.get("id", room["name"].lower().replace(" ", "_"))
+            room_id = room.get("id", _slugify(room["name"]))
             for outlet in room.get("outlets", []):
-                outlet_id = f"{room_id}_{outlet.get('name', 'outlet').lower().replace(' ', '_')}"
+                outlet_id = f"{room_id}_{_slugify(outlet.get('name', 'outlet'))}"
                 outlets.append({
                     "id": outlet_id,
                     "room_id": room_id,
@@ -3018,23 +3182,37 @@ class ConfigManager:
                     "plug1_entity": outlet.get("plug1_entity"),
                     "plug2_entity": outlet.get("plug2_entity"),
                 })
+        self._outlets_cache = outlets
         return outlets
 
     def get_outlets_for_breaker(self, breaker_id: str) -> list[dict[str, Any]]:
-        """Get all outlets assigned to a breaker line."""
-        breaker_lines = self.energy_config.get("breaker_lines", [])
-        breaker = next((b for b in breaker_lines if b.get("id") == breaker_id), None)
+        """Get all outlets assigned to a breaker line.
+
+        Resolved once per breaker until the energy config changes; callers must not mutate it.
+        """
+        cached = self._breaker_outlets.get(breaker_id)
+        if cached is not None:
+            return cached
+        if self._breakers_by_id is None:
+            breakers: dict[str, dict[str, Any]] = {}
+            for b in self.energy_config.get("breaker_lines", []):
+                breakers.setdefault(b.get("id"), b)
+            self._breakers_by_id = breakers
+        breaker = self._breakers_by_id.get(breaker_id)
         if not breaker:
             return []
-        
-        outlet_ids = breaker.get("outlet_ids", [])
-        all_outlets = self.get_all_outlets()
-        return [outlet for outlet in all_outlets if outlet["id"] in outlet_ids]
+
+        # Outlet ids are strings; anything else in outlet_ids can never match
+        outlet_ids = {i for i in breaker.get("outlet_ids", []) if isinstance(i, str)}
+        # Filter in room/outlet config order, which is the order the panel lists them in
+        outlets = [outlet for outlet in self.get_all_outlets() if outlet["id"] in outlet_ids]
+        self._breaker_outlets[breaker_id] = outlets
+        return outlets
 
     # Power enforcement
     def _ensure_enforcement_state_for_today(self) -> None:
         """Reset enforcement state if date changed (new day)."""
-        today = dt_util.now().strftime("%Y-%m-%d")
+        today = self._today_str()
         if self._enforcement_reset_date != today:
             self._enforcement_state = {}
             self._home_kwh_alert_sent = False
@@ -3045,11 +3223,11 @@ class ConfigManager:
         self._ensure_enforcement_state_for_today()
         if room_id not in self._enforcement_state:
             self._enforcement_state[room_id] = {
-                "warnings": [],  # [(timestamp, watts), ...]
+                "warnings": [],  # [(epoch seconds, watts), ...] in append (time) order
                 "phase": 0,  # 0=normal, 1=volume escalation, 2=power cycling
                 "volume_offset": 0,  # Current volume increase (0-100)
                 "last_phase_change": None,
-                "kwh_alerts_sent": [],  # [5, 10, 15, ...]
+                "kwh_alerts_sent": set(),  # threshold keys announced today: {5.0, 10.0, ...}
             }
         return self._enforcement_state[room_id]
 
@@ -3057,31 +3235,26 @@ class ConfigManager:
         """Record a threshold warning with timestamp."""
         self._ensure_enforcement_state_for_today()
         state = self.get_enforcement_state(room_id)
-        now = dt_util.now()
-        state["warnings"].append((now.isoformat(), watts))
-        # Keep only warnings from the last hour
-        cutoff = (now - timedelta(hours=1)).isoformat()
-        state["warnings"] = [(ts, w) for ts, w in state["warnings"] if ts >= cutoff]
-        await self._async_save_enforcement_state()
+        now = time.time()
+        warnings = state["warnings"]
+        warnings.append((now, watts))
+        # Keep only warnings from the last hour; entries are time-ordered, so drop the prefix
+        del warnings[: bisect_left(warnings, now - 3600, key=_warning_ts)]
+        self._schedule_enforcement_state_save()
 
     def get_warnings_in_window(self, room_id: str, minutes: int) -> int:
         """Count warnings in the last N minutes."""
         state = self.get_enforcement_state(room_id)
-        now = dt_util.now()
-        cutoff = (now - timedelta(minutes=minutes)).isoformat()
-        return sum(1 for ts, _ in state["warnings"] if ts >= cutoff)
+        cutoff = time.time() - minutes * 60
+        warnings = state["warnings"]
+        return len(warnings) - bisect_left(warnings, cutoff, key=_warning_ts)
 
     def check_phase_reset(self, room_id: str, reset_minutes: int) -> bool:
         """Check if room has been below threshold long enough to reset phase."""
         state = self.get_enforcement_state(room_id)
         if not state["warnings"]:
             return True
-        last_warning_ts = max(ts for ts, _ in state["warnings"])
-        try:
-            last_warning = datetime.fromisoformat(last_warning_ts)
-            return (dt_util.now() - last_warning).total_seconds() >= (reset_minutes * 60)
-        except (ValueError, TypeError):
-            return False
+        return time.time() - state["warnings"][-1][0] >= reset_minutes * 60
 
     async def async_set_enforcement_phase(self, room_id: str, phase: int) -> None:
         """Set the enforcement phase for a room."""
@@ -3091,51 +3264,29 @@ class ConfigManager:
             state["last_phase_change"] = dt_util.now().isoformat()
             if phase == 0:
                 state["volume_offset"] = 0  # Reset volume on phase reset
-            await self._async_save_enforcement_state()
+            self._schedule_enforcement_state_save()
 
     async def async_increment_volume_offset(self, room_id: str, increment: int, max_offset: int = 100) -> int:
         """Increase volume offset for a room. Returns new offset."""
         state = self.get_enforcement_state(room_id)
         current = int(state.get("volume_offset", 0) or 0)
         state["volume_offset"] = min(max_offset, current + increment)
-        await self._async_save_enforcement_state()
+        self._schedule_enforcement_state_save()
         return state["volume_offset"]
 
     def get_room_day_kwh(self, room_id: str) -> float:
         """Get total kWh for a room today."""
         room_wh = 0.0
-        for room in self.energy_config.get("rooms", []):
-            rid = room.get("id", room["name"].lower().replace(" ", "_"))
-            if rid != room_id:
-                continue
-            for outlet in room.get("outlets", []):
-                if outlet.get("type") == "light":
-                    if outlet.get("power_source") == "sensor":
-                        pe = outlet.get("power_sensor_entity")
-                        if pe:
-                            room_wh += self._day_energy_data.get(pe, {}).get("energy", 0.0)
-                    else:
-                        key = f"light_{rid}_{(outlet.get('name') or 'light').lower().replace(' ', '_')}"
-                        room_wh += self._day_energy_data.get(key, {}).get("energy", 0.0)
-                elif outlet.get("type") in ("vent", "wall_heater"):
-                    if outlet.get("power_source") == "sensor":
-                        pe = outlet.get("power_sensor_entity")
-                        if pe:
-                            room_wh += self._day_energy_data.get(pe, {}).get("energy", 0.0)
-                    else:
-                        key = vent_like_energy_tracking_key(rid, outlet)
-                        room_wh += self._day_energy_data.get(key, {}).get("energy", 0.0)
-                else:
-                    for e in (outlet.get("plug1_entity"), outlet.get("plug2_entity")):
-                        if e:
-                            room_wh += self._day_energy_data.get(e, {}).get("energy", 0.0)
+        for rid, keys in self._room_energy_keys():
+            if rid == room_id:
+                room_wh += self._room_day_wh(keys)
         return room_wh / 1000.0
 
     def get_total_day_kwh(self) -> float:
         """Get total kWh for all rooms today."""
         total_kwh = 0.0
         for room in self.energy_config.get("rooms", []):
-            rid = room.get("id", room["name"].lower().replace(" ", "_"))
+            rid = room.get("id", _slugify(room["name"]))
             total_kwh += self.get_room_day_kwh(rid)
         return total_kwh
 
@@ -3154,13 +3305,11 @@ class ConfigManager:
         state = self.get_enforcement_state(room_id)
         room_kwh = self.get_room_day_kwh(room_id)
         sent = state["kwh_alerts_sent"]
-        sent_keys = {_room_kwh_alert_threshold_key(s) for s in sent}
         for interval in sorted(float(x) for x in intervals):
             ik = _room_kwh_alert_threshold_key(interval)
-            if room_kwh >= interval - 1e-9 and ik not in sent_keys:
-                sent.append(ik)
-                sent_keys.add(ik)
-                await self._async_save_enforcement_state()
+            if room_kwh >= interval - 1e-9 and ik not in sent:
+                sent.add(ik)
+                self._schedule_enforcement_state_save()
                 return ik
         return None
 
@@ -3171,68 +3320,91 @@ class ConfigManager:
             return False
         if self.get_total_day_kwh() >= limit:
             self._home_kwh_alert_sent = True
-            await self._async_save_enforcement_state()
+            self._schedule_enforcement_state_save()
             return True
         return False
 
     # Enforcement state persistence
-    async def _async_load_enforcement_state(self) -> None:
-        """Load enforcement state from file."""
-        path = self._data_path("enforcement_state.json")
-        try:
-            data = await self.hass.async_add_executor_job(_load_json_file, path)
-            if data is not None:
-                self._enforcement_reset_date = data.get("reset_date")
-                self._enforcement_state = data.get("rooms", {})
-                self._home_kwh_alert_sent = data.get("home_kwh_alert_sent", False)
-        except (json.JSONDecodeError, IOError):
-            pass
+    def _load_enforcement_state(self, data: dict | None) -> None:
+        """Apply the enforcement state read by async_load."""
+        if data is not None:
+            self._enforcement_reset_date = data.get("reset_date")
+            self._enforcement_state = data.get("rooms", {})
+            for state in self._enforcement_state.values():
+                if not isinstance(state, dict):
+                    continue
+                if state.get("warnings"):
+                    state["warnings"] = _epoch_warnings(state["warnings"])
+                # Stored as a sorted list; kept in memory as a set of threshold keys
+                state["kwh_alerts_sent"] = _kwh_alert_keys(state.get("kwh_alerts_sent"))
+            self._home_kwh_alert_sent = data.get("home_kwh_alert_sent", False)
         # Reset if new day
         self._ensure_enforcement_state_for_today()
 
-    async def _async_save_enforcement_state(self) -> None:
-        """Save enforcement state to file."""
-        path = self._data_path("enforcement_state.json")
-        payload = {
+    def _enforcement_state_payload(self) -> tuple[str, dict[str, Any]]:
+        """Return (path, data) for the enforcement state file."""
+        return self._data_path("enforcement_state.json"), {
             "reset_date": self._enforcement_reset_date,
             "rooms": self._enforcement_state,
             "home_kwh_alert_sent": self._home_kwh_alert_sent,
         }
+
+    async def _async_save_enforcement_state(self) -> None:
+        """Save enforcement state to file."""
         try:
-            await self.hass.async_add_executor_job(_write_json_file, path, payload)
+            await self._async_write_json_if_changed(*self._enforcement_state_payload())
         except IOError as err:
             _LOGGER.error("Error saving enforcement state: %s", err)
 
+    def _schedule_enforcement_state_save(self) -> None:
+        """Save enforcement state after a short delay, coalescing a burst of changes."""
+        if self._enforcement_save_handle is None:
+            self._enforcement_save_handle = self.hass.loop.call_later(
+                _ENFORCEMENT_SAVE_DELAY, self._flush_enforcement_state
+            )
+
+    @callback
+    def _flush_enforcement_state(self) -> None:
+        """Timer callback: write the enforcement state as it stands now."""
+        self._enforcement_save_handle = None
+        self.hass.async_create_task(self._async_save_enforcement_state())
+
+    def _cancel_enforcement_state_save(self) -> None:
+        """Cancel a pending debounced enforcement state save."""
+        if self._enforcement_save_handle is not None:
+            self._enforcement_save_handle.cancel()
+            self._enforcement_save_handle = None
+
     # Intraday history persistence
-    async def _async_load_intraday_history(self) -> None:
-        """Load intraday power history from file."""
-        path = self._data_path("intraday_history.json")
-        try:
-            data = await self.hass.async_add_executor_job(_load_json_file, path)
-            if data is not None:
-                saved_date = data.get("date")
-                today = dt_util.now().strftime("%Y-%m-%d")
-                # Only load if data is from today
-                if saved_date == today:
-                    self._intraday_history = data.get("history", {})
-                    self._intraday_last_minute = data.get("last_minute", "")
-                else:
-                    # Data is from a previous day, start fresh
-                    self._intraday_history = {}
-                    self._intraday_last_minute = ""
-        except (json.JSONDecodeError, IOError):
-            pass
+    def _load_intraday_history(self, data: dict | None) -> None:
+        """Apply the intraday power history read by async_load."""
+        if data is not None:
+            saved_date = data.get("date")
+            today = dt_util.now().strftime("%Y-%m-%d")
+            # Only load if data is from today
+            if saved_date == today:
+                self._intraday_history = {
+                    eid: deque(points, maxlen=_INTRADAY_MAX_POINTS)
+                    for eid, points in (data.get("history") or {}).items()
+                    if isinstance(points, list)
+                }
+                self._intraday_last_minute = data.get("last_minute", "")
+            else:
+                # Data is from a previous day, start fresh
+                self._intraday_history = {}
+                self._intraday_last_minute = ""
+
+    def _intraday_history_payload(self) -> tuple[str, dict[str, Any]]:
+        """Return (path, data) for the intraday history file."""
+        return self._data_path("intraday_history.json"), {
+            "date": self._today_str(),
+            "history": self._intraday_history,
+        }
 
     async def _async_save_intraday_history(self) -> None:
         """Save intraday power history to file."""
-        path = self._data_path("intraday_history.json")
-        today = dt_util.now().strftime("%Y-%m-%d")
-        payload = {
-            "date": today,
-            "history": self._intraday_history,
-        }
         try:
-            await self.hass.async_add_executor_job(_write_json_file, path, payload)
+            await self._async_write_json_if_changed(*self._intraday_history_payload())
         except IOError as err:
             _LOGGER.error("Error saving intraday history: %s", err)
 
@@ -16,6 +16,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from .config_manager import _slugify
+
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
@@ -58,6 +60,6 @@ def find_door_window_outlet_by_field(
 
 def announce_door_event_key(outlet: dict, room: dict) -> str:
     """Stable key for door/window event tracking (mirrors ``_door_window_key``)."""
-    room_id = room.get("id", room.get("name", "room").lower().replace(" ", "_"))
-    outlet_name = (outlet.get("name") or "device").lower().replace(" ", "_")
+    room_id = room.get("id", _slugify(room.get("name", "room")))
+    outlet_name = _slugify(outlet.get("name") or "device")
     return f"{room_id}_{outlet_name}"
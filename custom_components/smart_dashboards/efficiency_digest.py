@@ -1,7 +1,6 @@
 """Daily optional push digest of room efficiency scores (rooms with ``person.*`` assigned)."""
 from __future__ import annotations
 
-import json
 import logging
 import os
 import re
@@ -20,6 +19,8 @@ _LOGGER = logging.getLogger(__name__)
 
 STATE_FILE = "efficiency_digest_state.json"
 
+_HHMM_PATTERN = re.compile(r"^(\d{1,2}):(\d{2})$")
+
 PILLAR_KEYS = ("compliance", "warning", "consumption", "load", "engagement")
 
 PILLAR_LABELS: dict[str, str] = {
@@ -40,7 +41,7 @@ PILLAR_TIPS: dict[str, str] = {
 
 
 def _parse_digest_hhmm(s: str) -> tuple[int, int]:
-    m = re.match(r"^(\d{1,2}):(\d{2})$", str(s or "").strip())
+    m = _HHMM_PATTERN.match(str(s or "").strip())
     if not m:
         return 8, 0
     h, mi = int(m.group(1)), int(m.group(2))
@@ -50,13 +51,13 @@ def _parse_digest_hhmm(s: str) -> tuple[int, int]:
 
 
 def _load_digest_state(path: str) -> dict[str, Any]:
+    from .json_store import read_json
     if not os.path.exists(path):
         return {}
     try:
-        with open(path, encoding="utf-8") as f:
-            raw = json.load(f)
+        raw = read_json(path)
         return raw if isinstance(raw, dict) else {}
-    except (OSError, json.JSONDecodeError):
+    except (OSError, ValueError):
         return {}
 
 
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import os
 from collections import defaultdict, deque
@@ -74,6 +73,7 @@ from .config_manager import (
     ConfigManager,
     _coerce_bool,
     _normalize_presence_person_entity,
+    _slugify,
     resolve_budget_boost_weekdays,
     resolve_wall_heater_effective_temperatures,
 )
@@ -266,7 +266,7 @@ def person_in_room_presence_zones(
 
 def vent_like_energy_tracking_key(room_id: str, outlet: dict) -> str:
     """Match config_manager.vent_like_energy_tracking_key for static-watt vent/heater loads."""
-    name = (outlet.get("name") or "device").lower().replace(" ", "_")
+    name = _slugify(outlet.get("name") or "device")
     if outlet.get("type") == "wall_heater":
         return f"wall_heater_{room_id}_{name}"
     return f"ceiling_vent_{room_id}_{name}"
@@ -430,7 +430,7 @@ class EnergyMonitor:
             outlet = self._find_outlet_by_switch(room, entity_id)
             if not outlet:
                 continue
-            room_id = room.get("id", room["name"].lower().replace(" ", "_"))
+            room_id = room.get("id", _slugify(room["name"]))
             room_name = str(room.get("name") or room_id)
             outlet_name = str(outlet.get("name") or "Outlet")
             plug_slot = ""
@@ -451,7 +451,7 @@ class EnergyMonitor:
             outlet = self._find_outlet_by_switch(room, entity_id)
             if not outlet:
                 continue
-            room_id = room.get("id", room["name"].lower().replace(" ", "_"))
+            room_id = room.get("id", _slugify(room["name"]))
             room_name = str(room.get("name") or room_id)
             outlet_name = str(outlet.get("name") or "Outlet")
             outlet_type = str(outlet.get("type") or "outlet")
@@ -1445,10 +1445,10 @@ class EnergyMonitor:
         path = self._budget_boost_slots_path()
         try:
             def _read() -> dict | None:
+                from .json_store import read_json
                 if not os.path.isfile(path):
                     return None
-                with open(path, encoding="utf-8") as f:
-                    return json.load(f)
+                return read_json(path)
 
             data = await self.hass.async_add_executor_job(_read)
             if isinstance(data, dict):
@@ -1457,7 +1457,7 @@ class EnergyMonitor:
                     for k, v in data.items()
                     if isinstance(v, list)
                 }
-        except (OSError, json.JSONDecodeError, TypeError, ValueError) as err:
+        except (OSError, TypeError, ValueError) as err:
             _LOGGER.debug("Budget boost slots load skipped: %s", err)
 
     async def _async_save_budget_boost_slots(self) -> None:
@@ -1585,7 +1585,7 @@ class EnergyMonitor:
         """Collect all power entity IDs we track for daily energy."""
         entity_ids = []
         for room in self.config_manager.energy_config.get("rooms", []):
-            room_id = room.get("id", room["name"].lower().replace(" ", "_"))
+            room_id = room.get("id", _slugify(room["name"]))
             for outlet in room.get("outlets", []):
                 if outlet.get("type") == "light":
                     if outlet.get("power_source") == "sensor":
@@ -1621,11 +1621,11 @@ class EnergyMonitor:
         if not entity_id:
             return False
         s = str(entity_id).strip()
-        return s.startswith("switch.") or s.startswith("fan.")
+        return s.startswith(("switch.", "fan."))
 
     @staticmethod
     def _appliance_automation_key(room_id: str, outlet: dict) -> str:
-        slug = (outlet.get("name") or "device").lower().replace(" ", "_")
+        slug = _slugify(outlet.get("name") or "device")
         return f"{room_id}|{slug}"
 
     def _binary_presence_positive(self, entity_id: str | None) -> bool:
@@ -2891,7 +2891,7 @@ class EnergyMonitor:
         """Find a room by its ID."""
         rooms = self.config_manager.energy_config.get("rooms", [])
         for room in rooms:
-            rid = room.get("id", room["name"].lower().replace(" ", "_"))
+            rid = room.get("id", _slugify(room["name"]))
             if rid == room_id:
                 return room
         return None
@@ -3725,7 +3725,7 @@ class EnergyMonitor:
         return False
 
     async def _maybe_keep_on_switch(self, room: dict, switch_id: str) -> None:
-        room_id = room.get("id", room["name"].lower().replace(" ", "_"))
+        room_id = room.get("id", _slugify(room["name"]))
         if self._keep_on_suppressed(room, room_id, switch_id):
             return
         if self._switch_entity_is_on(switch_id):
@@ -3854,7 +3854,7 @@ class EnergyMonitor:
         devices that were auto-turned-off can still be restored when the person
         returns to zone.
         """
-        room_id = room.get("id", room["name"].lower().replace(" ", "_"))
+        room_id = room.get("id", _slugify(room["name"]))
         async with self._presence_room_lock(room_id):
             person_ent = room.get("presence_person_entity")
             zones = room.get("presence_zone_entities") or []
@@ -4029,7 +4029,7 @@ class EnergyMonitor:
             if person_in_room_presence_zones(self.hass, person_ent, zone_ids):
                 continue
 
-            room_id = room.get("id", room["name"].lower().replace(" ", "_"))
+            room_id = room.get("id", _slugify(room["name"]))
             pending = self._presence_auto_turned_off.setdefault(room_id, set())
 
             try:
@@ -4271,7 +4271,7 @@ class EnergyMonitor:
         await self._maybe_fire_budget_boost_scheduled(now, today, tts_settings)
 
         for room in rooms:
-            room_id = room.get("id", room["name"].lower().replace(" ", "_"))
+            room_id = room.get("id", _slugify(room["name"]))
             room_name = room["name"]
             room_threshold = room.get("threshold", 0)
             kwh_budget = float(room.get("kwh_budget", 5) or 5)
@@ -4402,7 +4402,7 @@ class EnergyMonitor:
                         if is_on:
                             if power_ent:
                                 outlet_total_watts = self._get_power_value(power_ent)
-                                await self.config_manager.async_add_energy_reading(
+                                self.config_manager.add_energy_reading(
                                     power_ent, outlet_total_watts, elapsed_seconds=1.0
                                 )
                                 self.config_manager.record_intraday_power(
@@ -4421,8 +4421,8 @@ class EnergyMonitor:
                                     )
                                     outlet_total_watts += w
                                 if outlet_total_watts > 0:
-                                    tracking_key = f"light_{room_id}_{(outlet.get('name') or 'light').lower().replace(' ', '_')}"
-                                    await self.config_manager.async_add_energy_reading(
+                                    tracking_key = f"light_{room_id}_{_slugify(outlet.get('name') or 'light')}"
+                                    self.config_manager.add_energy_reading(
                                         tracking_key, outlet_total_watts
                                     )
                                     self.config_manager.record_intraday_power(
@@ -4443,7 +4443,7 @@ class EnergyMonitor:
                     if power_ent:
                         # Power sensor mode: read sensor directly (sensor reports 0W when off)
                         outlet_total_watts = self._get_power_value(power_ent)
-                        await self.config_manager.async_add_energy_reading(
+                        self.config_manager.add_energy_reading(
                             power_ent, outlet_total_watts, elapsed_seconds=1.0
                         )
                         self.config_manager.record_intraday_power(
@@ -4458,7 +4458,7 @@ class EnergyMonitor:
                             tracking_key = vent_like_energy_tracking_key(
                                 room_id, outlet
                             )
-                            await self.config_manager.async_add_energy_reading(
+                            self.config_manager.add_energy_reading(
                                 tracking_key, outlet_total_watts
                             )
                             self.config_manager.record_intraday_power(
@@ -4490,7 +4490,7 @@ class EnergyMonitor:
                     w_pe = self._get_power_value(pe)
                     outlet_total_watts += w_pe
                     self.config_manager.record_intraday_power(pe, w_pe)
-                    await self.config_manager.async_add_energy_reading(pe, w_pe, elapsed_seconds=1.0)
+                    self.config_manager.add_energy_reading(pe, w_pe, elapsed_seconds=1.0)
 
                 plug1_watts = 0.0
                 if outlet.get("plug1_entity"):
@@ -4500,7 +4500,7 @@ class EnergyMonitor:
                         plug1_watts = self._get_power_value(outlet["plug1_entity"])
                         outlet_total_watts += plug1_watts
                         self.config_manager.record_intraday_power(outlet["plug1_entity"], plug1_watts)
-                        await self.config_manager.async_add_energy_reading(
+                        self.config_manager.add_energy_reading(
                             outlet["plug1_entity"], plug1_watts, elapsed_seconds=1.0
                         )
 
@@ -4529,7 +4529,7 @@ class EnergyMonitor:
                         plug2_watts = self._get_power_value(outlet["plug2_entity"])
                         outlet_total_watts += plug2_watts
                         self.config_manager.record_intraday_power(outlet["plug2_entity"], plug2_watts)
-                        await self.config_manager.async_add_energy_reading(
+                        self.config_manager.add_energy_reading(
                             outlet["plug2_entity"], plug2_watts, elapsed_seconds=1.0
                         )
 
@@ -4646,7 +4646,7 @@ class EnergyMonitor:
     def _get_room_by_id(self, room_id: str) -> dict | None:
         """Latest room dict from config (by id or slug from name)."""
         for r in self.config_manager.energy_config.get("rooms", []):
-            rid = r.get("id", r["name"].lower().replace(" ", "_"))
+            rid = r.get("id", _slugify(r["name"]))
             if rid == room_id:
                 return r
         return None
@@ -5836,7 +5836,7 @@ class EnergyMonitor:
         raw_kwh_intervals = pe.get("room_kwh_intervals", [5, 10, 15, 20])
 
         for room in rooms:
-            room_id = room.get("id", room["name"].lower().replace(" ", "_"))
+            room_id = room.get("id", _slugify(room["name"]))
             room_name = room.get("name", room_id)
             media_player = room.get("media_player")
             volume = float(room.get("volume", 0.7))
@@ -6086,7 +6086,7 @@ class EnergyMonitor:
         energy_config = self.config_manager.energy_config
         result = []
         for room in energy_config.get("rooms", []):
-            room_id = room.get("id", room["name"].lower().replace(" ", "_"))
+            room_id = room.get("id", _slugify(room["name"]))
             for outlet in room.get("outlets", []):
                 if outlet.get("type") == "stove":
                     result.append((room_id, outlet, room))
@@ -6806,8 +6806,8 @@ class EnergyMonitor:
 
     def _door_window_key(self, outlet: dict, room: dict) -> str:
         """Generate unique key for door/window state tracking."""
-        room_id = room.get("id", room.get("name", "room").lower().replace(" ", "_"))
-        outlet_name = (outlet.get("name") or "device").lower().replace(" ", "_")
+        room_id = room.get("id", _slugify(room.get("name", "room")))
+        outlet_name = _slugify(outlet.get("name") or "device")
         return f"{room_id}_{outlet_name}"
 
     def _prune_door_activity_entries(
@@ -7407,7 +7407,7 @@ class EnergyMonitor:
             return
         if not _normalize_presence_person_entity(room.get("presence_person_entity")):
             return
-        room_id = room.get("id", str(room.get("name") or "room").lower().replace(" ", "_"))
+        room_id = room.get("id", _slugify(str(room.get("name") or "room")))
         if not self.config_manager.is_room_enforcement_enabled(room_id):
             return
 
@@ -14,19 +14,40 @@ import os
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 _LOGGER = logging.getLogger(__name__)
 
 
+def _dumps(data: Any, indent: int) -> bytes:
+    """Serialize to JSON bytes; orjson when available (it only supports indent=2)."""
+    if orjson and indent == 2:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # e.g. ints beyond 64 bits; stdlib json handles these
+            pass
+    return json.dumps(data, indent=indent).encode("utf-8")
+
+
+def read_json(path: str | Path) -> Any:
+    """Parse JSON from path (orjson when available); raises OSError or ValueError."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
 def load_json(path: str | Path, *, default: Any = None) -> Any:
     """Load JSON from path, returning default if file missing or invalid."""
     path = Path(path)
     if not path.exists():
         return default() if callable(default) else (default if default is not None else {})
     try:
-        with open(path, encoding="utf-8") as f:
-            raw = json.load(f)
-        return raw
-    except (OSError, json.JSONDecodeError) as e:
+        return read_json(path)
+    except (OSError, ValueError) as e:
         _LOGGER.warning("JSON load failed %s: %s", path, e)
         return default() if callable(default) else (default if default is not None else {})
 
@@ -37,8 +58,9 @@ def atomic_save_json(path: str | Path, data: Any, *, indent: int = 2) -> bool:
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_suffix(path.suffix + ".tmp")
     try:
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=indent)
+        payload = _dumps(data, indent)
+        with open(tmp, "wb") as f:
+            f.write(payload)
         tmp.replace(path)
         return True
     except OSError as e:
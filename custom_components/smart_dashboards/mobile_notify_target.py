@@ -19,6 +19,8 @@ from .person_device_trackers import get_person_device_tracker_entity_ids
 
 _LOGGER = logging.getLogger(__name__)
 
+_WHITESPACE_RUN_PATTERN = re.compile(r"\s+")
+
 
 @dataclass
 class NotifyTarget:
@@ -127,7 +129,7 @@ def slugify_device_name_for_mobile_app(name: str) -> str:
     s = unicodedata.normalize("NFKD", str(name))
     s = "".join(ch for ch in s if ch.isalnum() or ch.isspace())
     s = s.strip().lower()
-    return re.sub(r"\s+", "_", s).strip("_")
+    return _WHITESPACE_RUN_PATTERN.sub("_", s).strip("_")
 
 
 def _notify_slug_registered(hass: HomeAssistant, slug: str) -> bool:
@@ -1,7 +1,6 @@
 """Per-room efficiency ratings persisted under ``config/data``; hourly recompute + engagement heartbeats."""
 from __future__ import annotations
 
-import json
 import logging
 import re
 import threading
@@ -12,7 +11,9 @@ from typing import Any
 from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
 
+from .config_manager import _slugify
 from .const import DEFAULT_CONFIG
+from .json_store import atomic_save_json, read_json
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,6 +30,8 @@ PILLAR_KEYS = ("compliance", "warning", "consumption", "load", "engagement")
 
 _PERSON_DOMAIN = "person"
 
+_WHITESPACE_RUN_PATTERN = re.compile(r"\s+")
+
 
 def engagement_user_key_from_person(hass: HomeAssistant, person_entity_id: str) -> str | None:
     """Map ``person.*`` to the HA auth user id string used in ``engagement_visits`` keys.
@@ -139,7 +142,7 @@ def canonical_room_id(room: dict[str, Any]) -> str:
     if isinstance(raw_id, str) and raw_id.strip():
         return raw_id.strip()
     name = str(room.get("name") or "")
-    return re.sub(r"\s+", "_", name.strip().lower())
+    return _WHITESPACE_RUN_PATTERN.sub("_", name.strip().lower())
 
 
 def legacy_room_id_history(room: dict[str, Any]) -> str:
@@ -147,8 +150,7 @@ def legacy_room_id_history(room: dict[str, Any]) -> str:
     raw_id = room.get("id")
     if isinstance(raw_id, str) and raw_id.strip():
         return raw_id.strip()
-    name = str(room.get("name") or "room")
-    return name.lower().replace(" ", "_")
+    return _slugify(str(room.get("name") or "room"))
 
 
 def _room_history_row(
@@ -185,8 +187,7 @@ def load_ratings(path: Path) -> dict[str, Any]:
     if not path.exists():
         return default_store()
     try:
-        with open(path, encoding="utf-8") as f:
-            raw = json.load(f)
+        raw = read_json(path)
         if not isinstance(raw, dict):
             return default_store()
         raw.setdefault("version", SCHEMA_VERSION)
@@ -195,24 +196,13 @@ def load_ratings(path: Path) -> dict[str, Any]:
         if not isinstance(raw.get("rooms"), dict):
             raw["rooms"] = {}
         return raw
-    except (OSError, json.JSONDecodeError) as e:
+    except (OSError, ValueError) as e:
         _LOGGER.warning("Room ratings load failed %s: %s", path, e)
         return default_store()
 
 
 def save_ratings(path: Path, data: dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    try:
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-        tmp.replace(path)
-    except OSError as e:
-        _LOGGER.warning("Room ratings save failed %s: %s", path, e)
-        try:
-            tmp.unlink(missing_ok=True)
-        except OSError:
-            pass
+    atomic_save_json(path, data)
 
 
 def _merge_engagement_visits(ours: dict, theirs: dict) -> dict:
@@ -3,7 +3,6 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from copy import deepcopy
 from functools import partial
 import time
 from datetime import date, datetime, timedelta
@@ -19,6 +18,7 @@ from homeassistant.util import dt as dt_util
 
 from .config_manager import (
     _normalize_room_budget_boost_weekdays,
+    _slugify,
     outdoor_temperature_from_entity,
     resolve_wall_heater_effective_temperatures,
     vent_like_energy_tracking_key,
@@ -211,7 +211,7 @@ def _attach_wall_heater_dashboard_fields(
     outlet_data["heater_preheat_minutes"] = outlet.get("heater_preheat_minutes", 30)
     outlet_data["heater_door_sensor_entity"] = outlet.get("heater_door_sensor_entity")
     outlet_data["heater_window_sensor_entity"] = outlet.get("heater_window_sensor_entity")
-    slug = (outlet.get("name") or "device").lower().replace(" ", "_")
+    slug = _slugify(outlet.get("name") or "device")
     key = f"{room_id}|{slug}"
     if energy_monitor and hasattr(energy_monitor, "_heater_automation_state"):
         st = energy_monitor._heater_automation_state.get(key) or {}
@@ -544,7 +544,7 @@ def build_rooms_payload_for_power_and_ratings(
     rooms_out: list[dict[str, Any]] = []
 
     for room in config_manager.energy_config.get("rooms", []):
-        room_id = room.get("id", room["name"].lower().replace(" ", "_"))
+        room_id = room.get("id", _slugify(room["name"]))
         room_data = {
             "id": room_id,
             "name": room["name"],
@@ -584,7 +584,7 @@ def build_rooms_payload_for_power_and_ratings(
                         )
                     else:
                         light_ents = outlet.get("light_entities") or []
-                        tracking_key = f"light_{room_id}_{(outlet.get('name') or 'light').lower().replace(' ', '_')}"
+                        tracking_key = f"light_{room_id}_{_slugify(outlet.get('name') or 'light')}"
                         configured_w = 0.0
                         for le in light_ents:
                             if isinstance(le, dict) and le.get("entity_id", "").startswith(
@@ -845,7 +845,7 @@ async def websocket_get_intraday_history(
 
         current_watts = 0.0
         for room in config_manager.energy_config.get("rooms", []):
-            rid = room.get("id", room["name"].lower().replace(" ", "_"))
+            rid = room.get("id", _slugify(room["name"]))
             if room_id and rid != room_id:
                 continue
             for outlet in room.get("outlets", []):
@@ -964,7 +964,7 @@ def _room_and_outlet_by_index(
 ) -> tuple[dict[str, Any], dict[str, Any]] | None:
     """Return (room dict, outlet dict) for a room id and outlet index, or None."""
     for room in config_manager.energy_config.get("rooms", []):
-        rid = room.get("id", room["name"].lower().replace(" ", "_"))
+        rid = room.get("id", _slugify(room["name"]))
         if rid != room_id:
             continue
         outs = room.get("outlets") or []
@@ -1280,7 +1280,7 @@ def _collect_statistics_energy_sources(
     switch_specs: list[dict[str, Any]] = []
 
     for room in config_manager.energy_config.get("rooms", []):
-        room_id = room.get("id", room["name"].lower().replace(" ", "_"))
+        room_id = room.get("id", _slugify(room["name"]))
         for outlet in room.get("outlets", []):
             otype = outlet.get("type", "outlet")
             if otype == "light":
@@ -1918,7 +1918,7 @@ async def async_build_billing_daily_history_from_recorder(
     """
     today = dt_util.now().strftime("%Y-%m-%d")
     all_room_ids = [
-        r.get("id", r["name"].lower().replace(" ", "_"))
+        r.get("id", _slugify(r["name"]))
         for r in config_manager.energy_config.get("rooms", [])
     ]
     result: dict[str, Any] = {
@@ -2269,7 +2269,7 @@ async def async_build_statistics_payload(
 
     # Build all_room_ids to match billing logic (ensures we iterate all rooms)
     all_room_ids = [
-        r.get("id", r["name"].lower().replace(" ", "_"))
+        r.get("id", _slugify(r["name"]))
         for r in config_manager.energy_config.get("rooms", [])
     ]
 
@@ -2396,7 +2396,7 @@ async def async_build_statistics_payload(
 
     rooms_config = config_manager.energy_config.get("rooms", [])
     for room in rooms_config:
-        rid = room.get("id", room["name"].lower().replace(" ", "_"))
+        rid = room.get("id", _slugify(room["name"]))
         name = room.get("name", rid)
         rsum = room_sums.get(
             rid,
@@ -2753,7 +2753,9 @@ async def websocket_verify_passcode(
     stored_passcode = str(
         hass.data[DOMAIN].get("options", {}).get("settings_passcode", "0000")
     )
-    entered_passcode = str(msg.get("passcode", ""))
+    # Cap oversized input before any per-character work; compare as bytes since
+    # compare_digest rejects non-ASCII str.
+    entered_passcode = str(msg.get("passcode", ""))[:16]
 
     # Per-connection rate limiting state.
     state = getattr(connection, "_smart_dashboards_passcode_state", None)
@@ -2771,7 +2773,7 @@ async def websocket_verify_passcode(
         connection.send_error(msg["id"], "rate_limited", "Too many attempts. Try again later.")
         return
 
-    if hmac.compare_digest(entered_passcode, stored_passcode):
+    if hmac.compare_digest(entered_passcode.encode(), stored_passcode.encode()):
         state["fails"].clear()
         state["locked_until"] = 0.0
         connection.send_result(msg["id"], {"valid": True})
@@ -2975,15 +2977,21 @@ async def websocket_set_room_budget_boost_days(
                 )
                 return
 
-    energy = deepcopy(dict(config_manager.energy_config))
+    # Copy only the path being edited; async_update_energy rebuilds everything else
+    energy = dict(config_manager.energy_config)
+    rooms = list(energy.get("rooms", []))
+    energy["rooms"] = rooms
     updated = False
     target_rid = room.get("id")
-    for r in energy.get("rooms", []):
+    for i, r in enumerate(rooms):
         if r.get("id") == target_rid:
-            r["room_budget_boost_weekdays"] = new_days
-            r["room_budget_boost_weekdays_changed_at"] = (
-                dt_util.utcnow().replace(microsecond=0).isoformat()
-            )
+            rooms[i] = {
+                **r,
+                "room_budget_boost_weekdays": new_days,
+                "room_budget_boost_weekdays_changed_at": (
+                    dt_util.utcnow().replace(microsecond=0).isoformat()
+                ),
+            }
             updated = True
             break
     if not updated:
@@ -3675,7 +3683,7 @@ async def websocket_hard_refresh_statistics(
     # Build room name lookup for detailed logging
     room_names: dict[str, str] = {}
     for room in config_manager.energy_config.get("rooms", []):
-        rid = room.get("id", room["name"].lower().replace(" ", "_"))
+        rid = room.get("id", _slugify(room["name"]))
         room_names[rid] = room.get("name", rid)
 
     try:
@@ -1,7 +1,6 @@
 """Persistent zone-health snapshot store under Home Assistant config ``data/``."""
 from __future__ import annotations
 
-import json
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -10,6 +9,8 @@ from typing import Any
 from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
 
+from .json_store import atomic_save_json, read_json
+
 _LOGGER = logging.getLogger(__name__)
 
 SCHEMA_VERSION = 1
@@ -29,32 +30,20 @@ def load_store(path: Path) -> dict[str, Any]:
     if not path.exists():
         return default_store()
     try:
-        with open(path, encoding="utf-8") as f:
-            raw = json.load(f)
+        raw = read_json(path)
         if not isinstance(raw, dict):
             return default_store()
         if not isinstance(raw.get("persons"), dict):
             raw["persons"] = {}
         raw.setdefault("version", SCHEMA_VERSION)
         return raw
-    except (OSError, json.JSONDecodeError) as e:
+    except (OSError, ValueError) as e:
         _LOGGER.warning("Zone health store load failed %s: %s", path, e)
         return default_store()
 
 
 def save_store(path: Path, data: dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    try:
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-        tmp.replace(path)
-    except OSError as e:
-        _LOGGER.warning("Zone health store save failed %s: %s", path, e)
-        try:
-            tmp.unlink(missing_ok=True)
-        except OSError:
-            pass
+    atomic_save_json(path, data)
 
 
 def ensure_person_entry(